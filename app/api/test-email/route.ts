@@ -1,13 +1,14 @@
 import { type NextRequest, NextResponse } from "next/server"
-import { Resend } from "resend"
+import { getEmailTransport } from "@/lib/email-transport"
 
-// Initialize Resend only if API key exists (prevents build errors)
-const resend = process.env.RESEND_API_KEY ? new Resend(process.env.RESEND_API_KEY) : null
+// Resend, in-memory or local HTTP stand-in depending on EMAIL_TRANSPORT.
+// Null when Resend is selected without an API key (prevents build errors)
+const transport = getEmailTransport()
 
 export async function POST(request: NextRequest) {
   try {
-    // Check if Resend is configured
-    if (!resend || !process.env.RESEND_API_KEY) {
+    // Check if an email transport is configured
+    if (!transport) {
       return NextResponse.json(
         { 
           error: "RESEND_API_KEY not configured",
@@ -18,7 +19,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Send a test email
-    const result = await resend.emails.send({
+    const result = await transport.send({
       from: "Portfolio Test <onboarding@resend.dev>",
       to: "harshabasaheb1@gmail.com",
       subject: "🧪 Portfolio Contact Form Test",
@@ -1,43 +1,22 @@
-"use client"
-
-import { useState, useEffect } from "react"
-import MagicBento from "@/components/magic-bento"
+// Server-rendered shell: the static content is plain HTML, and each heavy
+// interactive component is a client island from components/islands.tsx that
+// loads when scrolled near (or, for the background effects, when idle).
 import ScrollReveal from "@/components/scroll-reveal"
 import TypingAnimation from "@/components/typing-animation"
 import DecryptedText from "@/components/decrypted-text"
-import { Github, Linkedin, Mail, MapPin, Download, Phone } from "lucide-react"
-import Dock from "@/components/dock"
-import DotGrid from "@/components/dot-grid"
-import { VscHome, VscAccount, VscMail, VscCode, VscTools, VscGithub } from "react-icons/vsc"
-import ContactForm from "@/components/contact-form"
+import HeroActions from "@/components/hero-actions"
 import ProjectShowcase from "@/components/project-showcase"
-import TargetCursor from "@/components/target-cursor"
+import { Github, Linkedin, Mail, MapPin, Phone } from "lucide-react"
+import {
+  BentoIsland,
+  ContactFormIsland,
+  DockIsland,
+  DotGridIsland,
+  PerfMonitor,
+  TargetCursorIsland,
+} from "@/components/islands"
 
 export default function Portfolio() {
-  const [mounted, setMounted] = useState(false)
-  const [resumeAvailable, setResumeAvailable] = useState<boolean | null>(null)
-
-  useEffect(() => {
-    setMounted(true)
-
-    // Check resume availability once on mount (cache the result)
-    fetch('/resume/CV_Harsh_Chavan.pdf', { method: 'HEAD' })
-      .then(response => setResumeAvailable(response.ok))
-      .catch(() => setResumeAvailable(false))
-  }, [])
-
-  // Return a loading state instead of null to avoid hydration issues
-  if (!mounted) {
-    return (
-      <div className="min-h-screen bg-black text-white flex items-center justify-center">
-        <div className="text-center">
-          <div className="animate-spin rounded-full h-12 w-12 border-b-2 border-purple-500 mx-auto mb-4"></div>
-          <p className="text-gray-400">Loading...</p>
-        </div>
-      </div>
-    )
-  }
-
   // Typing animation texts
   const typingTexts = [
     "Full Stack Developer",
@@ -165,86 +144,19 @@ export default function Portfolio() {
     },
   ]
 
-  // Smooth scroll function with proper error handling
-  const scrollToSection = (sectionId: string) => {
-    try {
-      const element = document.getElementById(sectionId)
-      if (element) {
-        element.scrollIntoView({ behavior: "smooth", block: "start" })
-      } else {
-        console.warn(`Element with id "${sectionId}" not found`)
-      }
-    } catch (error) {
-      console.error("Error scrolling to section:", error)
-    }
-  }
-
-  // Optimized resume download with cached availability check
-  const downloadResume = () => {
-    try {
-      // Check cached availability state
-      if (resumeAvailable === false) {
-        alert("Resume file is not available. Please contact me directly at harshabasaheb1@gmail.com")
-        return
-      }
-
-      // Create and trigger download
-      const link = document.createElement("a")
-      link.href = "/resume/CV_Harsh_Chavan.pdf"
-      link.download = "CV_Harsh_Chavan.pdf"
-      link.target = "_blank"
-      link.click()
-    } catch (error) {
-      console.error("Error downloading resume:", error)
-      alert("Unable to download resume. Please contact me directly at harshabasaheb1@gmail.com")
-    }
-  }
-
-  // Dock items configuration
-  const dockItems = [
-    {
-      icon: <VscHome size={18} />,
-      label: "Home",
-      onClick: () => scrollToSection("hero"),
-    },
-    {
-      icon: <VscAccount size={18} />,
-      label: "About",
-      onClick: () => scrollToSection("about"),
-    },
-    {
-      icon: <VscTools size={18} />,
-      label: "Skills",
-      onClick: () => scrollToSection("skills"),
-    },
-    {
-      icon: <VscCode size={18} />,
-      label: "Projects",
-      onClick: () => scrollToSection("projects"),
-    },
-    {
-      icon: <VscMail size={18} />,
-      label: "Contact",
-      onClick: () => scrollToSection("contact"),
-    },
-    {
-      icon: <VscGithub size={18} />,
-      label: "GitHub",
-      onClick: () => window.open("https://github.com/Xyerophyte", "_blank"),
-    },
-  ]
-
   return (
-    <div className="min-h-screen bg-black text-white relative">
+    <div className="min-h-screen bg-black text-white relative" data-testid="portfolio">
+      <PerfMonitor />
+
       {/* Target Cursor */}
-      <TargetCursor 
+      <TargetCursorIsland
         spinDuration={2}
         hideDefaultCursor={true}
         targetSelector=".cursor-target"
       />
       
       {/* Interactive Dot Grid Background */}
-      <DotGrid
+      <DotGridIsland
         dotSize={4}
         gap={25}
         baseColor="#1a1a2e"
@@ -254,6 +166,7 @@ export default function Portfolio() {
         shockStrength={3}
         resistance={750}
         returnDuration={1.5}
+        backend="worker"
         className="fixed inset-0"
       />
 
@@ -290,21 +203,7 @@ export default function Portfolio() {
                   </p>
                 </ScrollReveal>
                 <ScrollReveal direction="up" delay={0.6} duration={0.6}>
-                  <div className="flex flex-col sm:flex-row items-center justify-center gap-4">
-                    <button
-                      onClick={() => scrollToSection("contact")}
-                      className="cursor-target bg-gradient-to-r from-purple-500 to-pink-500 hover:from-purple-600 hover:to-pink-600 px-8 py-3 rounded-full font-semibold transition-all duration-300 transform hover:scale-105"
-                    >
-                      Get In Touch
-                    </button>
-                    <button
-                      onClick={downloadResume}
-                      className="cursor-target border border-purple-500/30 hover:border-purple-500 px-8 py-3 rounded-full font-semibold transition-all duration-300 flex items-center gap-2"
-                    >
-                      <Download size={16} />
-                      Download Resume
-                    </button>
-                  </div>
+                  <HeroActions />
                 </ScrollReveal>
               </div>
             </ScrollReveal>
@@ -332,8 +231,9 @@ export default function Portfolio() {
             </div>
           </ScrollReveal>
           <ScrollReveal direction="up" delay={0.2} duration={1} threshold={0.2}>
-            <MagicBento
+            <BentoIsland
               cardData={portfolioCards}
+              testIdPrefix="about"
               enableStars={true}
               enableSpotlight={true}
               enableBorderGlow={true}
@@ -358,8 +258,9 @@ export default function Portfolio() {
             </div>
           </ScrollReveal>
           <ScrollReveal direction="up" delay={0.2} duration={1}>
-            <MagicBento
+            <BentoIsland
               cardData={skillsCards}
+              testIdPrefix="skills"
               enableStars={true}
               enableSpotlight={true}
               enableBorderGlow={true}
@@ -408,7 +309,7 @@ export default function Portfolio() {
                 {/* Contact Form */}
                 <div>
                   <h3 className="text-2xl font-semibold mb-6">Send me a message</h3>
-                  <ContactForm />
+                  <ContactFormIsland />
                 </div>
 
                 {/* Contact Info */}
@@ -490,7 +391,7 @@ export default function Portfolio() {
 
 
       {/* Dock Navigation */}
-      <Dock items={dockItems} panelHeight={68} baseItemSize={50} magnification={70} distance={150} />
+      <DockIsland />
     </div>
   )
 }
@@ -132,7 +132,7 @@ export default function ContactForm() {
 
   return (
     <div className="max-w-2xl mx-auto">
-      <form onSubmit={handleSubmit} className="space-y-6">
+      <form onSubmit={handleSubmit} className="space-y-6" data-testid="contact-form">
         <div className="grid md:grid-cols-2 gap-6">
           <div>
             <label htmlFor="name" className="block text-sm font-medium text-gray-300 mb-2">
@@ -142,6 +142,7 @@ export default function ContactForm() {
               type="text"
               id="name"
               name="name"
+              data-testid="contact-name"
               required
               value={formData.name}
               onChange={handleChange}
@@ -157,6 +158,7 @@ export default function ContactForm() {
               type="email"
               id="email"
               name="email"
+              data-testid="contact-email"
               required
               value={formData.email}
               onChange={handleChange}
@@ -174,6 +176,7 @@ export default function ContactForm() {
             type="text"
             id="subject"
             name="subject"
+            data-testid="contact-subject"
             required
             value={formData.subject}
             onChange={handleChange}
@@ -189,6 +192,7 @@ export default function ContactForm() {
           <textarea
             id="message"
             name="message"
+            data-testid="contact-message"
             required
             rows={6}
             value={formData.message}
@@ -200,6 +204,8 @@ export default function ContactForm() {
 
         {status.message && (
           <div
+            data-testid="contact-status"
+            data-status={status.type}
             className={`flex items-center gap-2 p-4 rounded-lg ${
               status.type === "success"
                 ? "bg-green-900/20 border border-green-500/30 text-green-400"
@@ -216,6 +222,7 @@ export default function ContactForm() {
 
         <button
           type="submit"
+          data-testid="contact-submit"
           disabled={status.type === "loading"}
           className="cursor-target w-full bg-gradient-to-r from-purple-500 to-pink-500 hover:from-purple-600 hover:to-pink-600 disabled:from-gray-600 disabled:to-gray-600 px-8 py-4 rounded-lg font-semibold transition-all duration-300 transform hover:scale-[1.02] disabled:scale-100 disabled:cursor-not-allowed flex items-center justify-center gap-2"
         >
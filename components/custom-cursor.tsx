@@ -1,17 +1,13 @@
 "use client"
 
-import { useEffect, useRef, useState, useCallback } from "react"
+import { useEffect, useRef, useState } from "react"
 import { gsap } from "gsap"
+import { mountCursor, type CursorRendererFactory } from "@/lib/cursor-renderer"
+import { ParticlePool } from "@/lib/particle-pool"
+import { countTween } from "@/lib/perf-monitor"
+import type { PointerState } from "@/lib/pointer-tracker"
 import "./custom-cursor.css"
 
-interface CursorTrail {
-  x: number
-  y: number
-  element: HTMLDivElement
-  life: number
-  delay: number
-}
-
 interface CursorParticle {
   x: number
   y: number
@@ -28,146 +24,68 @@ interface TrailPoint {
   timestamp: number
 }
 
-export default function CustomCursor() {
-  const cursorRef = useRef<HTMLDivElement>(null)
-  const trailsRef = useRef<CursorTrail[]>([])
-  const particlesRef = useRef<CursorParticle[]>([])
-  const mouseRef = useRef({ x: 0, y: 0 })
-  const trailPointsRef = useRef<TrailPoint[]>([])
-  const [isClicking, setIsClicking] = useState(false)
-  const [isHovering, setIsHovering] = useState(false)
-  const animationFrameRef = useRef<number>()
-  const lastParticleTime = useRef(0)
-
-  // Check if device supports hover (not touch device)
-  const [supportsHover, setSupportsHover] = useState(true)
-
-  useEffect(() => {
-    const checkHoverSupport = () => {
-      setSupportsHover(window.matchMedia("(hover: hover) and (pointer: fine)").matches)
-    }
+const TRAIL_MAX_AGE = 500
+const MAX_TRAIL_POINTS = 20
+const MAX_PARTICLES = 25
+const PARTICLE_INTERVAL = 12
+const INTERACTIVE_SELECTOR = "button, a, .cursor-pointer"
 
-    checkHoverSupport()
-    window.addEventListener("resize", checkHoverSupport)
+// osu-style glowing dot with a fading trail, and sparks while a button is held.
+// The trail and particle elements are created once and moved by transform.
+export const createTrailCursor: CursorRendererFactory<void> = (cursor) => {
+  document.body.classList.add("cursor-hidden")
 
-    return () => window.removeEventListener("resize", checkHoverSupport)
-  }, [])
+  const moveX = gsap.quickTo(cursor, "x", { duration: 0.08, ease: "power2.out" })
+  const moveY = gsap.quickTo(cursor, "y", { duration: 0.08, ease: "power2.out" })
 
-  // Create trail element with osu-style positioning
-  const createTrail = (x: number, y: number, delay: number): CursorTrail => {
+  const trails = Array.from({ length: MAX_TRAIL_POINTS }, (_, index) => {
     const trail = document.createElement("div")
     trail.className = "cursor-trail"
-    trail.style.left = `${x - 6}px`
-    trail.style.top = `${y - 6}px`
-    trail.style.opacity = "0"
+    trail.style.cssText = `left: 0; top: 0; opacity: 0; z-index: ${9998 - index};`
     document.body.appendChild(trail)
-
-    // Animate in with delay
-    gsap.to(trail, {
-      opacity: 0.8,
-      duration: 0.1,
-      delay: delay * 0.02,
-      ease: "power2.out",
-    })
-
-    return {
-      x,
-      y,
-      element: trail,
-      life: 1,
-      delay,
-    }
-  }
-
-  // Create particle element
-  const createParticle = (x: number, y: number): CursorParticle => {
-    const particle = document.createElement("div")
-    particle.className = "cursor-particle"
-    particle.style.left = `${x - 2}px`
-    particle.style.top = `${y - 2}px`
-    document.body.appendChild(particle)
+    return trail
+  })
+  let trailPoints: TrailPoint[] = []
+
+  const pool = new ParticlePool(MAX_PARTICLES, "cursor-particle")
+  const particleElements = new Set<HTMLDivElement>()
+  let particles: CursorParticle[] = []
+  let lastParticleTime = 0
+
+  const spawnParticle = (x: number, y: number) => {
+    const element = pool.acquire(document.body)
+    if (!element) return
+    element.style.left = "0"
+    element.style.top = "0"
+    particleElements.add(element)
 
     const angle = Math.random() * Math.PI * 2
     const speed = Math.random() * 4 + 2
-
-    return {
-      x,
-      y,
-      vx: Math.cos(angle) * speed,
-      vy: Math.sin(angle) * speed,
-      element: particle,
-      life: 1,
-      maxLife: Math.random() * 80 + 40, // 40-120 frames
-    }
+    const maxLife = Math.random() * 80 + 40 // 40-120 frames
+    particles.push({ x, y, vx: Math.cos(angle) * speed, vy: Math.sin(angle) * speed, element, life: maxLife, maxLife })
   }
 
-  // Update osu-style trails with proper cleanup
-  const updateTrails = useCallback(() => {
-    const now = Date.now()
+  // Trail points fade over TRAIL_MAX_AGE, shrinking and dimming towards the tail
+  const updateTrails = (now: number) => {
+    trailPoints = trailPoints.filter((point) => now - point.timestamp < TRAIL_MAX_AGE)
 
-    // Remove old trail points (older than 500ms)
-    trailPointsRef.current = trailPointsRef.current.filter((point) => now - point.timestamp < 500)
-
-    // Clear existing trails with proper DOM cleanup
-    trailsRef.current.forEach((trail) => {
-      if (trail.element?.parentNode) {
-        trail.element.parentNode.removeChild(trail.element)
+    trails.forEach((trail, index) => {
+      const point = trailPoints[trailPoints.length - trails.length + index]
+      if (!point) {
+        trail.style.opacity = "0"
+        return
       }
+      const life = Math.max(0, 1 - (now - point.timestamp) / TRAIL_MAX_AGE)
+      const sizeMultiplier = 0.3 + life * 0.7 // 0.3 to 1.0
+      const trailIndex = trails.length - index - 1
+      const positionOpacity = Math.max(0.1, 1 - trailIndex * 0.08) // Fade based on position
+      trail.style.transform = `translate3d(${point.x - 6}px, ${point.y - 6}px, 0) scale(${sizeMultiplier})`
+      trail.style.opacity = `${life * positionOpacity}`
     })
-    trailsRef.current = []
-
-    // Limit trail points to prevent unbounded growth
-    const MAX_TRAIL_POINTS = 20
-    const pointsToRender = trailPointsRef.current.slice(-MAX_TRAIL_POINTS)
-
-    // Create new trails based on trail points
-    pointsToRender.forEach((point, index) => {
-      const age = now - point.timestamp
-      const maxAge = 500
-      const life = Math.max(0, 1 - age / maxAge)
-
-      if (life > 0) {
-        const trail = document.createElement("div")
-        trail.className = "cursor-trail"
-
-        // Calculate size and opacity based on age and position in trail
-        const sizeMultiplier = 0.3 + life * 0.7 // 0.3 to 1.0
-        const opacityMultiplier = life * 0.6 // Fade out over time
-        const trailIndex = pointsToRender.length - index - 1
-        const positionOpacity = Math.max(0.1, 1 - trailIndex * 0.08) // Fade based on position
-
-        trail.style.cssText = `
-          position: fixed;
-          left: ${point.x - 6 * sizeMultiplier}px;
-          top: ${point.y - 6 * sizeMultiplier}px;
-          width: ${12 * sizeMultiplier}px;
-          height: ${12 * sizeMultiplier}px;
-          background: radial-gradient(circle,
-            rgba(132, 0, 255, ${0.8 * opacityMultiplier * positionOpacity}) 0%,
-            rgba(255, 0, 150, ${0.6 * opacityMultiplier * positionOpacity}) 50%,
-            transparent 70%);
-          border-radius: 50%;
-          pointer-events: none;
-          z-index: ${9998 - index};
-          mix-blend-mode: screen;
-          box-shadow: 0 0 ${8 * sizeMultiplier}px rgba(132, 0, 255, ${0.3 * opacityMultiplier * positionOpacity});
-        `
-
-        document.body.appendChild(trail)
-        trailsRef.current.push({
-          x: point.x,
-          y: point.y,
-          element: trail,
-          life,
-          delay: index,
-        })
-      }
-    })
-  }, [])
+  }
 
-  // Update particles with proper cleanup
-  const updateParticles = useCallback(() => {
-    particlesRef.current = particlesRef.current.filter((particle) => {
+  const updateParticles = () => {
+    particles = particles.filter((particle) => {
       particle.x += particle.vx
       particle.y += particle.vy
       particle.vx *= 0.97 // Friction
@@ -176,160 +94,80 @@ export default function CustomCursor() {
       particle.life -= 1
 
       if (particle.life <= 0) {
-        if (particle.element?.parentNode) {
-          particle.element.parentNode.removeChild(particle.element)
-        }
+        pool.release(particle.element)
         return false
       }
 
       const opacity = particle.life / particle.maxLife
-      gsap.set(particle.element, {
-        x: particle.x - 2,
-        y: particle.y - 2,
-        opacity: opacity * 0.7,
-        scale: opacity * 0.8 + 0.2,
-      })
-
+      particle.element.style.transform = `translate3d(${particle.x - 2}px, ${particle.y - 2}px, 0) scale(${opacity * 0.8 + 0.2})`
+      particle.element.style.opacity = `${opacity * 0.7}`
       return true
     })
-  }, [])
-
-  // Animation loop
-  const animate = useCallback(() => {
-    const now = Date.now()
-
-    // Add particles when clicking (limit to 25 particles max)
-    if (isClicking && now - lastParticleTime.current > 12) {
-      if (particlesRef.current.length < 25) {
-        const particle = createParticle(
-          mouseRef.current.x + (Math.random() - 0.5) * 15,
-          mouseRef.current.y + (Math.random() - 0.5) * 15,
-        )
-        particlesRef.current.push(particle)
-      }
-      lastParticleTime.current = now
-    }
-
-    updateTrails()
-    updateParticles()
-
-    animationFrameRef.current = requestAnimationFrame(animate)
-  }, [isClicking, updateTrails, updateParticles])
-
-  useEffect(() => {
-    if (!supportsHover) return
-
-    // Add cursor-hidden class to body
-    document.body.classList.add("cursor-hidden")
+  }
 
-    const handleMouseMove = (e: MouseEvent) => {
-      const newPos = { x: e.clientX, y: e.clientY }
-      mouseRef.current = newPos
+  return {
+    frame(pointer: PointerState) {
+      const now = pointer.time
 
-      // Add point to trail with timestamp
-      trailPointsRef.current.push({
-        x: e.clientX,
-        y: e.clientY,
-        timestamp: Date.now(),
-      })
+      if (pointer.moved) {
+        countTween("custom-cursor")
+        moveX(pointer.x - 10)
+        moveY(pointer.y - 10)
+        trailPoints.push({ x: pointer.x, y: pointer.y, timestamp: now })
+        if (trailPoints.length > MAX_TRAIL_POINTS) trailPoints.shift()
 
-      // Limit trail points to prevent memory leaks (max 30 points)
-      if (trailPointsRef.current.length > 30) {
-        trailPointsRef.current = trailPointsRef.current.slice(-30)
+        const target = pointer.target as Element | null
+        cursor.classList.toggle("hovering", Boolean(target?.closest?.(INTERACTIVE_SELECTOR)))
       }
+      cursor.classList.toggle("clicking", pointer.down)
 
-      if (cursorRef.current) {
-        gsap.to(cursorRef.current, {
-          x: e.clientX - 10,
-          y: e.clientY - 10,
-          duration: 0.08,
-          ease: "power2.out",
-        })
+      if (pointer.down && now - lastParticleTime > PARTICLE_INTERVAL) {
+        spawnParticle(pointer.x + (Math.random() - 0.5) * 15, pointer.y + (Math.random() - 0.5) * 15)
+        lastParticleTime = now
       }
-    }
-
-    const handleMouseDown = () => {
-      setIsClicking(true)
-    }
 
-    const handleMouseUp = () => {
-      setIsClicking(false)
-    }
+      updateTrails(now)
+      updateParticles()
 
-    const handleMouseEnter = (e: MouseEvent) => {
-      const target = e.target as HTMLElement
-      if (
-        target.tagName === "BUTTON" ||
-        target.tagName === "A" ||
-        target.classList.contains("cursor-pointer") ||
-        target.closest("button") ||
-        target.closest("a") ||
-        target.closest(".cursor-pointer")
-      ) {
-        setIsHovering(true)
-      }
-    }
+      // Keep drawing while anything is still fading or a button is held
+      return pointer.down || trailPoints.length > 0 || particles.length > 0
+    },
 
-    const handleMouseLeave = (e: MouseEvent) => {
-      const target = e.target as HTMLElement
-      if (
-        target.tagName === "BUTTON" ||
-        target.tagName === "A" ||
-        target.classList.contains("cursor-pointer") ||
-        target.closest("button") ||
-        target.closest("a") ||
-        target.closest(".cursor-pointer")
-      ) {
-        setIsHovering(false)
-      }
-    }
+    destroy() {
+      document.body.classList.remove("cursor-hidden")
+      gsap.killTweensOf(cursor)
+      trails.forEach((trail) => trail.remove())
+      particleElements.forEach((element) => element.remove())
+      particles = []
+      trailPoints = []
+    },
+  }
+}
 
-    // Start animation loop
-    animationFrameRef.current = requestAnimationFrame(animate)
+export default function CustomCursor() {
+  const cursorRef = useRef<HTMLDivElement>(null)
 
-    // Event listeners
-    document.addEventListener("mousemove", handleMouseMove)
-    document.addEventListener("mousedown", handleMouseDown)
-    document.addEventListener("mouseup", handleMouseUp)
-    document.addEventListener("mouseover", handleMouseEnter)
-    document.addEventListener("mouseout", handleMouseLeave)
+  // Check if device supports hover (not touch device)
+  const [supportsHover, setSupportsHover] = useState(true)
 
-    return () => {
-      document.body.classList.remove("cursor-hidden")
-      document.removeEventListener("mousemove", handleMouseMove)
-      document.removeEventListener("mousedown", handleMouseDown)
-      document.removeEventListener("mouseup", handleMouseUp)
-      document.removeEventListener("mouseover", handleMouseEnter)
-      document.removeEventListener("mouseout", handleMouseLeave)
+  useEffect(() => {
+    const checkHoverSupport = () => {
+      setSupportsHover(window.matchMedia("(hover: hover) and (pointer: fine)").matches)
+    }
 
-      // Cancel animation frame
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current)
-      }
+    checkHoverSupport()
+    window.addEventListener("resize", checkHoverSupport)
 
-      // Comprehensive cleanup with proper DOM removal
-      trailsRef.current.forEach((trail) => {
-        if (trail.element?.parentNode) {
-          trail.element.parentNode.removeChild(trail.element)
-        }
-      })
-      particlesRef.current.forEach((particle) => {
-        if (particle.element?.parentNode) {
-          particle.element.parentNode.removeChild(particle.element)
-        }
-      })
+    return () => window.removeEventListener("resize", checkHoverSupport)
+  }, [])
 
-      // Clear all references
-      trailsRef.current = []
-      particlesRef.current = []
-      trailPointsRef.current = []
-    }
-  }, [supportsHover, animate])
+  useEffect(() => {
+    if (!supportsHover || !cursorRef.current) return
+    return mountCursor(cursorRef.current, createTrailCursor, undefined, "custom-cursor")
+  }, [supportsHover])
 
   // Don't render on touch devices
   if (!supportsHover) return null
 
-  return (
-    <div ref={cursorRef} className={`custom-cursor ${isClicking ? "clicking" : ""} ${isHovering ? "hovering" : ""}`} />
-  )
+  return <div ref={cursorRef} className="custom-cursor" />
 }
@@ -1,6 +1,7 @@
 "use client"
 
-import { useEffect, useRef, useState } from "react"
+import { useEffect, useRef } from "react"
+import { prefersReducedMotion, subscribeTicker } from "@/lib/ticker"
 
 interface DecryptedTextProps {
   text: string
@@ -10,6 +11,10 @@ interface DecryptedTextProps {
   characters?: string
 }
 
+// Hover re-decryption steps every 30ms, half a character at a time
+const HOVER_STEP_MS = 30
+const HOVER_STEP = 0.5
+
 export default function DecryptedText({
   text,
   className = "",
@@ -17,121 +22,89 @@ export default function DecryptedText({
   duration = 2000,
   characters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()_+-=[]{}|;:,.<>?",
 }: DecryptedTextProps) {
-  const [displayText, setDisplayText] = useState("")
-  const [isDecrypting, setIsDecrypting] = useState(false)
-  const intervalRef = useRef<NodeJS.Timeout | null>(null)
-  const timeoutRef = useRef<NodeJS.Timeout | null>(null)
+  // Frames are written straight into the span; React only renders the initial mask
+  const elementRef = useRef<HTMLSpanElement>(null)
+  const hoverRef = useRef<() => void>(() => {})
 
   useEffect(() => {
-    // Start decryption after delay
-    timeoutRef.current = setTimeout(() => {
-      setIsDecrypting(true)
-
-      let iteration = 0
-      const targetLength = text.length
-
-      // Enhanced animation with smoother progression
-      const intervalDuration = Math.max(20, duration / targetLength / 4) // Slower, smoother progression
-      intervalRef.current = setInterval(
-        () => {
-          setDisplayText((prev) => {
-            return text
-              .split("")
-              .map((char, index) => {
-                if (char === " ") return " "
-
-                // Smoother reveal with easing effect - characters reveal progressively faster
-                const revealProgress = index / targetLength
-                const adjustedIteration = iteration * (1 + revealProgress * 0.3)
-                
-                if (index < adjustedIteration - 0.5) {
-                  return text[index]
-                }
-
-                return characters[Math.floor(Math.random() * characters.length)]
-              })
-              .join("")
-          })
-
-          if (iteration >= targetLength) {
-            if (intervalRef.current) {
-              clearInterval(intervalRef.current)
-            }
-            setDisplayText(text)
-            setIsDecrypting(false)
-          }
-
-          // Slower iteration for more elegant reveal
-          iteration += 0.15
-        },
-        intervalDuration,
-      )
-    }, delay)
+    const element = elementRef.current
+    if (!element) return
 
-    return () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current)
-      }
-      if (timeoutRef.current) {
-        clearTimeout(timeoutRef.current)
-      }
+    if (prefersReducedMotion()) {
+      element.textContent = text
+      return
     }
-  }, [text, delay, duration, characters])
-
-  // Handle hover effect for re-decryption
-  const handleMouseEnter = () => {
-    if (isDecrypting) return
 
-    setIsDecrypting(true)
-    let iteration = 0
     const targetLength = text.length
-
-    if (intervalRef.current) {
-      clearInterval(intervalRef.current)
+    const scramble = (revealed: (index: number) => boolean) => {
+      let frame = ""
+      for (let index = 0; index < targetLength; index++) {
+        const char = text[index]
+        frame += char === " " || revealed(index) ? char : characters[Math.floor(Math.random() * characters.length)]
+      }
+      element.textContent = frame
     }
 
-    intervalRef.current = setInterval(() => {
-      setDisplayText((prev) => {
-        return text
-          .split("")
-          .map((char, index) => {
-            if (char === " ") return " "
-
-            if (index < iteration) {
-              return text[index]
-            }
+    // Enhanced animation with smoother progression
+    const introStepMs = Math.max(20, duration / targetLength / 4)
+    let mode: "waiting" | "intro" | "hover" | "idle" = "waiting"
+    let iteration = 0
+    const startAt = performance.now() + delay
 
-            return characters[Math.floor(Math.random() * characters.length)]
-          })
-          .join("")
-      })
+    const subscription = subscribeTicker(element, (now) => {
+      if (mode === "waiting") {
+        if (now < startAt) return startAt
+        mode = "intro"
+      }
+      if (mode === "idle") return Number.POSITIVE_INFINITY
 
       if (iteration >= targetLength) {
-        if (intervalRef.current) {
-          clearInterval(intervalRef.current)
-        }
-        setDisplayText(text)
-        setIsDecrypting(false)
+        element.textContent = text
+        mode = "idle"
+        return Number.POSITIVE_INFINITY
+      }
+
+      if (mode === "intro") {
+        // Smoother reveal with easing effect - characters reveal progressively faster
+        scramble((index) => index < iteration * (1 + (index / targetLength) * 0.3) - 0.5)
+        // Slower iteration for more elegant reveal
+        iteration += 0.15
+        return now + introStepMs
       }
 
-      iteration += 1 / 2
-    }, 30)
-  }
+      scramble((index) => index < iteration)
+      iteration += HOVER_STEP
+      return now + HOVER_STEP_MS
+    })
+
+    // Handle hover effect for re-decryption
+    hoverRef.current = () => {
+      if (mode !== "idle") return
+      mode = "hover"
+      iteration = 0
+      subscription.wake()
+    }
+
+    return () => {
+      subscription.cancel()
+      hoverRef.current = () => {}
+    }
+  }, [text, delay, duration, characters])
 
   return (
     <span
+      ref={elementRef}
       className={`font-mono cursor-pointer ${className}`}
-      onMouseEnter={handleMouseEnter}
+      onMouseEnter={() => hoverRef.current()}
       style={{
         fontVariantNumeric: "tabular-nums",
         letterSpacing: "0.05em",
       }}
     >
-      {displayText ||
-        text
-          .split("")
-          .map(() => characters[0])
-          .join("")}
+      {text
+        .split("")
+        .map(() => characters[0])
+        .join("")}
     </span>
   )
 }
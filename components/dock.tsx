@@ -1,16 +1,17 @@
 "use client"
 
 import {
+  animate,
   motion,
   type MotionValue,
   useMotionValue,
   useSpring,
   useTransform,
   type SpringOptions,
-  AnimatePresence,
 } from "framer-motion"
 import type React from "react"
-import { Children, cloneElement, useEffect, useMemo, useRef, useState } from "react"
+import { Children, cloneElement, useEffect, useMemo, useRef } from "react"
+import { subscribePointer, type PointerState } from "@/lib/pointer-tracker"
 import "./dock.css"
 
 export type DockItemData = {
@@ -35,37 +36,32 @@ type DockItemProps = {
   className?: string
   children: React.ReactNode
   onClick?: () => void
-  mouseX: MotionValue
   spring: SpringOptions
-  distance: number
   baseItemSize: number
-  magnification: number
+  // Hands the Dock this item's element and the size it should spring to
+  register: (item: DockItemHandle | null) => void
+  testId?: string
 }
 
-function DockItem({
-  children,
-  className = "",
-  onClick,
-  mouseX,
-  spring,
-  distance,
-  magnification,
-  baseItemSize,
-}: DockItemProps) {
+type DockItemHandle = {
+  element: HTMLDivElement
+  targetSize: MotionValue<number>
+  size: MotionValue<number>
+}
+
+function DockItem({ children, className = "", onClick, spring, baseItemSize, register, testId }: DockItemProps) {
   const ref = useRef<HTMLDivElement>(null)
   const isHovered = useMotionValue(0)
-  const mouseDistance = useTransform(mouseX, (val) => {
-    const rect = ref.current?.getBoundingClientRect() ?? {
-      x: 0,
-      width: baseItemSize,
-    }
-    return val - rect.x - baseItemSize / 2
-  })
-
-  const targetSize = useTransform(mouseDistance, [-distance, 0, distance], [baseItemSize, magnification, baseItemSize])
-
+  // Set by the Dock's per-frame pass; the spring is the only thing animating the size
+  const targetSize = useMotionValue(baseItemSize)
   const size = useSpring(targetSize, spring)
 
+  useEffect(() => {
+    if (!ref.current) return
+    register({ element: ref.current, targetSize, size })
+    return () => register(null)
+  }, [register, targetSize, size])
+
   return (
     <motion.div
       ref={ref}
@@ -79,6 +75,7 @@ function DockItem({
       onBlur={() => isHovered.set(0)}
       onClick={onClick}
       className={`dock-item cursor-target ${className}`}
+      data-testid={testId}
       tabIndex={0}
       role="button"
       aria-haspopup="true"
@@ -94,35 +91,24 @@ type DockLabelProps = {
   isHovered?: MotionValue<number>
 }
 
-function DockLabel({ children, className = "", ...rest }: DockLabelProps & { isHovered?: MotionValue<number> }) {
-  const { isHovered } = rest as { isHovered?: MotionValue<number> }
-  const [isVisible, setIsVisible] = useState(false)
+// Always mounted; hover fades it in and out through motion values, not React state
+function DockLabel({ children, className = "", isHovered }: DockLabelProps) {
+  const progress = useMotionValue(0)
+  const opacity = useTransform(progress, [0, 1], [0, 1])
+  const y = useTransform(progress, [0, 1], [0, 10])
+  const visibility = useTransform(progress, (value) => (value > 0 ? "visible" : "hidden"))
 
   useEffect(() => {
     if (!isHovered) return
-
-    const unsubscribe = isHovered.on("change", (latest) => {
-      setIsVisible(latest === 1)
+    return isHovered.on("change", (latest) => {
+      animate(progress, latest === 1 ? 1 : 0, { duration: 0.2 })
     })
-    return () => unsubscribe()
-  }, [isHovered])
+  }, [isHovered, progress])
 
   return (
-    <AnimatePresence>
-      {isVisible && (
-        <motion.div
-          initial={{ opacity: 0, y: 0 }}
-          animate={{ opacity: 1, y: 10 }}
-          exit={{ opacity: 0, y: 0 }}
-          transition={{ duration: 0.2 }}
-          className={`dock-label ${className}`}
-          role="tooltip"
-          style={{ x: "-50%" }}
-        >
-          {children}
-        </motion.div>
-      )}
-    </AnimatePresence>
+    <motion.div className={`dock-label ${className}`} role="tooltip" style={{ x: "-50%", y, opacity, visibility }}>
+      {children}
+    </motion.div>
   )
 }
 
@@ -135,6 +121,12 @@ function DockIcon({ children, className = "" }: DockIconProps) {
   return <div className={`dock-icon ${className}`}>{children}</div>
 }
 
+// Magnified size of an item whose rest centre is `offset` px from the pointer
+function magnifiedSize(offset: number, distance: number, baseItemSize: number, magnification: number) {
+  const t = Math.min(Math.abs(offset) / distance, 1)
+  return magnification + (baseItemSize - magnification) * t
+}
+
 export default function Dock({
   items,
   className = "",
@@ -145,7 +137,8 @@ export default function Dock({
   dockHeight = 256,
   baseItemSize = 50,
 }: DockProps) {
-  const mouseX = useMotionValue(Number.POSITIVE_INFINITY)
+  const panelRef = useRef<HTMLDivElement>(null)
+  const itemsRef = useRef<(DockItemHandle | null)[]>([])
   const isHovered = useMotionValue(0)
   const maxHeight = useMemo(
     () => Math.max(dockHeight, magnification + magnification / 2 + 4),
@@ -155,32 +148,94 @@ export default function Dock({
   const heightRow = useTransform(isHovered, [0, 1], [panelHeight, maxHeight])
   const height = useSpring(heightRow, spring)
 
+  const registers = useMemo(
+    () =>
+      items.map((_, index) => (item: DockItemHandle | null) => {
+        itemsRef.current[index] = item
+      }),
+    [items],
+  )
+
+  useEffect(() => {
+    const panel = panelRef.current
+    if (!panel) return
+
+    // Item centres along x, measured with every item at rest size: when the
+    // pointer arrives at a rested dock, and once magnification has settled
+    // back. A resize mid-hover waits for the settle rather than measuring the
+    // magnified layout. The dock is position: fixed, so scrolling never moves it.
+    let centres: number[] = []
+    let stale = true
+    let hovering = false
+
+    const measure = () => {
+      centres = itemsRef.current.map((item) => {
+        if (!item) return Number.POSITIVE_INFINITY
+        const rect = item.element.getBoundingClientRect()
+        return rect.left + rect.width / 2
+      })
+      stale = false
+    }
+    const markStale = () => {
+      stale = true
+    }
+    const settled = () =>
+      itemsRef.current.every((item) => !item || Math.abs(item.size.get() - baseItemSize) < 0.5)
+    const onSettle = () => {
+      if (!hovering && settled()) measure()
+    }
+    const stopSettleListeners = itemsRef.current.map((item) => item?.size.on("animationComplete", onSettle))
+
+    // One pass per frame sets every item's target size from the cached centres
+    const onPointer = (pointer: PointerState) => {
+      const over = pointer.inside && panel.contains(pointer.target as Node | null)
+      if (!over) {
+        if (!hovering) return
+        hovering = false
+        isHovered.set(0)
+        itemsRef.current.forEach((item) => item?.targetSize.set(baseItemSize))
+        return
+      }
+
+      if (!hovering) {
+        hovering = true
+        isHovered.set(1)
+        if (stale && settled()) measure()
+      }
+      itemsRef.current.forEach((item, index) => {
+        item?.targetSize.set(magnifiedSize(pointer.x - centres[index], distance, baseItemSize, magnification))
+      })
+    }
+
+    const unsubscribe = subscribePointer(onPointer, "dock")
+    window.addEventListener("resize", markStale)
+
+    return () => {
+      unsubscribe()
+      stopSettleListeners.forEach((stop) => stop?.())
+      window.removeEventListener("resize", markStale)
+    }
+  }, [items, distance, magnification, baseItemSize, isHovered])
+
   return (
     <motion.div style={{ height, scrollbarWidth: "none" }} className="dock-outer">
       <motion.div
-        onMouseMove={({ pageX }) => {
-          isHovered.set(1)
-          mouseX.set(pageX)
-        }}
-        onMouseLeave={() => {
-          isHovered.set(0)
-          mouseX.set(Number.POSITIVE_INFINITY)
-        }}
+        ref={panelRef}
         className={`dock-panel ${className}`}
         style={{ height: panelHeight }}
         role="toolbar"
         aria-label="Application dock"
+        data-testid="dock"
       >
         {items.map((item, index) => (
           <DockItem
             key={index}
             onClick={item.onClick}
             className={item.className}
-            mouseX={mouseX}
             spring={spring}
-            distance={distance}
-            magnification={magnification}
             baseItemSize={baseItemSize}
+            register={registers[index]}
+            testId={`dock-item-${index}`}
           >
             <DockIcon>{item.icon}</DockIcon>
             <DockLabel>{item.label}</DockLabel>
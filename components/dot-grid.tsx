@@ -1,27 +1,24 @@
 "use client"
 
 import type React from "react"
-import { useRef, useEffect, useCallback, useMemo } from "react"
-import { gsap } from "gsap"
+import { useRef, useEffect, useCallback, useMemo, useState } from "react"
+import { DotField, DotGridRenderer } from "@/lib/dot-grid-engine"
+import type { DotGridWorkerConfig, DotGridWorkerMessage, DotGridWorkerReport } from "@/lib/dot-grid.worker"
+import { geometry } from "@/lib/geometry-cache"
+import { beginWork, endWork, isPerfMonitorEnabled, recordWork } from "@/lib/perf-monitor"
+import { subscribePointer, type PointerState } from "@/lib/pointer-tracker"
 import "./dot-grid.css"
 
-const throttle = (func: (...args: any[]) => void, limit: number) => {
-  let lastCall = 0
-  return function (this: any, ...args: any[]) {
-    const now = performance.now()
-    if (now - lastCall >= limit) {
-      lastCall = now
-      func.apply(this, args)
-    }
-  }
-}
+// "worker" draws on an OffscreenCanvas in a Web Worker, off the main thread;
+// browsers without transferControlToOffscreen fall back to "main".
+export type DotGridBackend = "main" | "worker"
 
-interface Dot {
-  cx: number
-  cy: number
-  xOffset: number
-  yOffset: number
-  _inertiaApplied: boolean
+// ?dotgrid=main or ?dotgrid=worker overrides the prop, for benchmarks
+function resolveBackend(preferred: DotGridBackend): DotGridBackend {
+  const override = new URLSearchParams(window.location.search).get("dotgrid")
+  const wanted = override === "main" || override === "worker" ? override : preferred
+  const supported = typeof Worker !== "undefined" && "transferControlToOffscreen" in HTMLCanvasElement.prototype
+  return wanted === "worker" && supported ? "worker" : "main"
 }
 
 export interface DotGridProps {
@@ -36,20 +33,11 @@ export interface DotGridProps {
   maxSpeed?: number
   resistance?: number
   returnDuration?: number
+  backend?: DotGridBackend
   className?: string
   style?: React.CSSProperties
 }
 
-function hexToRgb(hex: string) {
-  const m = hex.match(/^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i)
-  if (!m) return { r: 0, g: 0, b: 0 }
-  return {
-    r: Number.parseInt(m[1], 16),
-    g: Number.parseInt(m[2], 16),
-    b: Number.parseInt(m[3], 16),
-  }
-}
-
 const DotGrid: React.FC<DotGridProps> = ({
   dotSize = 16,
   gap = 32,
@@ -62,25 +50,57 @@ const DotGrid: React.FC<DotGridProps> = ({
   maxSpeed = 5000,
   resistance = 750,
   returnDuration = 1.5,
+  backend = "main",
   className = "",
   style,
 }) => {
   const wrapperRef = useRef<HTMLDivElement>(null)
   const canvasRef = useRef<HTMLCanvasElement>(null)
-  const dotsRef = useRef<Dot[]>([])
-  const pointerRef = useRef({
-    x: 0,
-    y: 0,
-    vx: 0,
-    vy: 0,
-    speed: 0,
-    lastTime: 0,
-    lastX: 0,
-    lastY: 0,
-  })
-
-  const baseRgb = useMemo(() => hexToRgb(baseColor), [baseColor])
-  const activeRgb = useMemo(() => hexToRgb(activeColor), [activeColor])
+  const fieldRef = useRef<DotField | null>(null)
+  const rendererRef = useRef<DotGridRenderer | null>(null)
+  const frameRef = useRef(0)
+  const onScreenRef = useRef(true)
+  // Null until mounted, since support can only be checked in the browser
+  const [activeBackend, setActiveBackend] = useState<DotGridBackend | null>(null)
+
+  const workerConfig = useMemo<DotGridWorkerConfig>(
+    () => ({
+      dotSize,
+      gap,
+      baseColor,
+      activeColor,
+      proximity,
+      radius: shockRadius,
+      strength: shockStrength,
+      returnDuration,
+    }),
+    [dotSize, gap, baseColor, activeColor, proximity, shockRadius, shockStrength, returnDuration],
+  )
+  const workerConfigRef = useRef(workerConfig)
+  workerConfigRef.current = workerConfig
+  const workerRef = useRef<Worker | null>(null)
+
+  useEffect(() => {
+    setActiveBackend(resolveBackend(backend))
+  }, [backend])
+
+  // Schedule one frame; frames keep coming only while dots are moving
+  const requestDraw = useCallback(() => {
+    if (frameRef.current || !onScreenRef.current) return
+    frameRef.current = requestAnimationFrame((now) => {
+      frameRef.current = 0
+      const renderer = rendererRef.current
+      const field = fieldRef.current
+      if (!renderer || !field) return
+
+      const workStart = beginWork()
+      const moving = field.step(now)
+      renderer.render()
+      endWork("dot-grid", workStart)
+
+      if (moving) requestDraw()
+    })
+  }, [])
 
   const buildGrid = useCallback(() => {
     const wrap = wrapperRef.current
@@ -95,77 +115,25 @@ const DotGrid: React.FC<DotGridProps> = ({
     canvas.style.height = `${height}px`
 
     const ctx = canvas.getContext("2d")
-    if (ctx) ctx.scale(dpr, dpr)
-
-    const cols = Math.floor((width + gap) / (dotSize + gap))
-    const rows = Math.floor((height + gap) / (dotSize + gap))
-    const cell = dotSize + gap
-    const gridW = cell * cols - gap
-    const gridH = cell * rows - gap
-    const extraX = width - gridW
-    const extraY = height - gridH
-    const startX = extraX / 2 + dotSize / 2
-    const startY = extraY / 2 + dotSize / 2
-
-    const dots: Dot[] = []
-    for (let y = 0; y < rows; y++) {
-      for (let x = 0; x < cols; x++) {
-        const cx = startX + x * cell
-        const cy = startY + y * cell
-        dots.push({ cx, cy, xOffset: 0, yOffset: 0, _inertiaApplied: false })
-      }
-    }
-
-    dotsRef.current = dots
-  }, [dotSize, gap])
+    if (!ctx) return
+    ctx.scale(dpr, dpr)
 
-  useEffect(() => {
-    let rafId: number
-    const proxSq = proximity * proximity
-    const radius = dotSize / 2
-
-    const draw = () => {
-      const canvas = canvasRef.current
-      if (!canvas) return
-
-      const ctx = canvas.getContext("2d")
-      if (!ctx) return
-
-      ctx.clearRect(0, 0, canvas.width, canvas.height)
-
-      const { x: px, y: py } = pointerRef.current
-
-      for (const dot of dotsRef.current) {
-        const ox = dot.cx + dot.xOffset
-        const oy = dot.cy + dot.yOffset
-        const dx = dot.cx - px
-        const dy = dot.cy - py
-        const dsq = dx * dx + dy * dy
-
-        let style = baseColor
-        if (dsq <= proxSq) {
-          const dist = Math.sqrt(dsq)
-          const t = 1 - dist / proximity
-          const r = Math.round(baseRgb.r + (activeRgb.r - baseRgb.r) * t)
-          const g = Math.round(baseRgb.g + (activeRgb.g - baseRgb.g) * t)
-          const b = Math.round(baseRgb.b + (activeRgb.b - baseRgb.b) * t)
-          style = `rgb(${r},${g},${b})`
-        }
-
-        ctx.beginPath()
-        ctx.arc(ox, oy, radius, 0, Math.PI * 2)
-        ctx.fillStyle = style
-        ctx.fill()
-      }
+    const field = new DotField(width, height, dotSize, gap)
+    fieldRef.current = field
 
-      rafId = requestAnimationFrame(draw)
+    const style = { dotSize, baseColor, activeColor, proximity }
+    if (!rendererRef.current) {
+      rendererRef.current = new DotGridRenderer(ctx, style)
+    } else {
+      rendererRef.current.setContext(ctx)
+      rendererRef.current.setStyle(style)
     }
-
-    draw()
-    return () => cancelAnimationFrame(rafId)
-  }, [proximity, baseColor, activeRgb, baseRgb, dotSize])
+    rendererRef.current.setField(field, width, height)
+    requestDraw()
+  }, [dotSize, gap, baseColor, activeColor, proximity, requestDraw])
 
   useEffect(() => {
+    if (activeBackend !== "main") return
     buildGrid()
 
     let ro: ResizeObserver | null = null
@@ -180,63 +148,154 @@ const DotGrid: React.FC<DotGridProps> = ({
       if (ro) ro.disconnect()
       else window.removeEventListener("resize", buildGrid)
     }
-  }, [buildGrid])
+  }, [buildGrid, activeBackend])
 
+  // Suspend drawing entirely while the grid is scrolled out of view
   useEffect(() => {
-    const onMove = (e: MouseEvent) => {
-      const rect = canvasRef.current!.getBoundingClientRect()
-      pointerRef.current.x = e.clientX - rect.left
-      pointerRef.current.y = e.clientY - rect.top
+    const wrap = wrapperRef.current
+    if (activeBackend !== "main" || !wrap || !("IntersectionObserver" in window)) return
+
+    const io = new IntersectionObserver(([entry]) => {
+      onScreenRef.current = entry.isIntersecting
+      if (entry.isIntersecting) {
+        rendererRef.current?.invalidate()
+        requestDraw()
+      } else if (frameRef.current) {
+        cancelAnimationFrame(frameRef.current)
+        frameRef.current = 0
+      }
+    })
+    io.observe(wrap)
+
+    return () => {
+      io.disconnect()
+      cancelAnimationFrame(frameRef.current)
+      frameRef.current = 0
     }
+  }, [requestDraw, activeBackend])
 
-    const onClick = (e: MouseEvent) => {
-      const rect = canvasRef.current!.getBoundingClientRect()
-      const cx = e.clientX - rect.left
-      const cy = e.clientY - rect.top
-
-      for (const dot of dotsRef.current) {
-        const dist = Math.hypot(dot.cx - cx, dot.cy - cy)
-        if (dist < shockRadius && !dot._inertiaApplied) {
-          dot._inertiaApplied = true
-          gsap.killTweensOf(dot)
-
-          const falloff = Math.max(0, 1 - dist / shockRadius)
-          const pushX = (dot.cx - cx) * shockStrength * falloff
-          const pushY = (dot.cy - cy) * shockStrength * falloff
-
-          gsap.to(dot, {
-            xOffset: pushX,
-            yOffset: pushY,
-            duration: 0.1,
-            ease: "power2.out",
-            onComplete: () => {
-              gsap.to(dot, {
-                xOffset: 0,
-                yOffset: 0,
-                duration: returnDuration,
-                ease: "elastic.out(1,0.75)",
-              })
-              dot._inertiaApplied = false
-            },
-          })
-        }
+  useEffect(() => {
+    if (activeBackend !== "main") return
+
+    const canvas = canvasRef.current
+    if (!canvas) return
+    const unobserve = geometry.observe(canvas)
+
+    const onPointer = (pointer: PointerState) => {
+      if (!pointer.moved) return
+      const rect = geometry.rect(canvas)
+      if (rendererRef.current?.setPointer(pointer.x - rect.left, pointer.y - rect.top)) {
+        requestDraw()
       }
     }
 
-    const throttledMove = throttle(onMove, 16)
-    window.addEventListener("mousemove", throttledMove, { passive: true })
+    const onClick = (e: MouseEvent) => {
+      const field = fieldRef.current
+      if (!field) return
+      const workStart = beginWork()
+      const rect = geometry.rect(canvas)
+      const affected = field.shockwave(
+        e.clientX - rect.left,
+        e.clientY - rect.top,
+        { radius: shockRadius, strength: shockStrength, returnDuration },
+        performance.now(),
+      )
+      endWork("dot-grid:click", workStart)
+      if (affected > 0) requestDraw()
+    }
+
+    const unsubscribe = subscribePointer(onPointer, "dot-grid:pointer")
+    window.addEventListener("click", onClick)
+
+    return () => {
+      unsubscribe()
+      unobserve()
+      window.removeEventListener("click", onClick)
+    }
+  }, [shockRadius, shockStrength, returnDuration, requestDraw, activeBackend])
+
+  // Worker backend: the canvas is handed to lib/dot-grid.worker.ts and this
+  // thread only forwards pointer, click, resize and visibility changes
+  useEffect(() => {
+    const wrap = wrapperRef.current
+    if (activeBackend !== "worker" || !wrap) return
+
+    // A canvas can only be transferred once and strict mode runs effects
+    // twice, so each worker gets a canvas of its own
+    const canvas = document.createElement("canvas")
+    canvas.className = "dot-grid__canvas"
+    wrap.appendChild(canvas)
+
+    const worker = new Worker(new URL("../lib/dot-grid.worker.ts", import.meta.url))
+    workerRef.current = worker
+    const post = (message: DotGridWorkerMessage, transfer: Transferable[] = []) => worker.postMessage(message, transfer)
+
+    worker.onmessage = (e: MessageEvent<DotGridWorkerReport>) => {
+      recordWork(e.data.label === "frame" ? "dot-grid:worker" : "dot-grid:worker-click", e.data.ms)
+    }
+    // If the worker cannot start, redraw on the main thread with a new canvas
+    worker.onerror = () => setActiveBackend("main")
+
+    const measure = () => {
+      const { width, height } = wrap.getBoundingClientRect()
+      return { width, height, dpr: window.devicePixelRatio || 1 }
+    }
+    const offscreen = canvas.transferControlToOffscreen()
+    post(
+      { type: "init", canvas: offscreen, ...measure(), config: workerConfigRef.current, reportWork: isPerfMonitorEnabled() },
+      [offscreen],
+    )
+
+    const onResize = () => post({ type: "resize", ...measure() })
+    let ro: ResizeObserver | null = null
+    if ("ResizeObserver" in window) {
+      ro = new ResizeObserver(onResize)
+      ro.observe(wrap)
+    } else {
+      ;(window as Window).addEventListener("resize", onResize)
+    }
+
+    let io: IntersectionObserver | null = null
+    if ("IntersectionObserver" in window) {
+      io = new IntersectionObserver(([entry]) => post({ type: "visible", visible: entry.isIntersecting }))
+      io.observe(wrap)
+    }
+
+    const unobserve = geometry.observe(wrap)
+    const toLocal = (x: number, y: number) => {
+      const rect = geometry.rect(wrap)
+      return { x: x - rect.left, y: y - rect.top }
+    }
+    // One message per frame at most, from the shared pointer pipeline
+    const onPointer = (pointer: PointerState) => {
+      if (pointer.moved) post({ type: "pointer", ...toLocal(pointer.x, pointer.y) })
+    }
+    const onClick = (e: MouseEvent) => post({ type: "click", ...toLocal(e.clientX, e.clientY) })
+    const unsubscribe = subscribePointer(onPointer, "dot-grid:pointer")
     window.addEventListener("click", onClick)
 
     return () => {
-      window.removeEventListener("mousemove", throttledMove)
+      unsubscribe()
+      unobserve()
       window.removeEventListener("click", onClick)
+      io?.disconnect()
+      if (ro) ro.disconnect()
+      else window.removeEventListener("resize", onResize)
+      worker.terminate()
+      workerRef.current = null
+      canvas.remove()
     }
-  }, [proximity, shockRadius, shockStrength, returnDuration])
+  }, [activeBackend])
+
+  // Prop changes reach a running worker without restarting it
+  useEffect(() => {
+    workerRef.current?.postMessage({ type: "config", config: workerConfig } satisfies DotGridWorkerMessage)
+  }, [workerConfig])
 
   return (
     <section className={`dot-grid ${className}`} style={style}>
       <div ref={wrapperRef} className="dot-grid__wrap">
-        <canvas ref={canvasRef} className="dot-grid__canvas" />
+        {activeBackend === "main" && <canvas ref={canvasRef} className="dot-grid__canvas" />}
       </div>
     </section>
   )
@@ -0,0 +1,59 @@
+"use client"
+
+import { useEffect, useState } from "react"
+import { Download } from "lucide-react"
+import { scrollToSection } from "@/lib/scroll"
+
+const RESUME_PATH = "/resume/CV_Harsh_Chavan.pdf"
+
+export default function HeroActions() {
+  const [resumeAvailable, setResumeAvailable] = useState<boolean | null>(null)
+
+  useEffect(() => {
+    // Check resume availability once on mount (cache the result)
+    fetch(RESUME_PATH, { method: "HEAD" })
+      .then((response) => setResumeAvailable(response.ok))
+      .catch(() => setResumeAvailable(false))
+  }, [])
+
+  // Optimized resume download with cached availability check
+  const downloadResume = () => {
+    try {
+      // Check cached availability state
+      if (resumeAvailable === false) {
+        alert("Resume file is not available. Please contact me directly at harshabasaheb1@gmail.com")
+        return
+      }
+
+      // Create and trigger download
+      const link = document.createElement("a")
+      link.href = RESUME_PATH
+      link.download = "CV_Harsh_Chavan.pdf"
+      link.target = "_blank"
+      link.click()
+    } catch (error) {
+      console.error("Error downloading resume:", error)
+      alert("Unable to download resume. Please contact me directly at harshabasaheb1@gmail.com")
+    }
+  }
+
+  return (
+    <div className="flex flex-col sm:flex-row items-center justify-center gap-4">
+      <button
+        onClick={() => scrollToSection("contact")}
+        data-testid="hero-get-in-touch"
+        className="cursor-target bg-gradient-to-r from-purple-500 to-pink-500 hover:from-purple-600 hover:to-pink-600 px-8 py-3 rounded-full font-semibold transition-all duration-300 transform hover:scale-105"
+      >
+        Get In Touch
+      </button>
+      <button
+        onClick={downloadResume}
+        data-testid="hero-download-resume"
+        className="cursor-target border border-purple-500/30 hover:border-purple-500 px-8 py-3 rounded-full font-semibold transition-all duration-300 flex items-center gap-2"
+      >
+        <Download size={16} />
+        Download Resume
+      </button>
+    </div>
+  )
+}
@@ -0,0 +1,90 @@
+"use client"
+
+// Client islands for the server-rendered page in app/page.tsx. Each heavy
+// interactive component is a next/dynamic import behind a LazyIsland, so its
+// code (and GSAP, motion or react-icons with it) is fetched and hydrated only
+// when its section scrolls near or the browser is idle, not before first paint.
+
+import { useEffect } from "react"
+import dynamic from "next/dynamic"
+import LazyIsland, { IslandPlaceholder } from "@/components/lazy-island"
+import type { BentoProps } from "@/components/magic-bento"
+import type { DotGridProps } from "@/components/dot-grid"
+import type { TargetCursorProps } from "@/components/target-cursor"
+
+const BENTO_MIN_HEIGHT = 640
+const CONTACT_FORM_MIN_HEIGHT = 560
+
+const MagicBento = dynamic(() => import("@/components/magic-bento"), {
+  ssr: false,
+  loading: () => <IslandPlaceholder name="magic-bento" state="loading" minHeight={BENTO_MIN_HEIGHT} />,
+})
+const ContactForm = dynamic(() => import("@/components/contact-form"), {
+  ssr: false,
+  loading: () => <IslandPlaceholder name="contact-form" state="loading" minHeight={CONTACT_FORM_MIN_HEIGHT} />,
+})
+const PortfolioDock = dynamic(() => import("@/components/portfolio-dock"), {
+  ssr: false,
+  loading: () => <IslandPlaceholder name="dock" state="loading" />,
+})
+const DotGrid = dynamic(() => import("@/components/dot-grid"), { ssr: false })
+const TargetCursor = dynamic(() => import("@/components/target-cursor"), { ssr: false })
+
+export function BentoIsland(props: BentoProps) {
+  return (
+    <LazyIsland name="magic-bento" minHeight={BENTO_MIN_HEIGHT}>
+      <MagicBento {...props} />
+    </LazyIsland>
+  )
+}
+
+export function ContactFormIsland() {
+  return (
+    <LazyIsland name="contact-form" minHeight={CONTACT_FORM_MIN_HEIGHT}>
+      <ContactForm />
+    </LazyIsland>
+  )
+}
+
+export function DockIsland() {
+  return (
+    <LazyIsland name="dock" when="idle">
+      <PortfolioDock />
+    </LazyIsland>
+  )
+}
+
+export function DotGridIsland(props: DotGridProps) {
+  return (
+    <LazyIsland name="dot-grid" when="idle">
+      <DotGrid {...props} />
+    </LazyIsland>
+  )
+}
+
+export function TargetCursorIsland(props: TargetCursorProps) {
+  return (
+    <LazyIsland name="target-cursor" when="idle">
+      <TargetCursor {...props} />
+    </LazyIsland>
+  )
+}
+
+// Same switch as isPerfMonitorEnabled(), checked here so that neither the
+// monitor nor GSAP is part of this eagerly loaded module
+const perfRequested = () =>
+  process.env.NEXT_PUBLIC_PERF_MONITOR === "1" || new URLSearchParams(window.location.search).get("perf") === "1"
+
+export function PerfMonitor() {
+  useEffect(() => {
+    if (!perfRequested()) return
+    let cancelled = false
+    Promise.all([import("gsap"), import("@/lib/perf-monitor")]).then(([{ gsap }, { startPerfMonitor }]) => {
+      if (!cancelled) startPerfMonitor(() => gsap.globalTimeline.getChildren(true, true, false).length)
+    })
+    return () => {
+      cancelled = true
+    }
+  }, [])
+  return null
+}
@@ -0,0 +1,97 @@
+"use client"
+
+import type React from "react"
+
+import { useEffect, useRef, useState } from "react"
+import { observeVisibility } from "@/lib/visibility-observer"
+
+export type IslandTrigger = "visible" | "idle"
+
+interface LazyIslandProps {
+  // Shown as data-island on the placeholder; the test suite waits on it
+  name: string
+  children: React.ReactNode
+  // "visible" renders once the placeholder is within `rootMargin` of the
+  // viewport, "idle" once the browser has a moment to spare after load
+  when?: IslandTrigger
+  rootMargin?: string
+  // Reserved height, so the page does not jump when the island arrives
+  minHeight?: number
+  className?: string
+}
+
+// Browsers without requestIdleCallback (Safari) get a short timeout instead
+const IDLE_TIMEOUT_MS = 2000
+const IDLE_FALLBACK_MS = 200
+
+export function IslandPlaceholder({
+  name,
+  state,
+  minHeight,
+  className,
+}: {
+  name: string
+  state: "pending" | "loading"
+  minHeight?: number
+  className?: string
+}) {
+  return <div data-island={name} data-island-state={state} className={className} style={{ minHeight }} />
+}
+
+/**
+ * Holds back `children` (normally a next/dynamic component, so its code is
+ * not even downloaded) until the placeholder scrolls near or the page is idle.
+ */
+export default function LazyIsland({
+  name,
+  children,
+  when = "visible",
+  rootMargin = "600px 0px",
+  minHeight,
+  className,
+}: LazyIslandProps) {
+  const placeholderRef = useRef<HTMLDivElement>(null)
+  const [ready, setReady] = useState(false)
+
+  useEffect(() => {
+    if (ready) return
+
+    if (when === "idle") {
+      if ("requestIdleCallback" in window) {
+        const handle = window.requestIdleCallback(() => setReady(true), { timeout: IDLE_TIMEOUT_MS })
+        return () => window.cancelIdleCallback(handle)
+      }
+      const timer = setTimeout(() => setReady(true), IDLE_FALLBACK_MS)
+      return () => clearTimeout(timer)
+    }
+
+    const placeholder = placeholderRef.current
+    if (!placeholder) return
+    if (!("IntersectionObserver" in window)) {
+      setReady(true)
+      return
+    }
+    const stop = observeVisibility(
+      placeholder,
+      (visible) => {
+        if (!visible) return
+        stop()
+        setReady(true)
+      },
+      { rootMargin },
+    )
+    return stop
+  }, [ready, when, rootMargin])
+
+  if (ready) return <>{children}</>
+
+  return (
+    <div
+      ref={placeholderRef}
+      data-island={name}
+      data-island-state="pending"
+      className={className}
+      style={{ minHeight }}
+    />
+  )
+}
@@ -3,6 +3,10 @@
 import type React from "react"
 import { useRef, useEffect, useCallback, useState } from "react"
 import { gsap } from "gsap"
+import { countTween } from "@/lib/perf-monitor"
+import { ParticlePool } from "@/lib/particle-pool"
+import { geometry, type Box } from "@/lib/geometry-cache"
+import { subscribePointer, type PointerState } from "@/lib/pointer-tracker"
 import "./magic-bento.css"
 
 export interface BentoCardProps {
@@ -27,38 +31,34 @@ export interface BentoProps {
   clickEffect?: boolean
   enableMagnetism?: boolean
   cardData?: BentoCardProps[]
+  // Card test ids are `${testIdPrefix}-card-${index}`; give each grid on a page its own
+  testIdPrefix?: string
 }
 
 const DEFAULT_PARTICLE_COUNT = 12
 const DEFAULT_SPOTLIGHT_RADIUS = 300
 const DEFAULT_GLOW_COLOR = "132, 0, 255"
 const MOBILE_BREAKPOINT = 768
+// Particles alive at once across every card on the page
+const MAX_LIVE_PARTICLES = 48
+// Seconds a magnetised card takes to reach its new offset
+const MAGNET_DURATION = 0.3
 
-const createParticleElement = (x: number, y: number, color: string = DEFAULT_GLOW_COLOR): HTMLDivElement => {
-  const el = document.createElement("div")
-  el.className = "particle"
-  el.style.cssText = `
-    position: absolute;
-    width: 4px;
-    height: 4px;
-    border-radius: 50%;
-    background: rgba(${color}, 1);
-    box-shadow: 0 0 6px rgba(${color}, 0.6);
-    pointer-events: none;
-    z-index: 100;
-    left: ${x}px;
-    top: ${y}px;
-  `
-  return el
-}
+const particlePool = new ParticlePool(MAX_LIVE_PARTICLES)
 
 const calculateSpotlightValues = (radius: number) => ({
   proximity: radius * 0.5,
   fadeDistance: radius * 0.75,
 })
 
-const updateCardGlowProperties = (card: HTMLElement, mouseX: number, mouseY: number, glow: number, radius: number) => {
-  const rect = card.getBoundingClientRect()
+const updateCardGlowProperties = (
+  card: HTMLElement,
+  rect: Box,
+  mouseX: number,
+  mouseY: number,
+  glow: number,
+  radius: number,
+) => {
   const relativeX = ((mouseX - rect.left) / rect.width) * 100
   const relativeY = ((mouseY - rect.top) / rect.height) * 100
 
@@ -78,6 +78,7 @@ const ParticleCard: React.FC<{
   enableTilt?: boolean
   clickEffect?: boolean
   enableMagnetism?: boolean
+  testId?: string
 }> = ({
   children,
   className = "",
@@ -88,101 +89,104 @@ const ParticleCard: React.FC<{
   enableTilt = true,
   clickEffect = false,
   enableMagnetism = false,
+  testId,
 }) => {
   const cardRef = useRef<HTMLDivElement>(null)
   const particlesRef = useRef<HTMLDivElement[]>([])
-  const timeoutsRef = useRef<NodeJS.Timeout[]>([])
+  const rippleRef = useRef<HTMLDivElement | null>(null)
   const isHoveredRef = useRef(false)
-  const memoizedParticles = useRef<HTMLDivElement[]>([])
-  const particlesInitialized = useRef(false)
-  const magnetismAnimationRef = useRef<gsap.core.Tween | null>(null)
-
-  const initializeParticles = useCallback(() => {
-    if (particlesInitialized.current || !cardRef.current) return
-
-    const { width, height } = cardRef.current.getBoundingClientRect()
-    memoizedParticles.current = Array.from({ length: particleCount }, () =>
-      createParticleElement(Math.random() * width, Math.random() * height, glowColor),
-    )
-    particlesInitialized.current = true
-  }, [particleCount, glowColor])
 
   const clearAllParticles = useCallback(() => {
-    timeoutsRef.current.forEach(clearTimeout)
-    timeoutsRef.current = []
-    magnetismAnimationRef.current?.kill()
-
-    particlesRef.current.forEach((particle) => {
+    const particles = particlesRef.current
+    particlesRef.current = []
+    countTween("magic-bento", particles.length)
+    particles.forEach((particle) => {
+      gsap.killTweensOf(particle)
       gsap.to(particle, {
         scale: 0,
         opacity: 0,
         duration: 0.3,
         ease: "back.in(1.7)",
-        onComplete: () => {
-          particle.parentNode?.removeChild(particle)
-        },
+        onComplete: () => particlePool.release(particle),
       })
     })
-    particlesRef.current = []
   }, [])
 
+  // Particles come from the shared pool and move by transform only; they
+  // are staggered with tween delays rather than one timer each
   const animateParticles = useCallback(() => {
-    if (!cardRef.current || !isHoveredRef.current) return
+    const card = cardRef.current
+    if (!card || !isHoveredRef.current) return
 
-    if (!particlesInitialized.current) {
-      initializeParticles()
-    }
+    const { width, height } = geometry.rect(card)
+    for (let index = 0; index < particleCount; index++) {
+      const particle = particlePool.acquire(card)
+      if (!particle) break
+      particlesRef.current.push(particle)
+      countTween("magic-bento", 3)
 
-    memoizedParticles.current.forEach((particle, index) => {
-      const timeoutId = setTimeout(() => {
-        if (!isHoveredRef.current || !cardRef.current) return
-
-        const clone = particle.cloneNode(true) as HTMLDivElement
-        cardRef.current.appendChild(clone)
-        particlesRef.current.push(clone)
-
-        gsap.fromTo(clone, { scale: 0, opacity: 0 }, { scale: 1, opacity: 1, duration: 0.3, ease: "back.out(1.7)" })
-
-        gsap.to(clone, {
-          x: (Math.random() - 0.5) * 100,
-          y: (Math.random() - 0.5) * 100,
-          rotation: Math.random() * 360,
-          duration: 2 + Math.random() * 2,
-          ease: "none",
-          repeat: -1,
-          yoyo: true,
-        })
-
-        gsap.to(clone, {
-          opacity: 0.3,
-          duration: 1.5,
-          ease: "power2.inOut",
-          repeat: -1,
-          yoyo: true,
-        })
-      }, index * 100)
-
-      timeoutsRef.current.push(timeoutId)
-    })
-  }, [initializeParticles])
+      const x = Math.random() * width
+      const y = Math.random() * height
+      const delay = index * 0.1
+
+      gsap.fromTo(
+        particle,
+        { x, y, rotation: 0, scale: 0, opacity: 0 },
+        { scale: 1, opacity: 1, duration: 0.3, delay, ease: "back.out(1.7)" },
+      )
+
+      gsap.to(particle, {
+        x: x + (Math.random() - 0.5) * 100,
+        y: y + (Math.random() - 0.5) * 100,
+        rotation: Math.random() * 360,
+        duration: 2 + Math.random() * 2,
+        delay,
+        ease: "none",
+        repeat: -1,
+        yoyo: true,
+      })
+
+      gsap.to(particle, {
+        opacity: 0.3,
+        duration: 1.5,
+        delay: delay + 0.3,
+        ease: "power2.inOut",
+        repeat: -1,
+        yoyo: true,
+      })
+    }
+  }, [particleCount])
 
   useEffect(() => {
     if (disableAnimations || !cardRef.current) return
 
     const element = cardRef.current
+    const unobserve = geometry.observe(element)
+
+    // Tilt and magnetism retarget running tweens instead of starting new ones
+    gsap.set(element, { transformPerspective: 1000 })
+    const tiltX = gsap.quickTo(element, "rotateX", { duration: 0.1, ease: "power2.out" })
+    const tiltY = gsap.quickTo(element, "rotateY", { duration: 0.1, ease: "power2.out" })
+    const magnetX = gsap.quickTo(element, "x", { duration: MAGNET_DURATION, ease: "power2.out" })
+    const magnetY = gsap.quickTo(element, "y", { duration: MAGNET_DURATION, ease: "power2.out" })
+    // Tilt and magnetism move the card by transform, which the geometry cache
+    // cannot see; drop its rect so the next read (once per frame) is current,
+    // and once more when the card settles. The one settle call is restarted,
+    // not recreated, on every move.
+    const settle = gsap.delayedCall(MAGNET_DURATION, () => geometry.invalidate(element)).pause()
+    const moved = () => {
+      geometry.invalidate(element)
+      settle.restart(true)
+    }
 
     const handleMouseEnter = () => {
       isHoveredRef.current = true
       animateParticles()
 
       if (enableTilt) {
-        gsap.to(element, {
-          rotateX: 5,
-          rotateY: 5,
-          duration: 0.3,
-          ease: "power2.out",
-          transformPerspective: 1000,
-        })
+        countTween("magic-bento", 2)
+        tiltX(5)
+        tiltY(5)
       }
     }
 
@@ -191,63 +195,47 @@ const ParticleCard: React.FC<{
       clearAllParticles()
 
       if (enableTilt) {
-        gsap.to(element, {
-          rotateX: 0,
-          rotateY: 0,
-          duration: 0.3,
-          ease: "power2.out",
-        })
+        countTween("magic-bento", 2)
+        tiltX(0)
+        tiltY(0)
       }
 
       if (enableMagnetism) {
-        gsap.to(element, {
-          x: 0,
-          y: 0,
-          duration: 0.3,
-          ease: "power2.out",
-        })
+        countTween("magic-bento", 2)
+        magnetX(0)
+        magnetY(0)
       }
+      if (enableTilt || enableMagnetism) moved()
     }
 
-    const handleMouseMove = (e: MouseEvent) => {
-      if (!enableTilt && !enableMagnetism) return
+    // Runs at most once per frame, from the pointer listener every card shares
+    const handlePointer = ({ x: clientX, y: clientY }: PointerState) => {
+      if (!isHoveredRef.current || (!enableTilt && !enableMagnetism)) return
 
-      const rect = element.getBoundingClientRect()
-      const x = e.clientX - rect.left
-      const y = e.clientY - rect.top
+      const rect = geometry.rect(element)
+      const x = clientX - rect.left
+      const y = clientY - rect.top
       const centerX = rect.width / 2
       const centerY = rect.height / 2
 
       if (enableTilt) {
-        const rotateX = ((y - centerY) / centerY) * -10
-        const rotateY = ((x - centerX) / centerX) * 10
-
-        gsap.to(element, {
-          rotateX,
-          rotateY,
-          duration: 0.1,
-          ease: "power2.out",
-          transformPerspective: 1000,
-        })
+        countTween("magic-bento", 2)
+        tiltX(((y - centerY) / centerY) * -10)
+        tiltY(((x - centerX) / centerX) * 10)
       }
 
       if (enableMagnetism) {
-        const magnetX = (x - centerX) * 0.05
-        const magnetY = (y - centerY) * 0.05
-
-        magnetismAnimationRef.current = gsap.to(element, {
-          x: magnetX,
-          y: magnetY,
-          duration: 0.3,
-          ease: "power2.out",
-        })
+        countTween("magic-bento", 2)
+        magnetX((x - centerX) * 0.05)
+        magnetY((y - centerY) * 0.05)
       }
+      moved()
     }
 
     const handleClick = (e: MouseEvent) => {
       if (!clickEffect) return
 
-      const rect = element.getBoundingClientRect()
+      const rect = geometry.rect(element)
       const x = e.clientX - rect.left
       const y = e.clientY - rect.top
 
@@ -258,57 +246,64 @@ const ParticleCard: React.FC<{
         Math.hypot(x - rect.width, y - rect.height),
       )
 
-      const ripple = document.createElement("div")
-      ripple.style.cssText = `
-        position: absolute;
-        width: ${maxDistance * 2}px;
-        height: ${maxDistance * 2}px;
-        border-radius: 50%;
-        background: radial-gradient(circle, rgba(${glowColor}, 0.4) 0%, rgba(${glowColor}, 0.2) 30%, transparent 70%);
-        left: ${x - maxDistance}px;
-        top: ${y - maxDistance}px;
-        pointer-events: none;
-        z-index: 1000;
-      `
-
-      element.appendChild(ripple)
+      // One ripple per card, sized to reach every corner from any point and
+      // scaled down to this click's farthest corner
+      const reach = Math.hypot(rect.width, rect.height)
+      let ripple = rippleRef.current
+      if (!ripple) {
+        ripple = document.createElement("div")
+        ripple.className = "particle-ripple"
+        element.appendChild(ripple)
+        rippleRef.current = ripple
+      }
+      const size = `${reach * 2}px`
+      if (ripple.style.width !== size) {
+        ripple.style.width = size
+        ripple.style.height = size
+      }
 
+      countTween("magic-bento")
+      gsap.killTweensOf(ripple)
       gsap.fromTo(
         ripple,
         {
+          x: x - reach,
+          y: y - reach,
           scale: 0,
           opacity: 1,
         },
         {
-          scale: 1,
+          scale: maxDistance / reach,
           opacity: 0,
           duration: 0.8,
           ease: "power2.out",
-          onComplete: () => ripple.remove(),
         },
       )
     }
 
     element.addEventListener("mouseenter", handleMouseEnter)
     element.addEventListener("mouseleave", handleMouseLeave)
-    element.addEventListener("mousemove", handleMouseMove)
     element.addEventListener("click", handleClick)
+    const unsubscribe = subscribePointer(handlePointer, "magic-bento:card")
 
     return () => {
       isHoveredRef.current = false
       element.removeEventListener("mouseenter", handleMouseEnter)
       element.removeEventListener("mouseleave", handleMouseLeave)
-      element.removeEventListener("mousemove", handleMouseMove)
       element.removeEventListener("click", handleClick)
+      unsubscribe()
+      unobserve()
+      settle.kill()
       clearAllParticles()
     }
-  }, [animateParticles, clearAllParticles, disableAnimations, enableTilt, enableMagnetism, clickEffect, glowColor])
+  }, [animateParticles, clearAllParticles, disableAnimations, enableTilt, enableMagnetism, clickEffect])
 
   return (
     <div
       ref={cardRef}
+      data-testid={testId}
       className={`${className} particle-container`}
-      style={{ ...style, position: "relative", overflow: "hidden" }}
+      style={{ ...style, "--glow-color": glowColor, position: "relative", overflow: "hidden" } as React.CSSProperties}
     >
       {children}
     </div>
@@ -334,10 +329,17 @@ const GlobalSpotlight: React.FC<{
   useEffect(() => {
     if (disableAnimations || !gridRef?.current || !enabled) return
 
+    const grid = gridRef.current
+    const section = grid.closest(".bento-section")
+    const cards = Array.from(grid.querySelectorAll<HTMLElement>(".card"))
+    const unobserve = [...(section ? [section] : []), ...cards].map((el) => geometry.observe(el))
+
     const spotlight = document.createElement("div")
     spotlight.className = "global-spotlight"
     spotlight.style.cssText = `
       position: fixed;
+      left: 0;
+      top: 0;
       width: 800px;
       height: 800px;
       border-radius: 50%;
@@ -352,45 +354,57 @@ const GlobalSpotlight: React.FC<{
       );
       z-index: 200;
       opacity: 0;
-      transform: translate(-50%, -50%);
+      will-change: transform, opacity;
       mix-blend-mode: screen;
     `
     document.body.appendChild(spotlight)
     spotlightRef.current = spotlight
 
-    const handleMouseMove = (e: MouseEvent) => {
-      if (!spotlightRef.current || !gridRef.current) return
+    // Follow the pointer with transforms rather than left/top
+    gsap.set(spotlight, { xPercent: -50, yPercent: -50 })
+    const moveX = gsap.quickTo(spotlight, "x", { duration: 0.1, ease: "power2.out" })
+    const moveY = gsap.quickTo(spotlight, "y", { duration: 0.1, ease: "power2.out" })
+
+    let opacity = 0
+    const fadeTo = (target: number, duration: number) => {
+      if (Math.abs(target - opacity) < 0.01) return
+      opacity = target
+      countTween("magic-bento")
+      gsap.to(spotlight, { opacity: target, duration, ease: "power2.out", overwrite: "auto" })
+    }
 
-      const section = gridRef.current.closest(".bento-section")
-      const rect = section?.getBoundingClientRect()
-      const mouseInside =
-        rect && e.clientX >= rect.left && e.clientX <= rect.right && e.clientY >= rect.top && e.clientY <= rect.bottom
+    const clearGlow = () => {
+      if (!isInsideSection.current) return
+      isInsideSection.current = false
+      cards.forEach((card) => card.style.setProperty("--glow-intensity", "0"))
+      fadeTo(0, 0.3)
+    }
 
-      isInsideSection.current = mouseInside || false
-      const cards = gridRef.current.querySelectorAll(".card")
+    const handlePointer = (pointer: PointerState) => {
+      const rect = section ? geometry.rect(section) : null
+      const mouseInside =
+        pointer.inside &&
+        rect &&
+        pointer.x >= rect.left &&
+        pointer.x <= rect.left + rect.width &&
+        pointer.y >= rect.top &&
+        pointer.y <= rect.top + rect.height
 
       if (!mouseInside) {
-        gsap.to(spotlightRef.current, {
-          opacity: 0,
-          duration: 0.3,
-          ease: "power2.out",
-        })
-        cards.forEach((card) => {
-          ;(card as HTMLElement).style.setProperty("--glow-intensity", "0")
-        })
+        clearGlow()
         return
       }
+      isInsideSection.current = true
 
       const { proximity, fadeDistance } = calculateSpotlightValues(spotlightRadius)
       let minDistance = Number.POSITIVE_INFINITY
 
       cards.forEach((card) => {
-        const cardElement = card as HTMLElement
-        const cardRect = cardElement.getBoundingClientRect()
+        const cardRect = geometry.rect(card)
         const centerX = cardRect.left + cardRect.width / 2
         const centerY = cardRect.top + cardRect.height / 2
         const distance =
-          Math.hypot(e.clientX - centerX, e.clientY - centerY) - Math.max(cardRect.width, cardRect.height) / 2
+          Math.hypot(pointer.x - centerX, pointer.y - centerY) - Math.max(cardRect.width, cardRect.height) / 2
         const effectiveDistance = Math.max(0, distance)
 
         minDistance = Math.min(minDistance, effectiveDistance)
@@ -402,15 +416,12 @@ const GlobalSpotlight: React.FC<{
           glowIntensity = (fadeDistance - effectiveDistance) / (fadeDistance - proximity)
         }
 
-        updateCardGlowProperties(cardElement, e.clientX, e.clientY, glowIntensity, spotlightRadius)
+        updateCardGlowProperties(card, cardRect, pointer.x, pointer.y, glowIntensity, spotlightRadius)
       })
 
-      gsap.to(spotlightRef.current, {
-        left: e.clientX,
-        top: e.clientY,
-        duration: 0.1,
-        ease: "power2.out",
-      })
+      countTween("magic-bento", 2)
+      moveX(pointer.x)
+      moveY(pointer.y)
 
       const targetOpacity =
         minDistance <= proximity
@@ -419,34 +430,17 @@ const GlobalSpotlight: React.FC<{
             ? ((fadeDistance - minDistance) / (fadeDistance - proximity)) * 0.8
             : 0
 
-      gsap.to(spotlightRef.current, {
-        opacity: targetOpacity,
-        duration: targetOpacity > 0 ? 0.2 : 0.5,
-        ease: "power2.out",
-      })
-    }
-
-    const handleMouseLeave = () => {
-      isInsideSection.current = false
-      gridRef.current?.querySelectorAll(".card").forEach((card) => {
-        ;(card as HTMLElement).style.setProperty("--glow-intensity", "0")
-      })
-      if (spotlightRef.current) {
-        gsap.to(spotlightRef.current, {
-          opacity: 0,
-          duration: 0.3,
-          ease: "power2.out",
-        })
-      }
+      fadeTo(targetOpacity, targetOpacity > 0 ? 0.2 : 0.5)
     }
 
-    document.addEventListener("mousemove", handleMouseMove)
-    document.addEventListener("mouseleave", handleMouseLeave)
+    const unsubscribe = subscribePointer(handlePointer, "magic-bento:spotlight")
 
     return () => {
-      document.removeEventListener("mousemove", handleMouseMove)
-      document.removeEventListener("mouseleave", handleMouseLeave)
-      spotlightRef.current?.parentNode?.removeChild(spotlightRef.current)
+      unsubscribe()
+      unobserve.forEach((stop) => stop())
+      gsap.killTweensOf(spotlight)
+      spotlight.remove()
+      spotlightRef.current = null
     }
   }, [gridRef, disableAnimations, enabled, spotlightRadius, glowColor])
 
@@ -490,6 +484,7 @@ const MagicBento: React.FC<BentoProps> = ({
   clickEffect = true,
   enableMagnetism = true,
   cardData = [],
+  testIdPrefix = "bento",
 }) => {
   const gridRef = useRef<HTMLDivElement>(null)
   const isMobile = useMobileDetection()
@@ -512,6 +507,7 @@ const MagicBento: React.FC<BentoProps> = ({
           const baseClassName = `card cursor-target ${textAutoHide ? "card--text-autohide" : ""} ${enableBorderGlow ? "card--border-glow" : ""}`
           const cardProps = {
             className: baseClassName,
+            testId: `${testIdPrefix}-card-${index}`,
             style: {
               backgroundColor: card.color,
               "--glow-color": glowColor,
@@ -542,7 +538,7 @@ const MagicBento: React.FC<BentoProps> = ({
           }
 
           return (
-            <div key={index} {...cardProps}>
+            <div key={index} className={cardProps.className} style={cardProps.style} data-testid={cardProps.testId}>
               <div className="card__header">
                 <div className="card__label">{card.label}</div>
               </div>
@@ -0,0 +1,43 @@
+"use client"
+
+import { VscHome, VscAccount, VscMail, VscCode, VscTools, VscGithub } from "react-icons/vsc"
+import Dock from "@/components/dock"
+import { scrollToSection } from "@/lib/scroll"
+
+// Dock items configuration
+const dockItems = [
+  {
+    icon: <VscHome size={18} />,
+    label: "Home",
+    onClick: () => scrollToSection("hero"),
+  },
+  {
+    icon: <VscAccount size={18} />,
+    label: "About",
+    onClick: () => scrollToSection("about"),
+  },
+  {
+    icon: <VscTools size={18} />,
+    label: "Skills",
+    onClick: () => scrollToSection("skills"),
+  },
+  {
+    icon: <VscCode size={18} />,
+    label: "Projects",
+    onClick: () => scrollToSection("projects"),
+  },
+  {
+    icon: <VscMail size={18} />,
+    label: "Contact",
+    onClick: () => scrollToSection("contact"),
+  },
+  {
+    icon: <VscGithub size={18} />,
+    label: "GitHub",
+    onClick: () => window.open("https://github.com/Xyerophyte", "_blank"),
+  },
+]
+
+export default function PortfolioDock() {
+  return <Dock items={dockItems} panelHeight={68} baseItemSize={50} magnification={70} distance={150} />
+}
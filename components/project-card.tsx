@@ -0,0 +1,124 @@
+import { ExternalLink, Github } from "lucide-react"
+import type { Project } from "@/lib/projects"
+
+// Static card markup, rendered on the server. Clicks are handled by
+// ProjectFilter, which finds the card through data-project-id.
+export default function ProjectCard({
+  project,
+  index,
+  views,
+  featured = false,
+}: {
+  project: Project
+  // Position in the catalog, for data-testid
+  index: number
+  // Filter views this card is shown in
+  views: string[]
+  featured?: boolean
+}) {
+  const shownTechnologies = featured ? 4 : 3
+
+  return (
+    <div
+      className={`cursor-target group cursor-pointer bg-gray-900/50 rounded-2xl overflow-hidden border border-gray-800 hover:border-purple-500/50 transition-all duration-300 transform hover:scale-[1.02] backdrop-blur-sm ${
+        featured ? "ring-2 ring-purple-500/20 md:col-span-1" : ""
+      }`}
+      data-project-id={project.id}
+      data-views={views.join(" ")}
+      data-testid={`project-card-${index}`}
+    >
+      <div className="relative overflow-hidden">
+        <div
+          className={`w-full ${featured ? "h-56" : "h-48"} bg-gradient-to-br from-purple-500/20 via-pink-500/20 to-blue-500/20 flex items-center justify-center`}
+        >
+          <div className="text-center">
+            <div className={`${featured ? "text-5xl" : "text-4xl"} mb-2`}>{project.icon}</div>
+            <div className="text-sm text-gray-400">{project.category}</div>
+          </div>
+        </div>
+        <div className="absolute top-4 left-4">
+          <span
+            className={`px-2 py-1 text-xs font-medium rounded-full ${
+              project.status === "completed"
+                ? "bg-green-500/20 text-green-400 border border-green-500/30"
+                : project.status === "in-progress"
+                  ? "bg-yellow-500/20 text-yellow-400 border border-yellow-500/30"
+                  : "bg-blue-500/20 text-blue-400 border border-blue-500/30"
+            }`}
+          >
+            {project.status === "completed" ? "Live" : project.status === "in-progress" ? "In Progress" : "Planned"}
+          </span>
+        </div>
+        <div className="absolute top-4 right-4">
+          <span className="px-2 py-1 text-xs font-medium rounded-full bg-purple-500/20 text-purple-400 border border-purple-500/30">
+            {project.category}
+          </span>
+        </div>
+        {featured && (
+          <div className="absolute bottom-4 left-4">
+            <span className="px-2 py-1 text-xs font-medium rounded-full bg-yellow-500/20 text-yellow-400 border border-yellow-500/30">
+              ⭐ Featured
+            </span>
+          </div>
+        )}
+      </div>
+
+      <div className={`${featured ? "p-8" : "p-6"}`}>
+        <h3
+          className={`${featured ? "text-2xl" : "text-xl"} font-bold mb-2 group-hover:text-purple-400 transition-colors`}
+        >
+          {project.title}
+        </h3>
+        <p className={`text-gray-400 mb-4 ${featured ? "text-base" : "text-sm"} line-clamp-2`}>{project.description}</p>
+
+        <div className="flex flex-wrap gap-2 mb-4">
+          {project.technologies.slice(0, shownTechnologies).map((tech) => (
+            <span key={tech} className="px-2 py-1 text-xs bg-gray-800/50 text-gray-300 rounded-md">
+              {tech}
+            </span>
+          ))}
+          {project.technologies.length > shownTechnologies && (
+            <span className="px-2 py-1 text-xs bg-gray-800/50 text-gray-300 rounded-md">
+              +{project.technologies.length - shownTechnologies} more
+            </span>
+          )}
+        </div>
+
+        <div className="flex items-center justify-between">
+          <button
+            className="text-purple-400 hover:text-purple-300 text-sm font-medium"
+            data-testid={`project-card-${index}-details`}
+          >
+            View Details →
+          </button>
+          <div className="flex gap-2">
+            {project.liveUrl && (
+              <a
+                href={project.liveUrl}
+                target="_blank"
+                rel="noopener noreferrer"
+                className="cursor-target p-2 bg-gray-800/50 hover:bg-gray-700/50 rounded-lg transition-colors"
+                title="Live Demo"
+                data-testid={`project-card-${index}-live-demo`}
+              >
+                <ExternalLink size={16} />
+              </a>
+            )}
+            {project.githubUrl && (
+              <a
+                href={project.githubUrl}
+                target="_blank"
+                rel="noopener noreferrer"
+                className="cursor-target p-2 bg-gray-800/50 hover:bg-gray-700/50 rounded-lg transition-colors"
+                title="View Source"
+                data-testid={`project-card-${index}-source`}
+              >
+                <Github size={16} />
+              </a>
+            )}
+          </div>
+        </div>
+      </div>
+    </div>
+  )
+}
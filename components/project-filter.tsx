@@ -0,0 +1,61 @@
+"use client"
+
+import type React from "react"
+import { useState } from "react"
+import dynamic from "next/dynamic"
+
+// The modal, and the long descriptions it shows, load on the first click
+const ProjectModal = dynamic(() => import("@/components/project-modal"), { ssr: false })
+
+/**
+ * Category buttons and the details modal around the server-rendered cards in
+ * `children`. Selecting a category sets data-view, which the showcase's view
+ * styles turn into card visibility; the cards themselves never re-render.
+ */
+export default function ProjectFilter({
+  categories,
+  children,
+}: {
+  categories: readonly string[]
+  children: React.ReactNode
+}) {
+  const [selectedCategory, setSelectedCategory] = useState(categories[0])
+  const [selectedProjectId, setSelectedProjectId] = useState<string | null>(null)
+
+  // A click anywhere on a card except its links opens that project's details
+  const handleClick = (e: React.MouseEvent<HTMLDivElement>) => {
+    const target = e.target as Element
+    if (target.closest("a")) return
+    const card = target.closest<HTMLElement>("[data-project-id]")
+    if (card?.dataset.projectId) setSelectedProjectId(card.dataset.projectId)
+  }
+
+  return (
+    <div className="project-showcase space-y-8" data-view={selectedCategory} onClick={handleClick}>
+      {/* Category Filter */}
+      <div className="flex flex-wrap justify-center gap-2 mb-8">
+        {categories.map((category, index) => (
+          <button
+            key={category}
+            data-testid={`project-filter-${index}`}
+            onClick={() => setSelectedCategory(category)}
+            className={`px-4 py-2 rounded-full text-sm font-medium transition-all duration-300 ${
+              selectedCategory === category
+                ? "bg-purple-500 text-white"
+                : "bg-gray-800/50 text-gray-300 hover:bg-gray-700/50"
+            }`}
+          >
+            {category}
+          </button>
+        ))}
+      </div>
+
+      {children}
+
+      {/* Project Modal */}
+      {selectedProjectId && (
+        <ProjectModal projectId={selectedProjectId} onClose={() => setSelectedProjectId(null)} />
+      )}
+    </div>
+  )
+}
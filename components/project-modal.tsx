@@ -0,0 +1,161 @@
+"use client"
+
+import { ExternalLink, Github } from "lucide-react"
+import details from "@/data/project-details.json"
+import { getProject, type ProjectDetails } from "@/lib/projects"
+
+// This module is only loaded when a card is first opened, so the long
+// descriptions travel with it rather than with the page
+const PROJECT_DETAILS: Record<string, ProjectDetails> = details as Record<string, ProjectDetails>
+
+const HIGHLIGHT_TONES: Record<NonNullable<ProjectDetails["highlights"]>["tone"], { box: string; title: string }> = {
+  green: { box: "bg-green-900/20 border-green-500/30", title: "text-green-400" },
+  pink: { box: "bg-pink-900/20 border-pink-500/30", title: "text-pink-400" },
+}
+
+export default function ProjectModal({
+  projectId,
+  onClose,
+}: {
+  projectId: string
+  onClose: () => void
+}) {
+  const project = getProject(projectId)
+  if (!project) return null
+  const details = PROJECT_DETAILS[project.id]
+  const highlights = details?.highlights
+
+  return (
+    <div
+      className="fixed inset-0 bg-black/80 backdrop-blur-sm z-50 flex items-center justify-center p-4"
+      data-testid="project-modal"
+    >
+      <div className="bg-gray-900 rounded-2xl max-w-4xl w-full max-h-[90vh] overflow-y-auto border border-gray-800">
+        <div className="relative">
+          <div className="w-full h-64 md:h-80 bg-gradient-to-br from-purple-500/20 via-pink-500/20 to-blue-500/20 flex items-center justify-center">
+            <div className="text-center">
+              <div className="text-6xl mb-4">{project.icon}</div>
+              <div className="text-xl text-gray-300">{project.title}</div>
+              <div className="text-sm text-gray-400 mt-2">{project.category}</div>
+            </div>
+          </div>
+          <button
+            onClick={onClose}
+            data-testid="project-modal-close"
+            className="absolute top-4 right-4 p-2 bg-black/50 hover:bg-black/70 rounded-full transition-colors text-white"
+          >
+            ✕
+          </button>
+        </div>
+
+        <div className="p-6 md:p-8">
+          <div className="flex items-start justify-between mb-4">
+            <div>
+              <h2 className="text-2xl md:text-3xl font-bold mb-2">{project.title}</h2>
+              <div className="flex items-center gap-4 flex-wrap">
+                <span
+                  className={`px-3 py-1 text-sm font-medium rounded-full ${
+                    project.status === "completed"
+                      ? "bg-green-500/20 text-green-400 border border-green-500/30"
+                      : project.status === "in-progress"
+                        ? "bg-yellow-500/20 text-yellow-400 border border-yellow-500/30"
+                        : "bg-blue-500/20 text-blue-400 border border-blue-500/30"
+                  }`}
+                >
+                  {project.status === "completed"
+                    ? "✅ Completed"
+                    : project.status === "in-progress"
+                      ? "🚧 In Development"
+                      : "📋 Planned"}
+                </span>
+                <span className="px-3 py-1 text-sm font-medium rounded-full bg-purple-500/20 text-purple-400 border border-purple-500/30">
+                  {project.category}
+                </span>
+                {project.featured && (
+                  <span className="px-3 py-1 text-sm font-medium rounded-full bg-yellow-500/20 text-yellow-400 border border-yellow-500/30">
+                    ⭐ Featured
+                  </span>
+                )}
+              </div>
+            </div>
+
+            <div className="flex gap-3 flex-shrink-0">
+              {project.liveUrl && (
+                <a
+                  href={project.liveUrl}
+                  target="_blank"
+                  rel="noopener noreferrer"
+                  className="flex items-center gap-2 px-4 py-2 bg-purple-500 hover:bg-purple-600 rounded-lg transition-colors text-white"
+                >
+                  <ExternalLink size={16} />
+                  Live Demo
+                </a>
+              )}
+              {project.githubUrl && (
+                <a
+                  href={project.githubUrl}
+                  target="_blank"
+                  rel="noopener noreferrer"
+                  className="flex items-center gap-2 px-4 py-2 bg-gray-800 hover:bg-gray-700 rounded-lg transition-colors text-white"
+                >
+                  <Github size={16} />
+                  Source Code
+                </a>
+              )}
+            </div>
+          </div>
+
+          <p className="text-gray-300 mb-6 leading-relaxed text-lg">{details?.longDescription ?? project.description}</p>
+
+          <div>
+            <h3 className="text-lg font-semibold mb-3">🛠️ Technologies Used</h3>
+            <div className="flex flex-wrap gap-2">
+              {project.technologies.map((tech) => (
+                <span key={tech} className="px-3 py-1 bg-gray-800/50 text-gray-300 rounded-lg text-sm font-medium">
+                  {tech}
+                </span>
+              ))}
+            </div>
+          </div>
+
+          {/* Project highlights, from data/project-details.json */}
+          {highlights && (
+            <div className={`mt-6 p-4 rounded-lg border ${HIGHLIGHT_TONES[highlights.tone].box}`}>
+              <h4 className={`text-md font-semibold mb-2 ${HIGHLIGHT_TONES[highlights.tone].title}`}>{highlights.title}</h4>
+              <ul className="text-sm text-gray-300 space-y-1">
+                {highlights.items.map((item) => (
+                  <li key={item}>• {item}</li>
+                ))}
+              </ul>
+            </div>
+          )}
+
+          {/* GitHub Stats (if available) */}
+          <div className="mt-6 p-4 bg-gray-800/30 rounded-lg border border-gray-700">
+            <h4 className="text-md font-semibold mb-2 text-gray-300">📊 Project Info</h4>
+            <div className="grid grid-cols-2 md:grid-cols-4 gap-4 text-sm">
+              <div>
+                <span className="text-gray-400">Status:</span>
+                <div className="font-medium text-white capitalize">{project.status.replace("-", " ")}</div>
+              </div>
+              <div>
+                <span className="text-gray-400">Category:</span>
+                <div className="font-medium text-white">{project.category}</div>
+              </div>
+              <div>
+                <span className="text-gray-400">Tech Stack:</span>
+                <div className="font-medium text-white">{project.technologies.length} technologies</div>
+              </div>
+              <div>
+                <span className="text-gray-400">Links:</span>
+                <div className="font-medium text-white">
+                  {project.liveUrl && project.githubUrl ? "Demo + Code" : project.liveUrl ? "Demo" : "Code"}
+                </div>
+              </div>
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+  )
+}
@@ -2,8 +2,10 @@
 
 import type React from "react"
 
-import { useEffect, useRef, useState } from "react"
-import { gsap } from "gsap"
+import { useEffect, useRef } from "react"
+import { geometry } from "@/lib/geometry-cache"
+import { countTween } from "@/lib/perf-monitor"
+import { observeVisibility } from "@/lib/visibility-observer"
 
 interface ScrollRevealProps {
   children: React.ReactNode
@@ -16,6 +18,97 @@ interface ScrollRevealProps {
   triggerOnce?: boolean
 }
 
+const REVEAL_ROOT_MARGIN = "0px 0px -50px 0px"
+// Elements that come into view in the same frame reveal one after another
+const REVEAL_STAGGER = 0.08
+
+interface RevealItem {
+  element: HTMLElement
+  hidden: gsap.TweenVars
+  delay: number
+  duration: number
+  // The state the element is animating (or has animated) to; null until the
+  // observer's first report
+  visible: boolean | null
+}
+
+const getHiddenState = (direction: ScrollRevealProps["direction"], distance: number): gsap.TweenVars => {
+  switch (direction) {
+    case "up":
+      return { y: distance, opacity: 0 }
+    case "down":
+      return { y: -distance, opacity: 0 }
+    case "left":
+      return { x: distance, opacity: 0 }
+    case "right":
+      return { x: -distance, opacity: 0 }
+    case "fade":
+      return { opacity: 0 }
+    default:
+      return { y: distance, opacity: 0 }
+  }
+}
+
+// The page is server-rendered visible and nothing moves until an element
+// leaves or enters the viewport, so GSAP is fetched after hydration instead
+// of shipping in the first-load JavaScript. Observing starts once it is here.
+type Gsap = (typeof import("gsap"))["gsap"]
+let gsapLib: Gsap | null = null
+let gsapLoading: Promise<Gsap> | null = null
+
+function loadGsap(): Promise<Gsap> {
+  gsapLoading ??= import("gsap").then((module) => (gsapLib = module.gsap))
+  return gsapLoading
+}
+
+// Visibility changes are collected and animated together on the next frame,
+// in one timeline, so a fast scroll costs one timeline per frame rather than
+// a tween (and a React render) per element per flip
+const pending = new Map<RevealItem, boolean>()
+let flushFrame = 0
+
+function flushReveals() {
+  flushFrame = 0
+  const gsap = gsapLib!
+  // The tweens move content by transform; cached rects inside are stale once they land
+  const timeline = gsap.timeline({ onComplete: () => geometry.invalidate() })
+  let entering = 0
+
+  pending.forEach((visible, item) => {
+    gsap.killTweensOf(item.element)
+    if (visible) {
+      timeline.to(
+        item.element,
+        { x: 0, y: 0, opacity: 1, duration: item.duration, ease: "power2.out" },
+        item.delay + entering++ * REVEAL_STAGGER,
+      )
+    } else {
+      // Slightly faster exit, with no delay
+      timeline.to(item.element, { ...item.hidden, duration: item.duration * 0.6, ease: "power2.in" }, 0)
+    }
+  })
+
+  countTween("scroll-reveal", pending.size)
+  pending.clear()
+}
+
+function setRevealed(gsap: Gsap, item: RevealItem, visible: boolean) {
+  if (item.visible === null) {
+    // First report. The page is server-rendered visible, so whatever is
+    // already on screen stays put; only what starts off screen is hidden,
+    // where the change cannot be seen or shift anything above the fold.
+    item.visible = visible
+    if (!visible) gsap.set(item.element, item.hidden)
+    return
+  }
+  if (item.visible === visible) return
+  item.visible = visible
+  // Flipping back before the frame leaves the element where it already is
+  if (pending.has(item)) pending.delete(item)
+  else pending.set(item, visible)
+  if (pending.size > 0 && !flushFrame) flushFrame = requestAnimationFrame(flushReveals)
+}
+
 export default function ScrollReveal({
   children,
   direction = "up",
@@ -27,92 +120,33 @@ export default function ScrollReveal({
   triggerOnce = false, // Changed default to false for bidirectional
 }: ScrollRevealProps) {
   const elementRef = useRef<HTMLDivElement>(null)
-  const [isVisible, setIsVisible] = useState(false)
-  const observerRef = useRef<IntersectionObserver | null>(null)
 
   useEffect(() => {
     const element = elementRef.current
     if (!element) return
 
-    // Set initial state based on direction
-    const getInitialTransform = () => {
-      switch (direction) {
-        case "up":
-          return { y: distance, opacity: 0 }
-        case "down":
-          return { y: -distance, opacity: 0 }
-        case "left":
-          return { x: distance, opacity: 0 }
-        case "right":
-          return { x: -distance, opacity: 0 }
-        case "fade":
-          return { opacity: 0 }
-        default:
-          return { y: distance, opacity: 0 }
-      }
-    }
-
-    const getVisibleTransform = () => {
-      return { x: 0, y: 0, opacity: 1 }
-    }
-
-    // Set initial transform
-    gsap.set(element, getInitialTransform())
-
-    // Cleanup previous observer if exists
-    if (observerRef.current) {
-      observerRef.current.disconnect()
-    }
-
-    const observer = new IntersectionObserver(
-      (entries) => {
-        entries.forEach((entry) => {
-          if (entry.isIntersecting && !isVisible) {
-            setIsVisible(true)
-
-            // Animate to visible state
-            gsap.to(element, {
-              ...getVisibleTransform(),
-              duration,
-              delay,
-              ease: "power2.out",
-            })
-
-            if (triggerOnce) {
-              observer.unobserve(element)
-            }
-          } else if (!entry.isIntersecting && !triggerOnce) {
-            if (isVisible) {
-              setIsVisible(false)
-              // Animate back to hidden state
-              gsap.to(element, {
-                ...getInitialTransform(),
-                duration: duration * 0.6, // Slightly faster exit animation
-                delay: 0, // No delay for exit
-                ease: "power2.in",
-              })
-            }
-          }
-        })
-      },
-      {
-        threshold,
-        rootMargin: "0px 0px -50px 0px",
-      },
-    )
-
-    observerRef.current = observer
-    observer.observe(element)
+    const item: RevealItem = { element, hidden: getHiddenState(direction, distance), delay, duration, visible: null }
+    let stopObserving = () => {}
+    let cancelled = false
+
+    loadGsap().then((gsap) => {
+      if (cancelled) return
+      stopObserving = observeVisibility(
+        element,
+        (visible) => {
+          if (!visible && triggerOnce && item.visible !== null) return
+          setRevealed(gsap, item, visible)
+          if (visible && triggerOnce) stopObserving()
+        },
+        { threshold, rootMargin: REVEAL_ROOT_MARGIN },
+      )
+    })
 
     return () => {
-      // Kill any ongoing GSAP animations to prevent memory leaks
-      gsap.killTweensOf(element)
-
-      // Disconnect observer
-      if (observerRef.current) {
-        observerRef.current.disconnect()
-        observerRef.current = null
-      }
+      cancelled = true
+      stopObserving()
+      pending.delete(item)
+      gsapLib?.killTweensOf(element)
     }
   }, [direction, delay, duration, distance, threshold, triggerOnce])
 
@@ -1,5 +1,9 @@
-import React, { useEffect, useRef, useCallback, useMemo } from "react";
+import React, { useEffect, useRef } from "react";
 import { gsap } from "gsap";
+import { mountCursor, type CursorRendererFactory } from "@/lib/cursor-renderer";
+import { countTween } from "@/lib/perf-monitor";
+import { geometry, type Box } from "@/lib/geometry-cache";
+import type { PointerState } from "@/lib/pointer-tracker";
 import "./target-cursor.css";
 
 export interface TargetCursorProps {
@@ -8,349 +12,207 @@ export interface TargetCursorProps {
   hideDefaultCursor?: boolean;
 }
 
-const TargetCursor: React.FC<TargetCursorProps> = ({
-  targetSelector = ".cursor-target",
-  spinDuration = 2,
-  hideDefaultCursor = true,
-}) => {
-  const cursorRef = useRef<HTMLDivElement>(null);
-  const cornersRef = useRef<NodeListOf<HTMLDivElement>>(null);
-  const spinTl = useRef<gsap.core.Timeline>(null);
-
-  const constants = useMemo(
-    () => ({
-      borderWidth: 3,
-      cornerSize: 12,
-      parallaxStrength: 0.00005,
-    }),
-    []
-  );
+const contains = (rect: Box, x: number, y: number) =>
+  x >= rect.left && x <= rect.left + rect.width && y >= rect.top && y <= rect.top + rect.height;
 
-  const moveCursor = useCallback((x: number, y: number) => {
-    if (!cursorRef.current) return;
-    // Only kill position tweens (x, y) to preserve rotation animation
-    gsap.killTweensOf(cursorRef.current, "x,y");
-    // Use to() instead of set() to maintain smooth movement while preserving rotation
-    gsap.to(cursorRef.current, {
-      x,
-      y,
-      duration: 0.1,
-      ease: "power3.out",
-    });
-  }, []);
-
-  useEffect(() => {
-    if (!cursorRef.current) return;
+interface TargetCursorOptions {
+  targetSelector: string;
+  spinDuration: number;
+  hideDefaultCursor: boolean;
+}
 
-    const originalCursor = document.body.style.cursor;
-    if (hideDefaultCursor) {
-      document.body.style.cursor = 'none';
+const BORDER_WIDTH = 3;
+const CORNER_SIZE = 12;
+const PARALLAX_STRENGTH = 0.00005;
+
+// Spinning crosshair that locks its corners onto the target under the pointer
+export const createTargetCursor: CursorRendererFactory<TargetCursorOptions> = (
+  cursor,
+  { targetSelector, spinDuration, hideDefaultCursor }
+) => {
+  // target-cursor.css hides the cursor everywhere; this covers the page
+  // before the stylesheet applies
+  const originalCursor = document.body.style.cursor;
+  if (hideDefaultCursor) {
+    document.body.style.cursor = "none";
+    document.documentElement.style.cursor = "none";
+  }
+
+  const corners = Array.from(cursor.querySelectorAll<HTMLDivElement>(".target-cursor-corner"));
+  let spinTl: gsap.core.Timeline | null = null;
+
+  gsap.set(cursor, {
+    xPercent: -50,
+    yPercent: -50,
+    x: window.innerWidth / 2,
+    y: window.innerHeight / 2,
+  });
+
+  // Every position follows its latest target through one long-lived tween
+  // instead of a new tween per event
+  const moveX = gsap.quickTo(cursor, "x", { duration: 0.1, ease: "power3.out" });
+  const moveY = gsap.quickTo(cursor, "y", { duration: 0.1, ease: "power3.out" });
+  const cornerTo = corners.map((corner) => ({
+    x: gsap.quickTo(corner, "x", { duration: 0.2, ease: "power2.out" }),
+    y: gsap.quickTo(corner, "y", { duration: 0.2, ease: "power2.out" }),
+  }));
+
+  const createSpinTimeline = () => {
+    spinTl?.kill();
+    spinTl = gsap.timeline({ repeat: -1 }).to(cursor, { rotation: "+=360", duration: spinDuration, ease: "none" });
+    return spinTl;
+  };
+
+  createSpinTimeline();
+
+  let activeTarget: Element | null = null;
+  let unobserveTarget: (() => void) | null = null;
+  let resumeTimeout: ReturnType<typeof setTimeout> | null = null;
+
+  // Corner offsets from the cursor's animated centre, all from cached geometry
+  const updateCorners = (rect: Box, mouseX?: number, mouseY?: number) => {
+    const cursorCenterX = gsap.getProperty(cursor, "x") as number;
+    const cursorCenterY = gsap.getProperty(cursor, "y") as number;
+
+    const left = rect.left - cursorCenterX - BORDER_WIDTH;
+    const top = rect.top - cursorCenterY - BORDER_WIDTH;
+    const right = rect.left + rect.width - cursorCenterX + BORDER_WIDTH - CORNER_SIZE;
+    const bottom = rect.top + rect.height - cursorCenterY + BORDER_WIDTH - CORNER_SIZE;
+
+    let parallaxX = 0;
+    let parallaxY = 0;
+    if (mouseX !== undefined && mouseY !== undefined) {
+      parallaxX = (mouseX - (rect.left + rect.width / 2)) * PARALLAX_STRENGTH;
+      parallaxY = (mouseY - (rect.top + rect.height / 2)) * PARALLAX_STRENGTH;
     }
 
-    // Hide cursor on any hover - more aggressive approach
-    const hideCursorOnHover = () => {
-      document.body.style.cursor = 'none';
-      document.documentElement.style.cursor = 'none';
-    };
-
-    // Add event listeners to hide cursor on any hover
-    document.addEventListener('mouseenter', hideCursorOnHover);
-    document.addEventListener('mouseover', hideCursorOnHover);
-    document.addEventListener('mousemove', hideCursorOnHover);
-
-    const cursor = cursorRef.current;
-    const corners = cursor.querySelectorAll<HTMLDivElement>(
-      ".target-cursor-corner"
-    );
-    (cornersRef as any).current = corners;
-
-    let activeTarget: Element | null = null;
-    let currentTargetMove: ((ev: Event) => void) | null = null;
-    let currentLeaveHandler: (() => void) | null = null;
-    let isAnimatingToTarget = false;
-    let resumeTimeout: ReturnType<typeof setTimeout> | null = null;
-
-    const cleanupTarget = (target: Element) => {
-      if (currentTargetMove) {
-        target.removeEventListener("mousemove", currentTargetMove);
-      }
-      if (currentLeaveHandler) {
-        target.removeEventListener("mouseleave", currentLeaveHandler);
-      }
-      currentTargetMove = null;
-      currentLeaveHandler = null;
-    };
-
-    gsap.set(cursor, {
-      xPercent: -50,
-      yPercent: -50,
-      x: window.innerWidth / 2,
-      y: window.innerHeight / 2,
+    const offsets = [
+      [left, top],
+      [right, top],
+      [right, bottom],
+      [left, bottom],
+    ];
+    countTween("target-cursor", corners.length);
+    cornerTo.forEach((to, index) => {
+      to.x(offsets[index][0] + parallaxX);
+      to.y(offsets[index][1] + parallaxY);
     });
+  };
 
-    const createSpinTimeline = () => {
-      if (spinTl.current) {
-        spinTl.current.kill();
-      }
-      const timeline = gsap
-        .timeline({ repeat: -1 })
-        .to(cursor, { rotation: "+=360", duration: spinDuration, ease: "none" });
-      (spinTl as any).current = timeline;
-    };
-
-    createSpinTimeline();
-
-    // Throttle mousemove for better performance
-    let rafId: number | null = null;
-    const moveHandler = (e: MouseEvent) => {
-      if (rafId) return;
-      rafId = requestAnimationFrame(() => {
-        moveCursor(e.clientX, e.clientY);
-        rafId = null;
-      });
-    };
-    window.addEventListener("mousemove", moveHandler, { passive: true });
-
-    // Throttle scroll handler for better performance
-    let scrollRafId: number | null = null;
-    const scrollHandler = () => {
-      if (!activeTarget || !cursorRef.current || scrollRafId) return;
-      
-      scrollRafId = requestAnimationFrame(() => {
-        const mouseX = gsap.getProperty(cursorRef.current!, "x") as number;
-        const mouseY = gsap.getProperty(cursorRef.current!, "y") as number;
-        
-        const elementUnderMouse = document.elementFromPoint(mouseX, mouseY);
-        const isStillOverTarget = elementUnderMouse && (
-          elementUnderMouse === activeTarget || 
-          elementUnderMouse.closest(targetSelector) === activeTarget
-        );
-        
-        if (!isStillOverTarget && currentLeaveHandler) {
-          currentLeaveHandler();
-        }
-        scrollRafId = null;
-      });
-    };
-
-    window.addEventListener("scroll", scrollHandler, { passive: true });
-
-    const enterHandler = (e: MouseEvent) => {
-      const directTarget = e.target as Element;
-
-      const allTargets: Element[] = [];
-      let current = directTarget;
-      while (current && current !== document.body) {
-        if (current.matches(targetSelector)) {
-          allTargets.push(current);
-        }
-        current = current.parentElement!;
-      }
-
-      const target = allTargets[0] || null;
-      if (!target || !cursorRef.current || !cornersRef.current) return;
+  const enterTarget = (target: Element) => {
+    if (resumeTimeout) {
+      clearTimeout(resumeTimeout);
+      resumeTimeout = null;
+    }
 
-      if (activeTarget === target) return;
+    activeTarget = target;
+    unobserveTarget = geometry.observe(target);
+
+    gsap.killTweensOf(cursor, "rotation");
+    spinTl?.pause();
+    gsap.set(cursor, { rotation: 0 });
+
+    updateCorners(geometry.rect(target));
+  };
+
+  const leaveTarget = () => {
+    activeTarget = null;
+    unobserveTarget?.();
+    unobserveTarget = null;
+
+    const positions = [
+      { x: -CORNER_SIZE * 1.5, y: -CORNER_SIZE * 1.5 },
+      { x: CORNER_SIZE * 0.5, y: -CORNER_SIZE * 1.5 },
+      { x: CORNER_SIZE * 0.5, y: CORNER_SIZE * 0.5 },
+      { x: -CORNER_SIZE * 1.5, y: CORNER_SIZE * 0.5 },
+    ];
+    countTween("target-cursor", corners.length);
+    cornerTo.forEach((to, index) => {
+      to.x(positions[index].x);
+      to.y(positions[index].y);
+    });
 
-      if (activeTarget) {
-        cleanupTarget(activeTarget);
+    resumeTimeout = setTimeout(() => {
+      if (!activeTarget && spinTl) {
+        const currentRotation = gsap.getProperty(cursor, "rotation") as number;
+        const normalizedRotation = currentRotation % 360;
+
+        const timeline = createSpinTimeline();
+        timeline.pause();
+        countTween("target-cursor", 2);
+
+        gsap.to(cursor, {
+          rotation: normalizedRotation + 360,
+          duration: spinDuration * (1 - normalizedRotation / 360),
+          ease: "none",
+          onComplete: () => {
+            timeline.restart();
+          },
+        });
       }
-
-      if (resumeTimeout) {
-        clearTimeout(resumeTimeout);
-        resumeTimeout = null;
+      resumeTimeout = null;
+    }, 50);
+  };
+
+  return {
+    // All pointer work happens here, at most once per frame: follow the
+    // pointer, work out which target it is over, and place the corners
+    frame(pointer: PointerState) {
+      if (pointer.moved) {
+        countTween("target-cursor");
+        moveX(pointer.x);
+        moveY(pointer.y);
       }
 
-      activeTarget = target;
-
-      gsap.killTweensOf(cursorRef.current, "rotation");
-      spinTl.current?.pause();
-
-      gsap.set(cursorRef.current, { rotation: 0 });
-
-      const updateCorners = (mouseX?: number, mouseY?: number) => {
-        const rect = target.getBoundingClientRect();
-        const cursorRect = cursorRef.current!.getBoundingClientRect();
-
-        const cursorCenterX = cursorRect.left + cursorRect.width / 2;
-        const cursorCenterY = cursorRect.top + cursorRect.height / 2;
-
-        const [tlc, trc, brc, blc] = Array.from(cornersRef.current!);
-
-        const { borderWidth, cornerSize, parallaxStrength } = constants;
-
-        let tlOffset = {
-          x: rect.left - cursorCenterX - borderWidth,
-          y: rect.top - cursorCenterY - borderWidth,
-        };
-        let trOffset = {
-          x: rect.right - cursorCenterX + borderWidth - cornerSize,
-          y: rect.top - cursorCenterY - borderWidth,
-        };
-        let brOffset = {
-          x: rect.right - cursorCenterX + borderWidth - cornerSize,
-          y: rect.bottom - cursorCenterY + borderWidth - cornerSize,
-        };
-        let blOffset = {
-          x: rect.left - cursorCenterX - borderWidth,
-          y: rect.bottom - cursorCenterY + borderWidth - cornerSize,
-        };
-
-        if (mouseX !== undefined && mouseY !== undefined) {
-          const targetCenterX = rect.left + rect.width / 2;
-          const targetCenterY = rect.top + rect.height / 2;
-          const mouseOffsetX = (mouseX - targetCenterX) * parallaxStrength;
-          const mouseOffsetY = (mouseY - targetCenterY) * parallaxStrength;
-
-          tlOffset.x += mouseOffsetX;
-          tlOffset.y += mouseOffsetY;
-          trOffset.x += mouseOffsetX;
-          trOffset.y += mouseOffsetY;
-          brOffset.x += mouseOffsetX;
-          brOffset.y += mouseOffsetY;
-          blOffset.x += mouseOffsetX;
-          blOffset.y += mouseOffsetY;
-        }
-
-        const tl = gsap.timeline();
-        const corners = [tlc, trc, brc, blc];
-        const offsets = [tlOffset, trOffset, brOffset, blOffset];
-
-        corners.forEach((corner, index) => {
-          tl.to(
-            corner,
-            {
-              x: offsets[index].x,
-              y: offsets[index].y,
-              duration: 0.2,
-              ease: "power2.out",
-            },
-            0
-          );
-        });
-      };
-
-      isAnimatingToTarget = true;
-      updateCorners();
-
-      setTimeout(() => {
-        isAnimatingToTarget = false;
-      }, 1);
-
-      let moveThrottle: number | null = null;
-      const targetMove = (ev: Event) => {
-        if (moveThrottle || isAnimatingToTarget) return;
-        moveThrottle = requestAnimationFrame(() => {
-          const mouseEvent = ev as MouseEvent;
-          updateCorners(mouseEvent.clientX, mouseEvent.clientY);
-          moveThrottle = null;
-        });
-      };
-
-      const leaveHandler = () => {
-        activeTarget = null;
-        isAnimatingToTarget = false;
-
-        if (cornersRef.current) {
-          const corners = Array.from(cornersRef.current);
-          gsap.killTweensOf(corners);
-
-          const { cornerSize } = constants;
-          const positions = [
-            { x: -cornerSize * 1.5, y: -cornerSize * 1.5 },
-            { x: cornerSize * 0.5, y: -cornerSize * 1.5 },
-            { x: cornerSize * 0.5, y: cornerSize * 0.5 },
-            { x: -cornerSize * 1.5, y: cornerSize * 0.5 },
-          ];
-
-          const tl = gsap.timeline();
-          corners.forEach((corner, index) => {
-            tl.to(
-              corner,
-              {
-                x: positions[index].x,
-                y: positions[index].y,
-                duration: 0.3,
-                ease: "power3.out",
-              },
-              0
-            );
-          });
-        }
-
-        resumeTimeout = setTimeout(() => {
-          if (!activeTarget && cursorRef.current && spinTl.current) {
-            const currentRotation = gsap.getProperty(
-              cursorRef.current,
-              "rotation"
-            ) as number;
-            const normalizedRotation = currentRotation % 360;
-
-            spinTl.current.kill();
-            const timeline = gsap
-              .timeline({ repeat: -1 })
-              .to(cursorRef.current, { rotation: "+=360", duration: spinDuration, ease: "none" });
-            (spinTl as any).current = timeline;
-
-            gsap.to(cursorRef.current, {
-              rotation: normalizedRotation + 360,
-              duration: spinDuration * (1 - normalizedRotation / 360),
-              ease: "none",
-              onComplete: () => {
-                spinTl.current?.restart();
-              },
-            });
-          }
-          resumeTimeout = null;
-        }, 50);
-
-        cleanupTarget(target);
-      };
-
-      currentTargetMove = targetMove;
-      currentLeaveHandler = leaveHandler;
-
-      target.addEventListener("mousemove", targetMove);
-      target.addEventListener("mouseleave", leaveHandler);
-    };
-
-    window.addEventListener("mouseover", enterHandler, { passive: true });
-
-    return () => {
-      window.removeEventListener("mousemove", moveHandler);
-      window.removeEventListener("mouseover", enterHandler);
-      window.removeEventListener("scroll", scrollHandler);
-      document.removeEventListener("mouseenter", hideCursorOnHover);
-      document.removeEventListener("mouseover", hideCursorOnHover);
-      document.removeEventListener("mousemove", hideCursorOnHover);
-
-      if (rafId) {
-        cancelAnimationFrame(rafId);
-      }
-      if (scrollRafId) {
-        cancelAnimationFrame(scrollRafId);
+      // The target may be moving by transform (a hover scale, magnetism, a
+      // reveal), which the cache cannot see, so re-read it once per frame
+      if (activeTarget) geometry.invalidate(activeTarget);
+
+      let target = activeTarget;
+      if (!pointer.inside) {
+        target = null;
+      } else if (pointer.moved) {
+        target = (pointer.target as Element | null)?.closest?.(targetSelector) ?? null;
+      } else if (activeTarget && !contains(geometry.rect(activeTarget), pointer.x, pointer.y)) {
+        // Scrolled without moving: the target may have slid out from under the pointer
+        target = null;
       }
 
-      if (activeTarget) {
-        cleanupTarget(activeTarget);
+      if (target !== activeTarget) {
+        if (activeTarget) leaveTarget();
+        if (target) enterTarget(target);
+      } else if (activeTarget) {
+        updateCorners(geometry.rect(activeTarget), pointer.x, pointer.y);
       }
+    },
 
-      spinTl.current?.kill();
+    destroy() {
+      unobserveTarget?.();
+      if (resumeTimeout) clearTimeout(resumeTimeout);
+      spinTl?.kill();
+      gsap.killTweensOf([cursor, ...corners]);
       document.body.style.cursor = originalCursor;
-    };
-  }, [targetSelector, spinDuration, moveCursor, constants, hideDefaultCursor]);
+      document.documentElement.style.cursor = "";
+    },
+  };
+};
+
+const TargetCursor: React.FC<TargetCursorProps> = ({
+  targetSelector = ".cursor-target",
+  spinDuration = 2,
+  hideDefaultCursor = true,
+}) => {
+  const cursorRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
-    if (!cursorRef.current || !spinTl.current) return;
-    
-    if (spinTl.current.isActive()) {
-      spinTl.current.kill();
-      const timeline = gsap
-        .timeline({ repeat: -1 })
-        .to(cursorRef.current, { rotation: "+=360", duration: spinDuration, ease: "none" });
-      (spinTl as any).current = timeline;
-    }
-  }, [spinDuration]);
+    if (!cursorRef.current) return;
+    return mountCursor(
+      cursorRef.current,
+      createTargetCursor,
+      { targetSelector, spinDuration, hideDefaultCursor },
+      "target-cursor"
+    );
+  }, [targetSelector, spinDuration, hideDefaultCursor]);
 
   return (
     <div ref={cursorRef} className="target-cursor-wrapper">
@@ -363,4 +225,4 @@ const TargetCursor: React.FC<TargetCursorProps> = ({
   );
 };
 
-export default TargetCursor; 
\ No newline at end of file
+export default TargetCursor;
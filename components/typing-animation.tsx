@@ -1,6 +1,7 @@
 "use client"
 
-import { useState, useEffect } from "react"
+import { useEffect, useRef } from "react"
+import { prefersReducedMotion, subscribeTicker } from "@/lib/ticker"
 
 interface TypingAnimationProps {
   texts: string[]
@@ -17,51 +18,57 @@ export default function TypingAnimation({
   pauseDuration = 2000,
   className = "",
 }: TypingAnimationProps) {
-  const [currentTextIndex, setCurrentTextIndex] = useState(0)
-  const [currentText, setCurrentText] = useState("")
-  const [isDeleting, setIsDeleting] = useState(false)
-  const [isPaused, setIsPaused] = useState(false)
+  // The text is written straight into this span; React never re-renders it
+  const textRef = useRef<HTMLSpanElement>(null)
 
   useEffect(() => {
-    if (isPaused) {
-      const pauseTimeout = setTimeout(() => {
-        setIsPaused(false)
-        setIsDeleting(true)
-      }, pauseDuration)
-      return () => clearTimeout(pauseTimeout)
+    const element = textRef.current
+    if (!element || texts.length === 0) return
+
+    if (prefersReducedMotion()) {
+      element.textContent = texts[0]
+      return
     }
 
-    const targetText = texts[currentTextIndex]
-    const timeout = setTimeout(
-      () => {
-        if (!isDeleting) {
+    let textIndex = 0
+    let length = 0
+    let deleting = false
+
+    const subscription = subscribeTicker(element, (now) => {
+      const target = texts[textIndex]
+
+      if (!deleting) {
+        if (length < target.length) {
           // Typing
-          if (currentText.length < targetText.length) {
-            setCurrentText(targetText.slice(0, currentText.length + 1))
-          } else {
-            // Finished typing, pause before deleting
-            setIsPaused(true)
-          }
-        } else {
-          // Deleting
-          if (currentText.length > 0) {
-            setCurrentText(currentText.slice(0, -1))
-          } else {
-            // Finished deleting, move to next text
-            setIsDeleting(false)
-            setCurrentTextIndex((prev) => (prev + 1) % texts.length)
-          }
+          element.textContent = target.slice(0, ++length)
+          return now + speed
         }
-      },
-      isDeleting ? deleteSpeed : speed,
-    )
+        // Finished typing, pause before deleting
+        deleting = true
+        return now + pauseDuration
+      }
 
-    return () => clearTimeout(timeout)
-  }, [currentText, currentTextIndex, isDeleting, isPaused, texts, speed, deleteSpeed, pauseDuration])
+      if (length > 0) {
+        // Deleting
+        element.textContent = target.slice(0, --length)
+        return now + deleteSpeed
+      }
+
+      // Finished deleting, move to next text
+      deleting = false
+      textIndex = (textIndex + 1) % texts.length
+      return now + speed
+    })
+
+    return () => {
+      subscription.cancel()
+      element.textContent = ""
+    }
+  }, [texts, speed, deleteSpeed, pauseDuration])
 
   return (
     <span className={className}>
-      {currentText}
+      <span ref={textRef} />
       <span className="animate-pulse">|</span>
     </span>
   )
@@ -0,0 +1,37 @@
+// Cursor styles as renderers on top of the shared pointer pipeline.
+//
+// A renderer owns the DOM of one cursor style and draws it from the coalesced
+// PointerState once per frame; it never listens to the mouse itself. Adding a
+// style means writing a factory, not another set of document listeners and
+// another requestAnimationFrame loop.
+
+import type { PerfWorkLabel } from "@/lib/perf-monitor"
+import { requestPointerFrame, subscribePointer, type PointerState } from "@/lib/pointer-tracker"
+
+export interface CursorRenderer {
+  // Draw one frame. Return true to be called again next frame even if the
+  // pointer does not move, e.g. while a trail is still fading.
+  frame(pointer: PointerState): boolean | void
+  destroy(): void
+}
+
+export type CursorRendererFactory<Options> = (root: HTMLElement, options: Options) => CursorRenderer
+
+// Create a renderer on `root` and drive it from the pointer pipeline, timed in
+// the perf monitor under `label`; returns a function that tears it down
+export function mountCursor<Options>(
+  root: HTMLElement,
+  factory: CursorRendererFactory<Options>,
+  options: Options,
+  label: PerfWorkLabel,
+): () => void {
+  const renderer = factory(root, options)
+  const unsubscribe = subscribePointer((pointer) => {
+    if (renderer.frame(pointer)) requestPointerFrame()
+  }, label)
+
+  return () => {
+    unsubscribe()
+    renderer.destroy()
+  }
+}
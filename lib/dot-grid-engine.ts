@@ -0,0 +1,392 @@
+// Dot storage, shockwave physics and the canvas renderer behind
+// components/dot-grid.tsx. Nothing here depends on React or the DOM beyond a
+// 2D context, so it can draw into an OffscreenCanvas too.
+//
+// Nothing is drawn unless something changed: callers report pointer moves and
+// displaced dots, and render() repaints only the box those changes cover.
+// Within that box dots are batched into one Path2D per colour level, so a
+// frame costs one fill per level instead of one per dot.
+
+export interface DotGridStyle {
+  dotSize: number
+  baseColor: string
+  activeColor: string
+  proximity: number
+}
+
+interface Rect {
+  x0: number
+  y0: number
+  x1: number
+  y1: number
+}
+
+type Context2D = CanvasRenderingContext2D | OffscreenCanvasRenderingContext2D
+
+// Proximity colours are quantised to this many steps between base and active
+const COLOR_LEVELS = 16
+
+export function hexToRgb(hex: string) {
+  const m = hex.match(/^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i)
+  if (!m) return { r: 0, g: 0, b: 0 }
+  return {
+    r: Number.parseInt(m[1], 16),
+    g: Number.parseInt(m[2], 16),
+    b: Number.parseInt(m[3], 16),
+  }
+}
+
+export interface ShockwaveOptions {
+  radius: number
+  strength: number
+  // Seconds the elastic return to rest takes
+  returnDuration: number
+}
+
+// Length of the initial push, as in the original 0.1s power2.out tween
+const PUSH_MS = 100
+
+const IDLE = 0
+const PUSHING = 1
+const RETURNING = 2
+
+// GSAP's elastic.out(1, 0.75), inlined so the shockwave needs no tweens
+const ELASTIC_PERIOD = (Math.PI * 2) / 0.75
+const ELASTIC_SHIFT = (0.75 / (Math.PI * 2)) * Math.asin(1)
+const elasticOut = (p: number) => (p >= 1 ? 1 : 2 ** (-10 * p) * Math.sin((p - ELASTIC_SHIFT) * ELASTIC_PERIOD) + 1)
+const power2Out = (p: number) => 1 - (1 - p) * (1 - p)
+
+/**
+ * Dot positions and shockwave state for a regular grid, in typed arrays.
+ *
+ * Dot i sits in column i % cols and row floor(i / cols), so the grid is its
+ * own spatial index: radius and rectangle queries walk only the rows and
+ * columns that can intersect, which is O(k) in the dots returned.
+ *
+ * A click starts a shockwave for every dot in range; step() advances all of
+ * them in one pass per frame instead of running a tween per dot.
+ */
+export class DotField {
+  readonly cols: number
+  readonly rows: number
+  readonly count: number
+  readonly cell: number
+  readonly startX: number
+  readonly startY: number
+  readonly cx: Float32Array
+  readonly cy: Float32Array
+  readonly xOffset: Float32Array
+  readonly yOffset: Float32Array
+
+  private fromX: Float32Array
+  private fromY: Float32Array
+  private pushX: Float32Array
+  private pushY: Float32Array
+  private startedAt: Float64Array
+  private phase: Uint8Array
+  private active: number[] = []
+  private returnMs = 1500
+
+  constructor(width: number, height: number, dotSize: number, gap: number) {
+    const cell = dotSize + gap
+    const cols = Math.max(0, Math.floor((width + gap) / cell))
+    const rows = Math.max(0, Math.floor((height + gap) / cell))
+    const gridW = cell * cols - gap
+    const gridH = cell * rows - gap
+    this.cols = cols
+    this.rows = rows
+    this.count = cols * rows
+    this.cell = cell
+    this.startX = (width - gridW) / 2 + dotSize / 2
+    this.startY = (height - gridH) / 2 + dotSize / 2
+
+    this.cx = new Float32Array(this.count)
+    this.cy = new Float32Array(this.count)
+    this.xOffset = new Float32Array(this.count)
+    this.yOffset = new Float32Array(this.count)
+    this.fromX = new Float32Array(this.count)
+    this.fromY = new Float32Array(this.count)
+    this.pushX = new Float32Array(this.count)
+    this.pushY = new Float32Array(this.count)
+    this.startedAt = new Float64Array(this.count)
+    this.phase = new Uint8Array(this.count)
+
+    for (let row = 0; row < rows; row++) {
+      for (let col = 0; col < cols; col++) {
+        const i = row * cols + col
+        this.cx[i] = this.startX + col * cell
+        this.cy[i] = this.startY + row * cell
+      }
+    }
+  }
+
+  /** Indices of dots currently pushed or returning. */
+  get activeDots(): readonly number[] {
+    return this.active
+  }
+
+  isActive(i: number): boolean {
+    return this.phase[i] !== IDLE
+  }
+
+  /** Call fn for every dot whose rest position lies within the rectangle. */
+  forEachInRect(x0: number, y0: number, x1: number, y1: number, fn: (i: number) => void) {
+    const col0 = Math.max(0, Math.ceil((x0 - this.startX) / this.cell))
+    const col1 = Math.min(this.cols - 1, Math.floor((x1 - this.startX) / this.cell))
+    const row0 = Math.max(0, Math.ceil((y0 - this.startY) / this.cell))
+    const row1 = Math.min(this.rows - 1, Math.floor((y1 - this.startY) / this.cell))
+    for (let row = row0; row <= row1; row++) {
+      const base = row * this.cols
+      for (let col = col0; col <= col1; col++) {
+        fn(base + col)
+      }
+    }
+  }
+
+  /** Call fn with each dot within `radius` of (x, y) and its squared distance. */
+  forEachInRadius(x: number, y: number, radius: number, fn: (i: number, distSq: number) => void) {
+    const radiusSq = radius * radius
+    this.forEachInRect(x - radius, y - radius, x + radius, y + radius, (i) => {
+      const dx = this.cx[i] - x
+      const dy = this.cy[i] - y
+      const distSq = dx * dx + dy * dy
+      if (distSq < radiusSq) fn(i, distSq)
+    })
+  }
+
+  /** Push dots around (x, y) outward; returns how many were affected. */
+  shockwave(x: number, y: number, { radius, strength, returnDuration }: ShockwaveOptions, now: number): number {
+    this.returnMs = returnDuration * 1000
+    let affected = 0
+    this.forEachInRadius(x, y, radius, (i, distSq) => {
+      // Dots still in their initial push are left alone, as before
+      if (this.phase[i] === PUSHING) return
+      const falloff = Math.max(0, 1 - Math.sqrt(distSq) / radius)
+      if (this.phase[i] === IDLE) this.active.push(i)
+      this.phase[i] = PUSHING
+      this.startedAt[i] = now
+      this.fromX[i] = this.xOffset[i]
+      this.fromY[i] = this.yOffset[i]
+      this.pushX[i] = (this.cx[i] - x) * strength * falloff
+      this.pushY[i] = (this.cy[i] - y) * strength * falloff
+      affected++
+    })
+    return affected
+  }
+
+  /** Advance every active dot to time `now`; returns true while any are still moving. */
+  step(now: number): boolean {
+    const active = this.active
+    let kept = 0
+    for (let n = 0; n < active.length; n++) {
+      const i = active[n]
+      const elapsed = now - this.startedAt[i]
+
+      if (this.phase[i] === PUSHING) {
+        const p = Math.min(1, Math.max(0, elapsed / PUSH_MS))
+        const eased = power2Out(p)
+        this.xOffset[i] = this.fromX[i] + (this.pushX[i] - this.fromX[i]) * eased
+        this.yOffset[i] = this.fromY[i] + (this.pushY[i] - this.fromY[i]) * eased
+        if (p >= 1) {
+          this.phase[i] = RETURNING
+          this.startedAt[i] += PUSH_MS
+        }
+        active[kept++] = i
+        continue
+      }
+
+      const p = Math.min(1, Math.max(0, elapsed / this.returnMs))
+      const remaining = 1 - elasticOut(p)
+      this.xOffset[i] = this.pushX[i] * remaining
+      this.yOffset[i] = this.pushY[i] * remaining
+      if (p >= 1) {
+        this.xOffset[i] = 0
+        this.yOffset[i] = 0
+        this.phase[i] = IDLE
+      } else {
+        active[kept++] = i
+      }
+    }
+    active.length = kept
+    return kept > 0
+  }
+}
+
+function union(a: Rect | null, b: Rect | null): Rect | null {
+  if (!a) return b
+  if (!b) return a
+  return { x0: Math.min(a.x0, b.x0), y0: Math.min(a.y0, b.y0), x1: Math.max(a.x1, b.x1), y1: Math.max(a.y1, b.y1) }
+}
+
+export class DotGridRenderer {
+  private ctx: Context2D
+  private style: DotGridStyle
+  private colors: string[] = []
+  private field: DotField | null = null
+  private width = 0
+  private height = 0
+  private pointerX = Number.NEGATIVE_INFINITY
+  private pointerY = Number.NEGATIVE_INFINITY
+  // What the previous frame painted around the pointer and displaced dots
+  private lastPointerBox: Rect | null = null
+  private lastActiveBox: Rect | null = null
+  private pointerMoved = false
+  private fullRedraw = true
+
+  constructor(ctx: Context2D, style: DotGridStyle) {
+    this.ctx = ctx
+    this.style = style
+    this.setStyle(style)
+  }
+
+  setStyle(style: DotGridStyle) {
+    this.style = style
+    const base = hexToRgb(style.baseColor)
+    const active = hexToRgb(style.activeColor)
+    this.colors = Array.from({ length: COLOR_LEVELS + 1 }, (_, level) => {
+      const t = level / COLOR_LEVELS
+      const r = Math.round(base.r + (active.r - base.r) * t)
+      const g = Math.round(base.g + (active.g - base.g) * t)
+      const b = Math.round(base.b + (active.b - base.b) * t)
+      return `rgb(${r},${g},${b})`
+    })
+    this.fullRedraw = true
+  }
+
+  setField(field: DotField, width: number, height: number) {
+    this.field = field
+    this.width = width
+    this.height = height
+    this.fullRedraw = true
+  }
+
+  // The context is reset when the canvas is resized
+  setContext(ctx: Context2D) {
+    this.ctx = ctx
+    this.fullRedraw = true
+  }
+
+  invalidate() {
+    this.fullRedraw = true
+  }
+
+  /** Record the pointer position; returns true if a redraw is needed. */
+  setPointer(x: number, y: number): boolean {
+    if (x === this.pointerX && y === this.pointerY) return false
+    const reach = this.style.proximity + this.style.dotSize
+    const wasNear = this.lastPointerBox !== null
+    const isNear = x > -reach && y > -reach && x < this.width + reach && y < this.height + reach
+    this.pointerX = x
+    this.pointerY = y
+    this.pointerMoved = wasNear || isNear
+    return this.pointerMoved
+  }
+
+  private pointerBox(): Rect | null {
+    const { proximity, dotSize } = this.style
+    const reach = proximity + dotSize
+    const x = this.pointerX
+    const y = this.pointerY
+    if (x < -reach || y < -reach || x > this.width + reach || y > this.height + reach) return null
+    return { x0: x - reach, y0: y - reach, x1: x + reach, y1: y + reach }
+  }
+
+  // Covers both the rest and the drawn position of every displaced dot
+  private activeBox(field: DotField): Rect | null {
+    const r = this.style.dotSize
+    const { cx, cy, xOffset, yOffset } = field
+    let box: Rect | null = null
+    for (const i of field.activeDots) {
+      const ox = cx[i] + xOffset[i]
+      const oy = cy[i] + yOffset[i]
+      box = union(box, {
+        x0: Math.min(cx[i], ox) - r,
+        y0: Math.min(cy[i], oy) - r,
+        x1: Math.max(cx[i], ox) + r,
+        y1: Math.max(cy[i], oy) + r,
+      })
+    }
+    return box
+  }
+
+  /**
+   * Paint whatever changed since the last call: the pointer's surroundings
+   * and every displaced dot, now and in the previous frame. Returns false
+   * when there was nothing to draw.
+   */
+  render(): boolean {
+    const field = this.field
+    if (!field) return false
+    const pointerBox = this.pointerBox()
+    const activeBox = this.activeBox(field)
+
+    let region: Rect | null
+    if (this.fullRedraw) {
+      region = { x0: 0, y0: 0, x1: this.width, y1: this.height }
+    } else {
+      region = union(activeBox, this.lastActiveBox)
+      if (this.pointerMoved) {
+        region = union(region, union(pointerBox, this.lastPointerBox))
+      }
+    }
+
+    this.fullRedraw = false
+    this.pointerMoved = false
+    this.lastPointerBox = pointerBox
+    this.lastActiveBox = activeBox
+    if (!region) return false
+
+    this.paint(field, region)
+    return true
+  }
+
+  private paint(field: DotField, region: Rect) {
+    const { ctx, colors } = this
+    const { cx, cy, xOffset, yOffset } = field
+    const { dotSize, proximity } = this.style
+    const radius = dotSize / 2
+    const proxSq = proximity * proximity
+    const px = this.pointerX
+    const py = this.pointerY
+    const w = region.x1 - region.x0
+    const h = region.y1 - region.y0
+
+    ctx.save()
+    ctx.beginPath()
+    ctx.rect(region.x0, region.y0, w, h)
+    ctx.clip()
+    ctx.clearRect(region.x0, region.y0, w, h)
+
+    const batches: (Path2D | undefined)[] = new Array(colors.length)
+    const add = (i: number) => {
+      const ox = cx[i] + xOffset[i]
+      const oy = cy[i] + yOffset[i]
+      if (ox + radius < region.x0 || ox - radius > region.x1 || oy + radius < region.y0 || oy - radius > region.y1) {
+        return
+      }
+
+      const dx = cx[i] - px
+      const dy = cy[i] - py
+      const dsq = dx * dx + dy * dy
+      const level = dsq <= proxSq ? Math.ceil((1 - Math.sqrt(dsq) / proximity) * COLOR_LEVELS) : 0
+
+      const path = (batches[level] ??= new Path2D())
+      path.moveTo(ox + radius, oy)
+      path.arc(ox, oy, radius, 0, Math.PI * 2)
+    }
+
+    // Resting dots come from the grid cells under the region; displaced ones
+    // may have travelled in from elsewhere, so they are checked separately
+    field.forEachInRect(region.x0 - radius, region.y0 - radius, region.x1 + radius, region.y1 + radius, (i) => {
+      if (!field.isActive(i)) add(i)
+    })
+    for (const i of field.activeDots) add(i)
+
+    batches.forEach((path, level) => {
+      if (!path) return
+      ctx.fillStyle = colors[level]
+      ctx.fill(path)
+    })
+    ctx.restore()
+  }
+}
@@ -0,0 +1,136 @@
+// Web Worker backend for components/dot-grid.tsx. The component transfers its
+// canvas here with transferControlToOffscreen() and then only posts pointer,
+// click, resize and visibility messages; the field physics and all drawing run
+// on this thread with the same engine the main-thread fallback uses.
+//
+// Typed against the DOM lib like the rest of the app: the worker globals used
+// here (self, requestAnimationFrame, performance) share their DOM signatures.
+
+import { DotField, DotGridRenderer, type DotGridStyle, type ShockwaveOptions } from "./dot-grid-engine"
+
+export interface DotGridWorkerConfig extends DotGridStyle, ShockwaveOptions {
+  gap: number
+}
+
+export type DotGridWorkerMessage =
+  | {
+      type: "init"
+      canvas: OffscreenCanvas
+      width: number
+      height: number
+      dpr: number
+      config: DotGridWorkerConfig
+      // Post per-frame and per-click timings back for lib/perf-monitor.ts
+      reportWork: boolean
+    }
+  | { type: "config"; config: DotGridWorkerConfig }
+  | { type: "resize"; width: number; height: number; dpr: number }
+  | { type: "pointer"; x: number; y: number }
+  | { type: "click"; x: number; y: number }
+  | { type: "visible"; visible: boolean }
+
+export interface DotGridWorkerReport {
+  type: "work"
+  label: "frame" | "click"
+  ms: number
+}
+
+let canvas: OffscreenCanvas | null = null
+let renderer: DotGridRenderer | null = null
+let field: DotField | null = null
+let config: DotGridWorkerConfig | null = null
+let size = { width: 0, height: 0, dpr: 1 }
+let visible = true
+let reportWork = false
+let frame = 0
+
+function report(label: DotGridWorkerReport["label"], startedAt: number) {
+  if (!reportWork) return
+  const message: DotGridWorkerReport = { type: "work", label, ms: performance.now() - startedAt }
+  self.postMessage(message)
+}
+
+function requestDraw() {
+  if (frame || !visible) return
+  frame = requestAnimationFrame((now) => {
+    frame = 0
+    if (!renderer || !field) return
+
+    const startedAt = performance.now()
+    const moving = field.step(now)
+    renderer.render()
+    report("frame", startedAt)
+
+    if (moving) requestDraw()
+  })
+}
+
+function buildGrid() {
+  if (!canvas || !config) return
+  const { width, height, dpr } = size
+  canvas.width = width * dpr
+  canvas.height = height * dpr
+
+  const ctx = canvas.getContext("2d")
+  if (!ctx) return
+  ctx.scale(dpr, dpr)
+
+  field = new DotField(width, height, config.dotSize, config.gap)
+  const style = {
+    dotSize: config.dotSize,
+    baseColor: config.baseColor,
+    activeColor: config.activeColor,
+    proximity: config.proximity,
+  }
+  if (!renderer) {
+    renderer = new DotGridRenderer(ctx, style)
+  } else {
+    renderer.setContext(ctx)
+    renderer.setStyle(style)
+  }
+  renderer.setField(field, width, height)
+  requestDraw()
+}
+
+function handle(message: DotGridWorkerMessage) {
+  switch (message.type) {
+    case "init":
+      canvas = message.canvas
+      config = message.config
+      reportWork = message.reportWork
+      size = { width: message.width, height: message.height, dpr: message.dpr }
+      buildGrid()
+      break
+    case "config":
+      config = message.config
+      buildGrid()
+      break
+    case "resize":
+      size = { width: message.width, height: message.height, dpr: message.dpr }
+      buildGrid()
+      break
+    case "pointer":
+      if (renderer?.setPointer(message.x, message.y)) requestDraw()
+      break
+    case "click": {
+      if (!field || !config) break
+      const startedAt = performance.now()
+      const affected = field.shockwave(message.x, message.y, config, startedAt)
+      report("click", startedAt)
+      if (affected > 0) requestDraw()
+      break
+    }
+    case "visible":
+      visible = message.visible
+      if (visible) {
+        renderer?.invalidate()
+        requestDraw()
+      } else if (frame) {
+        cancelAnimationFrame(frame)
+        frame = 0
+      }
+      break
+  }
+}
+
+self.addEventListener("message", (event: MessageEvent<DotGridWorkerMessage>) => handle(event.data))
@@ -1,115 +1,239 @@
-export const createContactEmailTemplate = (name: string, email: string, subject: string, message: string) => {
-  return {
-    html: `
-      <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9;">
-        <div style="background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-          <h2 style="color: #333; margin-bottom: 20px; border-bottom: 2px solid #8b5cf6; padding-bottom: 10px;">
-            🚀 New Contact Form Submission
-          </h2>
-          
-          <div style="margin-bottom: 20px;">
-            <h3 style="color: #8b5cf6; margin-bottom: 5px;">Contact Details:</h3>
-            <p style="margin: 5px 0;"><strong>Name:</strong> ${name}</p>
-            <p style="margin: 5px 0;"><strong>Email:</strong> <a href="mailto:${email}" style="color: #8b5cf6;">${email}</a></p>
-            <p style="margin: 5px 0;"><strong>Subject:</strong> ${subject}</p>
-          </div>
-          
-          <div style="margin-bottom: 20px;">
-            <h3 style="color: #8b5cf6; margin-bottom: 10px;">Message:</h3>
-            <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; border-left: 4px solid #8b5cf6;">
-              <p style="margin: 0; line-height: 1.6; white-space: pre-wrap;">${message}</p>
-            </div>
-          </div>
-          
-          <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee;">
-            <p style="color: #666; font-size: 12px; margin: 0;">
-              <strong>Sent:</strong> ${new Date().toLocaleString()}<br>
-              <strong>From:</strong> Portfolio Website Contact Form
-            </p>
-          </div>
-          
-          <div style="margin-top: 20px; text-align: center;">
-            <a href="mailto:${email}" style="background-color: #8b5cf6; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px; display: inline-block;">
-              Reply to ${name}
-            </a>
+// Contact-form emails, compiled once when this module loads.
+//
+// A template is an HTML and a text source with {{name}} slots. Compiling
+// splits each source into its static parts and slots (and strips the HTML
+// indentation), so a render is a single concatenation. In HTML every value is
+// escaped in one pass; {{name|url}} is URL-encoded first, for mailto links.
+// Text slots are inserted as they are. Both variants come from one render()
+// call, which escapes each value once however many slots use it.
+
+type SlotFilter = "html" | "url"
+
+interface CompiledSource {
+  // parts.length === slots.length + 1; output is parts[0] + slot[0] + parts[1] + ...
+  parts: string[]
+  slots: { name: string; filter: SlotFilter }[]
+}
+
+const SLOT = /\{\{\s*(\w+)(?:\|(url))?\s*\}\}/g
+
+const HTML_ESCAPES: Record<string, string> = {
+  "&": "&amp;",
+  "<": "&lt;",
+  ">": "&gt;",
+  '"': "&quot;",
+  "'": "&#39;",
+}
+const HTML_SPECIAL = /[&<>"']/g
+
+export function escapeHtml(value: string): string {
+  return value.replace(HTML_SPECIAL, (char) => HTML_ESCAPES[char])
+}
+
+function compileSource(source: string): CompiledSource {
+  const parts: string[] = []
+  const slots: CompiledSource["slots"] = []
+  let last = 0
+  for (const match of source.matchAll(SLOT)) {
+    parts.push(source.slice(last, match.index))
+    slots.push({ name: match[1], filter: match[2] === "url" ? "url" : "html" })
+    last = match.index! + match[0].length
+  }
+  parts.push(source.slice(last))
+  return { parts, slots }
+}
+
+function renderSource({ parts, slots }: CompiledSource, value: (slot: CompiledSource["slots"][number]) => string) {
+  let output = parts[0]
+  for (let i = 0; i < slots.length; i++) {
+    output += value(slots[i]) + parts[i + 1]
+  }
+  return output
+}
+
+export interface EmailContent {
+  html: string
+  text: string
+}
+
+export function compileEmailTemplate<Name extends string>(source: { html: string; text: string }) {
+  // Indentation between tags is not content; message slots sit on one line
+  const html = compileSource(source.html.replace(/\n\s*/g, "\n").trim())
+  const text = compileSource(source.text.trim())
+
+  return (values: Record<Name, string>): EmailContent => {
+    const escaped = new Map<string, string>()
+    const htmlValue = ({ name, filter }: CompiledSource["slots"][number]) => {
+      const key = filter === "url" ? `${name}|url` : name
+      let value = escaped.get(key)
+      if (value === undefined) {
+        const raw = values[name as Name] ?? ""
+        value = escapeHtml(filter === "url" ? encodeURIComponent(raw) : raw)
+        escaped.set(key, value)
+      }
+      return value
+    }
+    return {
+      html: renderSource(html, htmlValue),
+      text: renderSource(text, ({ name }) => values[name as Name] ?? ""),
+    }
+  }
+}
+
+// Equivalent to Date#toLocaleString(), without building a formatter per call
+const timestampFormat = new Intl.DateTimeFormat(undefined, {
+  year: "numeric",
+  month: "numeric",
+  day: "numeric",
+  hour: "numeric",
+  minute: "numeric",
+  second: "numeric",
+})
+
+export function formatTimestamp(date: Date = new Date()): string {
+  return timestampFormat.format(date)
+}
+
+const contactEmail = compileEmailTemplate<"name" | "email" | "subject" | "message" | "sentAt">({
+  html: `
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9;">
+      <div style="background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+        <h2 style="color: #333; margin-bottom: 20px; border-bottom: 2px solid #8b5cf6; padding-bottom: 10px;">
+          🚀 New Contact Form Submission
+        </h2>
+
+        <div style="background-color: #f0f9ff; padding: 20px; border-radius: 8px; border-left: 4px solid #3b82f6; margin-bottom: 20px;">
+          <h3 style="color: #1e40af; margin-top: 0; margin-bottom: 10px;">📞 Contact Details</h3>
+          <p style="margin: 5px 0;"><strong>Name:</strong> {{name}}</p>
+          <p style="margin: 5px 0;"><strong>Email:</strong> <a href="mailto:{{email}}" style="color: #3b82f6; text-decoration: none;">{{email}}</a></p>
+          <p style="margin: 5px 0;"><strong>Subject:</strong> {{subject}}</p>
+          <p style="margin: 5px 0;"><strong>Time:</strong> {{sentAt}}</p>
+        </div>
+
+        <div style="margin-bottom: 30px;">
+          <h3 style="color: #8b5cf6; margin-bottom: 10px;">💬 Message:</h3>
+          <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; border-left: 4px solid #8b5cf6;">
+            <p style="margin: 0; line-height: 1.6; white-space: pre-wrap; color: #374151;">{{message}}</p>
           </div>
         </div>
+
+        <div style="text-align: center; margin-top: 30px;">
+          <a href="mailto:{{email}}?subject=Re: {{subject|url}}"
+             style="background-color: #8b5cf6; color: white; padding: 12px 24px; text-decoration: none; border-radius: 6px; display: inline-block; font-weight: 600;">
+            📧 Reply to {{name}}
+          </a>
+        </div>
+
+        <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #e5e7eb; text-align: center;">
+          <p style="color: #6b7280; font-size: 14px; margin: 0;">
+            Sent from your portfolio website contact form<br>
+            <strong>harshchavan.dev</strong>
+          </p>
+        </div>
       </div>
-    `,
-    text: `
-New Contact Form Submission
+    </div>
+  `,
+  text: `
+🚀 NEW CONTACT FORM SUBMISSION
 
-Name: ${name}
-Email: ${email}
-Subject: ${subject}
+Contact Details:
+Name: {{name}}
+Email: {{email}}
+Subject: {{subject}}
+Time: {{sentAt}}
 
 Message:
-${message}
+{{message}}
 
-Sent: ${new Date().toLocaleString()}
-From: Portfolio Website Contact Form
-    `,
-  }
-}
+---
+Reply directly to this email to respond to {{name}}.
+Sent from your portfolio website: harshchavan.dev
+  `,
+})
 
-export const createAutoReplyTemplate = (name: string, subject: string, message: string) => {
-  return {
-    html: `
-      <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9;">
-        <div style="background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-          <h2 style="color: #333; margin-bottom: 20px;">Hi ${name}! 👋</h2>
-          
-          <p style="line-height: 1.6; color: #555;">
-            Thank you for reaching out through my portfolio website! I've received your message about "<strong>${subject}</strong>" and I really appreciate you taking the time to contact me.
-          </p>
-          
-          <p style="line-height: 1.6; color: #555;">
-            I'll review your message and get back to you as soon as possible, typically within 24-48 hours. 
-          </p>
-          
-          <div style="background-color: #f8f9fa; padding: 20px; border-radius: 5px; border-left: 4px solid #8b5cf6; margin: 20px 0;">
-            <h3 style="color: #8b5cf6; margin-top: 0;">Your Message:</h3>
-            <p style="margin: 0; line-height: 1.6; white-space: pre-wrap;">${message}</p>
-          </div>
-          
-          <p style="line-height: 1.6; color: #555;">
-            In the meantime, feel free to check out my other projects on 
-            <a href="https://github.com/Xyerophyte" style="color: #8b5cf6;">GitHub</a> or connect with me on 
-            <a href="http://www.linkedin.com/in/harsh-chavan-369522316/" style="color: #8b5cf6;">LinkedIn</a>.
+const autoReplyEmail = compileEmailTemplate<"name" | "subject" | "message">({
+  html: `
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; background-color: #f9f9f9;">
+      <div style="background-color: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+        <h2 style="color: #333; margin-bottom: 20px;">Hi {{name}}! 👋</h2>
+
+        <p style="line-height: 1.6; color: #555; margin-bottom: 20px;">
+          Thank you for reaching out through my portfolio website! I've received your message about "<strong>{{subject}}</strong>" and I really appreciate you taking the time to contact me.
+        </p>
+
+        <p style="line-height: 1.6; color: #555; margin-bottom: 20px;">
+          I'll review your message and get back to you as soon as possible, typically within 24-48 hours.
+        </p>
+
+        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; border-left: 4px solid #8b5cf6; margin: 20px 0;">
+          <h3 style="color: #8b5cf6; margin-top: 0; margin-bottom: 10px;">Your Message:</h3>
+          <p style="margin: 0; line-height: 1.6; white-space: pre-wrap; color: #374151;">{{message}}</p>
+        </div>
+
+        <p style="line-height: 1.6; color: #555; margin-bottom: 20px;">
+          In the meantime, feel free to check out my other projects on
+          <a href="https://github.com/Xyerophyte" style="color: #8b5cf6; text-decoration: none;">GitHub</a> or connect with me on
+          <a href="http://www.linkedin.com/in/harsh-chavan-369522316/" style="color: #8b5cf6; text-decoration: none;">LinkedIn</a>.
+        </p>
+
+        <div style="background-color: #f0f9ff; padding: 20px; border-radius: 8px; margin: 20px 0;">
+          <p style="margin: 0; line-height: 1.6; color: #1e40af;">
+            <strong>📧 Contact Info:</strong><br>
+            Email: harshabasaheb1@gmail.com<br>
+            Phone: +971 502808641<br>
+            Location: Dubai, UAE
           </p>
-          
-          <p style="line-height: 1.6; color: #555;">
-            Best regards,<br>
-            <strong>Harsh Chavan</strong><br>
-            Full Stack Developer
+        </div>
+
+        <p style="line-height: 1.6; color: #555;">
+          Best regards,<br>
+          <strong>Harsh Chavan</strong><br>
+          <em>Full Stack Developer</em>
+        </p>
+
+        <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee; text-align: center;">
+          <p style="color: #666; font-size: 12px; margin: 0;">
+            This is an automated response from harshchavan.dev
           </p>
-          
-          <div style="margin-top: 30px; padding-top: 20px; border-top: 1px solid #eee; text-align: center;">
-            <p style="color: #666; font-size: 12px; margin: 0;">
-              This is an automated response. Please don't reply to this email directly.
-            </p>
-          </div>
         </div>
       </div>
-    `,
-    text: `
-Hi ${name}!
+    </div>
+  `,
+  text: `
+Hi {{name}}!
 
-Thank you for reaching out through my portfolio website! I've received your message about "${subject}" and I really appreciate you taking the time to contact me.
+Thank you for reaching out through my portfolio website! I've received your message about "{{subject}}" and I really appreciate you taking the time to contact me.
 
 I'll review your message and get back to you as soon as possible, typically within 24-48 hours.
 
 Your Message:
-${message}
+{{message}}
 
 In the meantime, feel free to check out my other projects on GitHub (https://github.com/Xyerophyte) or connect with me on LinkedIn (http://www.linkedin.com/in/harsh-chavan-369522316/).
 
+Contact Info:
+Email: harshabasaheb1@gmail.com
+Phone: +971 502808641
+Location: Dubai, UAE
+
 Best regards,
 Harsh Chavan
 Full Stack Developer
 
 ---
-This is an automated response. Please don't reply to this email directly.
-    `,
-  }
-}
+This is an automated response from harshchavan.dev
+  `,
+})
+
+// Notification to the site owner; `sentAt` defaults to now
+export const createContactEmailTemplate = (
+  name: string,
+  email: string,
+  subject: string,
+  message: string,
+  sentAt: string = formatTimestamp(),
+): EmailContent => contactEmail({ name, email, subject, message, sentAt })
+
+// Confirmation sent back to the person who wrote in
+export const createAutoReplyTemplate = (name: string, subject: string, message: string): EmailContent =>
+  autoReplyEmail({ name, subject, message })
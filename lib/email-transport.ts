@@ -0,0 +1,124 @@
+import { Resend } from "resend"
+
+export interface EmailMessage {
+  from: string
+  to: string
+  replyTo?: string
+  subject: string
+  html: string
+  text: string
+}
+
+export interface SendResult {
+  id: string | null
+}
+
+export interface EmailTransport {
+  name: "resend" | "memory" | "http"
+  send(message: EmailMessage): Promise<SendResult>
+}
+
+// Messages kept by the "memory" transport. Stored on globalThis so they survive
+// dev-mode module reloads between requests.
+const globalForEmail = globalThis as unknown as { sentEmails?: (EmailMessage & { sentAt: number })[] }
+export const sentEmails = (globalForEmail.sentEmails ??= [])
+
+function createResendTransport(apiKey: string): EmailTransport {
+  const resend = new Resend(apiKey)
+  return {
+    name: "resend",
+    async send(message) {
+      const { data, error } = await resend.emails.send(message)
+      if (error) {
+        throw new Error(error.message)
+      }
+      return { id: data?.id ?? null }
+    },
+  }
+}
+
+function createMemoryTransport(): EmailTransport {
+  return {
+    name: "memory",
+    async send(message) {
+      sentEmails.push({ ...message, sentAt: Date.now() })
+      return { id: `memory-${sentEmails.length}` }
+    },
+  }
+}
+
+// Posts each message as JSON to a local stand-in such as testsprite_tests/email_stub.py
+function createHttpTransport(url: string): EmailTransport {
+  return {
+    name: "http",
+    async send(message) {
+      const response = await fetch(url, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(message),
+      })
+      if (!response.ok) {
+        throw new Error(`Email stand-in responded with ${response.status}`)
+      }
+      const data = await response.json().catch(() => ({}))
+      return { id: typeof data.id === "string" ? data.id : null }
+    },
+  }
+}
+
+// Queue behind EMAIL_DELIVERY_MODE=background. Messages are sent one at a time
+// after the request that queued them has been answered, and a failed send is
+// retried once. The queue lives in this server process only.
+const emailQueue: { transport: EmailTransport; message: EmailMessage; attempts: number }[] = []
+let drainingQueue = false
+
+async function drainEmailQueue() {
+  drainingQueue = true
+  try {
+    while (emailQueue.length > 0) {
+      const job = emailQueue.shift()!
+      try {
+        await job.transport.send(job.message)
+      } catch (error) {
+        job.attempts++
+        if (job.attempts < 2) {
+          emailQueue.push(job)
+        } else if (process.env.NODE_ENV === "development") {
+          console.error("❌ Queued email failed:", error)
+        }
+      }
+    }
+  } finally {
+    drainingQueue = false
+  }
+}
+
+export function enqueueEmail(transport: EmailTransport, message: EmailMessage) {
+  emailQueue.push({ transport, message, attempts: 0 })
+  if (!drainingQueue) {
+    void drainEmailQueue()
+  }
+}
+
+/**
+ * Pick the email transport from EMAIL_TRANSPORT:
+ * - "resend" (default): the real Resend API, needs RESEND_API_KEY
+ * - "memory": records messages in `sentEmails`, sends nothing
+ * - "http": POSTs to EMAIL_TRANSPORT_URL (default http://127.0.0.1:8025/emails)
+ *
+ * Returns null when the selected transport is not configured, so routes can
+ * answer 503 the same way they did before.
+ */
+export function getEmailTransport(): EmailTransport | null {
+  const kind = process.env.EMAIL_TRANSPORT || "resend"
+
+  if (kind === "memory") {
+    return createMemoryTransport()
+  }
+
+  if (kind === "http") {
+    return createHttpTransport(process.env.EMAIL_TRANSPORT_URL || "http://127.0.0.1:8025/emails")
+  }
+
+  return process.env.RESEND_API_KEY ? createResendTransport(process.env.RESEND_API_KEY) : null
+}
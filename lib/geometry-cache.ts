@@ -0,0 +1,102 @@
+// Viewport rects for elements that pointer handlers hit-test or position
+// against, read once and reused until something could have moved them.
+//
+// Pointer handlers used to call getBoundingClientRect() on every event and then
+// write styles, forcing a synchronous layout per event. Here a scroll, a window
+// resize or a ResizeObserver callback marks every rect stale, and the next
+// read re-measures all observed elements together, so a frame costs at most one
+// layout and a frame with no scroll or resize costs none.
+//
+// Transforms move elements without any of those signals, so code that
+// animates position (reveal tweens, magnetism) calls invalidate() itself:
+// with an element to re-read just that one, without one to re-read them all.
+
+export interface Box {
+  left: number
+  top: number
+  width: number
+  height: number
+}
+
+export class GeometryCache {
+  private boxes = new Map<Element, Box>()
+  private observed = new Map<Element, number>()
+  private stale = true
+  private resizeObserver: ResizeObserver | null = null
+  private listening = false
+
+  private markStale = () => {
+    this.stale = true
+  }
+
+  // Start caching `el`; returns a function that stops it
+  observe(el: Element): () => void {
+    this.listen()
+    const count = this.observed.get(el) ?? 0
+    this.observed.set(el, count + 1)
+    if (count === 0) this.resizeObserver?.observe(el)
+    this.stale = true
+
+    let active = true
+    return () => {
+      if (!active) return
+      active = false
+      const remaining = (this.observed.get(el) ?? 1) - 1
+      if (remaining > 0) {
+        this.observed.set(el, remaining)
+        return
+      }
+      this.observed.delete(el)
+      this.boxes.delete(el)
+      this.resizeObserver?.unobserve(el)
+      if (this.observed.size === 0) this.unlisten()
+    }
+  }
+
+  // Current rect of `el`; elements that are not observed are measured directly
+  rect(el: Element): Box {
+    if (this.stale) this.measureAll()
+    let box = this.boxes.get(el)
+    if (!box) {
+      box = measure(el)
+      if (this.observed.has(el)) this.boxes.set(el, box)
+    }
+    return box
+  }
+
+  invalidate(el?: Element) {
+    if (el) this.boxes.delete(el)
+    else this.stale = true
+  }
+
+  private measureAll() {
+    this.boxes.clear()
+    this.observed.forEach((_, el) => this.boxes.set(el, measure(el)))
+    this.stale = false
+  }
+
+  private listen() {
+    if (this.listening) return
+    this.listening = true
+    if ("ResizeObserver" in window) this.resizeObserver = new ResizeObserver(this.markStale)
+    // Capture so scrolling any container, not just the window, counts
+    window.addEventListener("scroll", this.markStale, { capture: true, passive: true })
+    window.addEventListener("resize", this.markStale)
+  }
+
+  private unlisten() {
+    this.listening = false
+    this.resizeObserver?.disconnect()
+    this.resizeObserver = null
+    window.removeEventListener("scroll", this.markStale, { capture: true })
+    window.removeEventListener("resize", this.markStale)
+  }
+}
+
+function measure(el: Element): Box {
+  const { left, top, width, height } = el.getBoundingClientRect()
+  return { left, top, width, height }
+}
+
+// Shared by every component so one scroll marks every cached rect stale once
+export const geometry = new GeometryCache()
@@ -0,0 +1,50 @@
+// Shared pool of particle elements for the MagicBento cards.
+//
+// Hovering used to clone a fresh set of particle divs per card on every enter
+// and remove them on leave. The pool instead creates at most `maxLive`
+// elements for the whole page and hands them out again: a released particle
+// stays in its card, hidden, and is reused in place the next time that card
+// asks, or moved to another card if none is free there. Callers animate only
+// transform and opacity, so reuse never touches layout.
+
+export class ParticlePool {
+  private readonly maxLive: number
+  private readonly className: string
+  private free: HTMLDivElement[] = []
+  private live = 0
+
+  constructor(maxLive: number, className = "particle") {
+    this.maxLive = maxLive
+    this.className = className
+  }
+
+  get liveCount() {
+    return this.live
+  }
+
+  // Null once `maxLive` particles are out, across every card
+  acquire(parent: HTMLElement): HTMLDivElement | null {
+    if (this.live >= this.maxLive) return null
+    this.live++
+
+    const index = this.free.findIndex((el) => el.parentNode === parent)
+    if (index >= 0) {
+      const el = this.free[index]
+      this.free[index] = this.free[this.free.length - 1]
+      this.free.pop()
+      return el
+    }
+
+    const el = this.free.pop() ?? document.createElement("div")
+    el.className = this.className
+    parent.appendChild(el)
+    return el
+  }
+
+  // The caller stops the particle's tweens first; it is hidden until reused
+  release(el: HTMLDivElement) {
+    el.style.opacity = "0"
+    this.free.push(el)
+    this.live--
+  }
+}
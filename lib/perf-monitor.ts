@@ -0,0 +1,185 @@
+// Frame-time, long-task and GSAP tween instrumentation for the animation
+// components. Off unless the page is opened with ?perf=1 or the build sets
+// NEXT_PUBLIC_PERF_MONITOR=1; when off, every hook below returns immediately.
+//
+// When on, `window.__PERF__` exposes `snapshot()` and `reset()` for the
+// Playwright suite (see testsprite_tests/perf_collector.py).
+
+export type PerfComponent =
+  | "target-cursor"
+  | "custom-cursor"
+  | "magic-bento"
+  | "dot-grid"
+  | "scroll-reveal"
+  | "dock"
+
+// Work can be timed per component or per named part of one, e.g. "dot-grid:click"
+export type PerfWorkLabel = PerfComponent | `${PerfComponent}:${string}`
+
+export interface PerfStats {
+  p50: number
+  p95: number
+  max: number
+}
+
+export interface PerfSnapshot {
+  elapsedMs: number
+  frames: number
+  fps: number
+  frameMs: PerfStats
+  // Frames that took longer than 1.5x the 60Hz budget
+  slowFrames: number
+  longTasks: { count: number; totalMs: number; maxMs: number }
+  tweens: Partial<Record<PerfComponent, number>>
+  workMs: Partial<Record<PerfWorkLabel, { total: number; max: number; calls: number }>>
+  // From a pointer event to the paint of the frame that handled it
+  inputLatencyMs: Partial<Record<PerfWorkLabel, PerfStats & { count: number }>>
+  activeTweens: number
+  // Elements in the document when the snapshot was taken
+  domNodes: number
+}
+
+declare global {
+  interface Window {
+    __PERF__?: { snapshot: () => PerfSnapshot; reset: () => void }
+  }
+}
+
+// Only the most recent frames are kept, about a minute at 60fps
+const MAX_FRAMES = 3600
+const SLOW_FRAME_MS = (1000 / 60) * 1.5
+
+let enabled = false
+let startedAt = 0
+let frameDurations: number[] = []
+let lastFrame = 0
+let longTasks: { count: number; totalMs: number; maxMs: number } = { count: 0, totalMs: 0, maxMs: 0 }
+let tweens: Partial<Record<PerfComponent, number>> = {}
+let work: Partial<Record<PerfWorkLabel, { total: number; max: number; calls: number }>> = {}
+let inputLatency: Partial<Record<PerfWorkLabel, number[]>> = {}
+let paintChannel: MessageChannel | null = null
+const pendingPaints: { label: PerfWorkLabel; eventTime: number }[] = []
+let activeTweenCount: () => number = () => 0
+
+export function isPerfMonitorEnabled(): boolean {
+  if (typeof window === "undefined") return false
+  if (process.env.NEXT_PUBLIC_PERF_MONITOR === "1") return true
+  return new URLSearchParams(window.location.search).get("perf") === "1"
+}
+
+function reset() {
+  startedAt = performance.now()
+  lastFrame = 0
+  frameDurations = []
+  longTasks = { count: 0, totalMs: 0, maxMs: 0 }
+  tweens = {}
+  work = {}
+  inputLatency = {}
+}
+
+function stats(values: number[]): PerfStats {
+  if (values.length === 0) return { p50: 0, p95: 0, max: 0 }
+  const sorted = [...values].sort((a, b) => a - b)
+  const at = (pct: number) => sorted[Math.min(sorted.length - 1, Math.ceil((pct / 100) * sorted.length) - 1)]
+  const round = (value: number) => Math.round(value * 10) / 10
+  return { p50: round(at(50)), p95: round(at(95)), max: round(sorted[sorted.length - 1]) }
+}
+
+function snapshot(): PerfSnapshot {
+  const elapsedMs = performance.now() - startedAt
+  return {
+    elapsedMs: Math.round(elapsedMs),
+    frames: frameDurations.length,
+    fps: elapsedMs > 0 ? Math.round((frameDurations.length / elapsedMs) * 10000) / 10 : 0,
+    frameMs: stats(frameDurations),
+    slowFrames: frameDurations.filter((duration) => duration > SLOW_FRAME_MS).length,
+    longTasks: { ...longTasks },
+    tweens: { ...tweens },
+    workMs: JSON.parse(JSON.stringify(work)),
+    inputLatencyMs: Object.fromEntries(
+      Object.entries(inputLatency).map(([label, values]) => [label, { ...stats(values), count: values.length }]),
+    ),
+    activeTweens: activeTweenCount(),
+    domNodes: document.getElementsByTagName("*").length,
+  }
+}
+
+/**
+ * Start recording if the monitor is enabled. Safe to call more than once.
+ * `countActiveTweens` lets the caller report GSAP's live tween count without
+ * this module importing gsap.
+ */
+export function startPerfMonitor(countActiveTweens?: () => number) {
+  if (enabled || !isPerfMonitorEnabled()) return
+  enabled = true
+  if (countActiveTweens) activeTweenCount = countActiveTweens
+  reset()
+
+  const onFrame = (now: number) => {
+    if (lastFrame) {
+      frameDurations.push(now - lastFrame)
+      if (frameDurations.length > MAX_FRAMES) frameDurations.shift()
+    }
+    lastFrame = now
+    requestAnimationFrame(onFrame)
+  }
+  requestAnimationFrame(onFrame)
+
+  if (typeof PerformanceObserver !== "undefined" && PerformanceObserver.supportedEntryTypes?.includes("longtask")) {
+    new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) {
+        longTasks.count++
+        longTasks.totalMs += entry.duration
+        longTasks.maxMs = Math.max(longTasks.maxMs, entry.duration)
+      }
+    }).observe({ type: "longtask", buffered: false })
+  }
+
+  window.__PERF__ = { snapshot, reset }
+}
+
+// Count GSAP tweens (or sets) a component creates
+export function countTween(component: PerfComponent, count = 1) {
+  if (!enabled) return
+  tweens[component] = (tweens[component] ?? 0) + count
+}
+
+// Start timing a block of per-frame work; pass the result to endWork()
+export function beginWork(): number {
+  return enabled ? performance.now() : 0
+}
+
+export function endWork(label: PerfWorkLabel, startedAt: number) {
+  if (!enabled || !startedAt) return
+  recordWork(label, performance.now() - startedAt)
+}
+
+// Record work timed elsewhere, e.g. frames drawn by the DotGrid worker
+export function recordWork(label: PerfWorkLabel, duration: number) {
+  if (!enabled) return
+  const entry = (work[label] ??= { total: 0, max: 0, calls: 0 })
+  entry.total += duration
+  entry.max = Math.max(entry.max, duration)
+  entry.calls++
+}
+
+/**
+ * Call from the rAF callback that applied a pointer event, with the event's
+ * timeStamp. A message posted during a frame is delivered once that frame
+ * has painted, so the recorded time runs from input to paint.
+ */
+export function recordInputToPaint(label: PerfWorkLabel, eventTime: number) {
+  if (!enabled || !eventTime) return
+  if (!paintChannel) {
+    paintChannel = new MessageChannel()
+    paintChannel.port1.onmessage = () => {
+      const pending = pendingPaints.shift()
+      if (!pending) return
+      const values = (inputLatency[pending.label] ??= [])
+      values.push(performance.now() - pending.eventTime)
+      if (values.length > MAX_FRAMES) values.shift()
+    }
+  }
+  pendingPaints.push({ label, eventTime })
+  paintChannel.port2.postMessage(null)
+}
@@ -0,0 +1,150 @@
+// One document-level pointer pipeline shared by every pointer-driven effect:
+// the cursors, MagicBento, the spotlight and DotGrid.
+//
+// Events only record the latest position; subscribers run once per animation
+// frame with it, so however fast the mouse reports, each effect does its work
+// (and starts its tweens) at most once per frame. Scrolling also schedules a
+// frame, since content moving under a still pointer changes what it is over.
+// Subscribers given a perf label are timed individually, so the monitor shows
+// what each one costs per frame.
+
+import { beginWork, endWork, recordInputToPaint, type PerfWorkLabel } from "@/lib/perf-monitor"
+
+export interface PointerState {
+  x: number
+  y: number
+  // Velocity in px/s between the last two frames with movement; 0 once still
+  vx: number
+  vy: number
+  target: EventTarget | null
+  // False once the pointer has left the document
+  inside: boolean
+  // A mouse button is held
+  down: boolean
+  // What scheduled this frame: a mouse move, a scroll, or both. After a
+  // scroll without a move, `target` may no longer be under the pointer.
+  moved: boolean
+  scrolled: boolean
+  // event.timeStamp of the first move this frame handles, for input latency
+  movedAt: number
+  // requestAnimationFrame timestamp of this frame
+  time: number
+}
+
+export type PointerListener = (pointer: PointerState) => void
+
+const listeners = new Map<PointerListener, PerfWorkLabel | undefined>()
+const pointer: PointerState = {
+  x: 0,
+  y: 0,
+  vx: 0,
+  vy: 0,
+  target: null,
+  inside: false,
+  down: false,
+  moved: false,
+  scrolled: false,
+  movedAt: 0,
+  time: 0,
+}
+const MAX_VELOCITY_GAP_MS = 100
+
+let frame = 0
+let lastX = 0
+let lastY = 0
+let lastMoveTime = 0
+
+function flush(now: number) {
+  frame = 0
+  pointer.time = now
+  if (pointer.moved) {
+    // A move after a pause starts from rest rather than averaging over the pause
+    const dt = now - lastMoveTime <= MAX_VELOCITY_GAP_MS ? (now - lastMoveTime) / 1000 : 0
+    pointer.vx = dt > 0 ? (pointer.x - lastX) / dt : 0
+    pointer.vy = dt > 0 ? (pointer.y - lastY) / dt : 0
+    lastX = pointer.x
+    lastY = pointer.y
+    lastMoveTime = now
+  } else {
+    pointer.vx = 0
+    pointer.vy = 0
+  }
+
+  listeners.forEach((label, listener) => {
+    if (!label) {
+      listener(pointer)
+      return
+    }
+    const workStart = beginWork()
+    listener(pointer)
+    endWork(label, workStart)
+    if (pointer.moved) recordInputToPaint(label, pointer.movedAt)
+  })
+  pointer.moved = false
+  pointer.scrolled = false
+}
+
+// Run subscribers next frame even without new input, for effects that keep
+// animating after the pointer stops (trails, particles)
+export function requestPointerFrame() {
+  if (!frame && listeners.size > 0) frame = requestAnimationFrame(flush)
+}
+
+function onMove(e: MouseEvent) {
+  if (!pointer.moved) pointer.movedAt = e.timeStamp
+  if (!pointer.inside) {
+    // Entering the page is not a jump worth a velocity
+    lastX = e.clientX
+    lastY = e.clientY
+  }
+  pointer.x = e.clientX
+  pointer.y = e.clientY
+  pointer.target = e.target
+  pointer.inside = true
+  pointer.moved = true
+  requestPointerFrame()
+}
+
+function onScroll() {
+  pointer.scrolled = true
+  requestPointerFrame()
+}
+
+function onLeave() {
+  pointer.inside = false
+  requestPointerFrame()
+}
+
+function onDown() {
+  pointer.down = true
+  requestPointerFrame()
+}
+
+function onUp() {
+  pointer.down = false
+  requestPointerFrame()
+}
+
+// `label` times this subscriber in the perf monitor, along with the input
+// latency of the frames it handles
+export function subscribePointer(listener: PointerListener, label?: PerfWorkLabel): () => void {
+  if (listeners.size === 0) {
+    document.addEventListener("mousemove", onMove, { passive: true })
+    document.addEventListener("mouseleave", onLeave)
+    document.addEventListener("mousedown", onDown)
+    document.addEventListener("mouseup", onUp)
+    window.addEventListener("scroll", onScroll, { capture: true, passive: true })
+  }
+  listeners.set(listener, label)
+
+  return () => {
+    if (!listeners.delete(listener) || listeners.size > 0) return
+    document.removeEventListener("mousemove", onMove)
+    document.removeEventListener("mouseleave", onLeave)
+    document.removeEventListener("mousedown", onDown)
+    document.removeEventListener("mouseup", onUp)
+    window.removeEventListener("scroll", onScroll, { capture: true })
+    cancelAnimationFrame(frame)
+    frame = 0
+  }
+}
@@ -0,0 +1,102 @@
+// The project catalog behind the Projects section, read from
+// data/projects.json and checked when this module loads. The showcase is a
+// server component, so a malformed catalog fails `next build` instead of
+// rendering a broken card, and every view below is computed once at build
+// time rather than filtered on each render in the browser.
+//
+// testsprite_tests/project_catalog.py reads the same JSON for assertions.
+
+import catalog from "@/data/projects.json"
+
+export type ProjectStatus = "completed" | "in-progress" | "planned"
+
+export interface Project {
+  id: string
+  title: string
+  description: string
+  icon: string
+  technologies: string[]
+  category: string
+  liveUrl?: string
+  githubUrl?: string
+  featured: boolean
+  status: ProjectStatus
+}
+
+// Loaded with the details modal (data/project-details.json), not with the cards
+export interface ProjectDetails {
+  longDescription: string
+  highlights?: {
+    title: string
+    tone: "green" | "pink"
+    items: string[]
+  }
+}
+
+export const ALL_PROJECTS = "All"
+
+const STATUSES: readonly ProjectStatus[] = ["completed", "in-progress", "planned"]
+// Category names double as attribute tokens in the showcase's view styles
+const CATEGORY_NAME = /^[A-Za-z0-9-]+$/
+
+function validateCatalog(raw: typeof catalog): { categories: string[]; featuredLimit: number; projects: Project[] } {
+  const problems: string[] = []
+  const categories = raw.categories
+  categories.forEach((category) => {
+    if (!CATEGORY_NAME.test(category)) problems.push(`category ${JSON.stringify(category)} must be letters, digits or "-"`)
+  })
+
+  const ids = new Set<string>()
+  const projects = (raw.projects as Project[]).map((project, index) => {
+    const where = `projects[${index}] (${project.id ?? "no id"})`
+    if (!project.id || ids.has(project.id)) problems.push(`${where}: id must be present and unique`)
+    ids.add(project.id)
+    for (const field of ["title", "description", "icon"] as const) {
+      if (typeof project[field] !== "string" || !project[field].trim()) problems.push(`${where}: ${field} is empty`)
+    }
+    if (!categories.includes(project.category)) problems.push(`${where}: unknown category ${project.category}`)
+    if (!STATUSES.includes(project.status)) problems.push(`${where}: unknown status ${project.status}`)
+    if (!Array.isArray(project.technologies) || project.technologies.length === 0) {
+      problems.push(`${where}: technologies is empty`)
+    }
+    if (!project.liveUrl && !project.githubUrl) problems.push(`${where}: needs a liveUrl or githubUrl`)
+    for (const url of [project.liveUrl, project.githubUrl]) {
+      if (url && !url.startsWith("https://")) problems.push(`${where}: ${url} is not an https URL`)
+    }
+    return project
+  })
+
+  if (!Number.isInteger(raw.featuredLimit) || raw.featuredLimit < 1) problems.push("featuredLimit must be a positive integer")
+  if (problems.length > 0) throw new Error(`Invalid data/projects.json:\n  ${problems.join("\n  ")}`)
+
+  return { categories, featuredLimit: raw.featuredLimit, projects }
+}
+
+const validated = validateCatalog(catalog)
+
+export const PROJECTS: readonly Project[] = validated.projects
+
+// Filter buttons, "All" first
+export const PROJECT_CATEGORIES: readonly string[] = [ALL_PROJECTS, ...validated.categories]
+
+// "All" shows the featured slice; every category shows its own projects
+export const FEATURED_PROJECTS: readonly Project[] = PROJECTS.filter((project) => project.featured).slice(
+  0,
+  validated.featuredLimit,
+)
+
+export const PROJECT_VIEWS: Readonly<Record<string, readonly Project[]>> = Object.fromEntries(
+  PROJECT_CATEGORIES.map((category) => [
+    category,
+    category === ALL_PROJECTS ? FEATURED_PROJECTS : PROJECTS.filter((project) => project.category === category),
+  ]),
+)
+
+// Views each project appears in, as rendered on its card
+export function projectViews(project: Project): string[] {
+  return PROJECT_CATEGORIES.filter((category) => PROJECT_VIEWS[category].includes(project))
+}
+
+export function getProject(id: string): Project | undefined {
+  return PROJECTS.find((project) => project.id === id)
+}
@@ -0,0 +1,101 @@
+export interface RateLimitResult {
+  allowed: boolean
+  remaining: number
+  // Milliseconds until the oldest counted request leaves the window
+  retryAfterMs: number
+}
+
+/**
+ * Storage behind a rate limiter. `hit` records a request for `key` at `now`
+ * (unless the key is already at `limit` within `windowMs`) and returns the
+ * decision. Implement this over Redis or another shared store when running
+ * more than one server instance.
+ */
+export interface RateLimitStore {
+  hit(key: string, now: number, windowMs: number, limit: number): Promise<RateLimitResult>
+}
+
+export interface MemoryStoreOptions {
+  // Most keys kept at once; the least recently seen key is dropped first
+  maxKeys?: number
+}
+
+/**
+ * In-process sliding-window log. Each key keeps the timestamps of its
+ * requests inside the window. The Map doubles as an LRU list: a key is
+ * re-inserted on every hit, so the oldest entries sit at the front and both
+ * expiry and eviction only ever touch the head.
+ */
+export class MemoryRateLimitStore implements RateLimitStore {
+  private entries = new Map<string, { hits: number[]; lastSeen: number }>()
+  private maxKeys: number
+
+  constructor({ maxKeys = 10_000 }: MemoryStoreOptions = {}) {
+    this.maxKeys = maxKeys
+  }
+
+  get size(): number {
+    return this.entries.size
+  }
+
+  async hit(key: string, now: number, windowMs: number, limit: number): Promise<RateLimitResult> {
+    this.sweep(now, windowMs)
+
+    const entry = this.entries.get(key)
+    const hits = entry ? entry.hits.filter((time) => now - time < windowMs) : []
+    const allowed = hits.length < limit
+    if (allowed) {
+      hits.push(now)
+    }
+
+    this.entries.delete(key)
+    this.entries.set(key, { hits, lastSeen: now })
+
+    while (this.entries.size > this.maxKeys) {
+      this.entries.delete(this.entries.keys().next().value as string)
+    }
+
+    return {
+      allowed,
+      remaining: Math.max(0, limit - hits.length),
+      retryAfterMs: allowed ? 0 : Math.max(0, hits[0] + windowMs - now),
+    }
+  }
+
+  // Drop keys not seen for a whole window; they would start fresh anyway
+  private sweep(now: number, windowMs: number) {
+    for (const [key, entry] of this.entries) {
+      if (now - entry.lastSeen < windowMs) {
+        break
+      }
+      this.entries.delete(key)
+    }
+  }
+}
+
+export interface RateLimiterOptions {
+  limit: number
+  windowMs: number
+  store?: RateLimitStore
+}
+
+export function createRateLimiter({ limit, windowMs, store = new MemoryRateLimitStore() }: RateLimiterOptions) {
+  return {
+    check(key: string): Promise<RateLimitResult> {
+      return store.hit(key, Date.now(), windowMs, limit)
+    },
+  }
+}
+
+/**
+ * Client address for rate limiting: the first hop of x-forwarded-for (the
+ * original client; later hops are proxies), then x-real-ip, then "unknown".
+ */
+export function getClientIp(headers: Headers): string {
+  const forwarded = headers.get("x-forwarded-for")
+  const firstHop = forwarded?.split(",")[0]?.trim()
+  if (firstHop) {
+    return firstHop
+  }
+  return headers.get("x-real-ip")?.trim() || "unknown"
+}
@@ -0,0 +1,13 @@
+// Smooth scroll to a page section by id, used by the hero buttons and the dock
+export function scrollToSection(sectionId: string) {
+  try {
+    const element = document.getElementById(sectionId)
+    if (element) {
+      element.scrollIntoView({ behavior: "smooth", block: "start" })
+    } else {
+      console.warn(`Element with id "${sectionId}" not found`)
+    }
+  } catch (error) {
+    console.error("Error scrolling to section:", error)
+  }
+}
@@ -0,0 +1,108 @@
+// One animation clock shared by the text effects (TypingAnimation,
+// DecryptedText) in place of a setInterval/setTimeout chain per instance.
+//
+// A subscriber's tick() returns when it next wants to run: nothing means the
+// next frame, a performance.now() time means "not before then", and Infinity
+// means "until wake()". Between wake-ups the clock sleeps on a single timer
+// instead of spinning requestAnimationFrame, and it stops entirely for
+// subscribers whose element is off screen and while the tab is hidden, so an
+// idle hero costs next to nothing.
+
+import { observeVisibility } from "@/lib/visibility-observer"
+
+export type TickFunction = (now: number) => number | void
+
+export interface TickerSubscription {
+  // Run tick() on the next frame, e.g. after a hover restarts an effect
+  wake(): void
+  cancel(): void
+}
+
+interface Subscriber {
+  tick: TickFunction
+  wakeAt: number
+  visible: boolean
+}
+
+// Wake-ups closer than this are left to requestAnimationFrame
+const FRAME_MS = 1000 / 60
+
+const subscribers = new Set<Subscriber>()
+let frame = 0
+let timer: ReturnType<typeof setTimeout> | null = null
+
+function clearScheduled() {
+  if (frame) cancelAnimationFrame(frame)
+  if (timer) clearTimeout(timer)
+  frame = 0
+  timer = null
+}
+
+function schedule() {
+  clearScheduled()
+  if (document.hidden) return
+
+  let earliest = Number.POSITIVE_INFINITY
+  subscribers.forEach((subscriber) => {
+    if (subscriber.visible) earliest = Math.min(earliest, subscriber.wakeAt)
+  })
+  if (earliest === Number.POSITIVE_INFINITY) return
+
+  const delay = earliest - performance.now()
+  if (delay <= FRAME_MS) {
+    frame = requestAnimationFrame(run)
+  } else {
+    timer = setTimeout(() => {
+      timer = null
+      frame = requestAnimationFrame(run)
+    }, delay - FRAME_MS)
+  }
+}
+
+function run(now: number) {
+  frame = 0
+  subscribers.forEach((subscriber) => {
+    if (!subscriber.visible || subscriber.wakeAt > now) return
+    const next = subscriber.tick(now)
+    subscriber.wakeAt = typeof next === "number" ? next : now
+  })
+  schedule()
+}
+
+function onVisibilityChange() {
+  schedule()
+}
+
+export function prefersReducedMotion(): boolean {
+  return typeof window !== "undefined" && window.matchMedia?.("(prefers-reduced-motion: reduce)").matches === true
+}
+
+// Drive `tick` from the shared clock while `element` is on screen
+export function subscribeTicker(element: Element, tick: TickFunction): TickerSubscription {
+  const subscriber: Subscriber = { tick, wakeAt: 0, visible: false }
+
+  if (subscribers.size === 0) document.addEventListener("visibilitychange", onVisibilityChange)
+  subscribers.add(subscriber)
+
+  const stopObserving = observeVisibility(element, (visible) => {
+    subscriber.visible = visible
+    schedule()
+  })
+
+  return {
+    wake() {
+      subscriber.wakeAt = 0
+      schedule()
+    },
+    cancel() {
+      stopObserving()
+      if (!subscribers.delete(subscriber)) return
+      if (subscribers.size === 0) {
+        document.removeEventListener("visibilitychange", onVisibilityChange)
+        clearScheduled()
+      } else {
+        schedule()
+      }
+    },
+  }
+}
@@ -0,0 +1,55 @@
+// Shared IntersectionObservers for scroll-triggered effects.
+//
+// Every element registered with the same threshold and rootMargin is watched
+// by one observer, which hands each entry to that element's listener. Callers
+// keep their own state; nothing here re-renders or animates.
+
+type VisibilityListener = (visible: boolean) => void
+
+export interface VisibilityOptions {
+  threshold?: number
+  rootMargin?: string
+}
+
+interface SharedObserver {
+  observer: IntersectionObserver
+  listeners: Map<Element, VisibilityListener>
+}
+
+const observers = new Map<string, SharedObserver>()
+
+// Call `listener` whenever `element` starts or stops intersecting; returns a
+// function that stops watching it
+export function observeVisibility(
+  element: Element,
+  listener: VisibilityListener,
+  { threshold = 0, rootMargin = "0px" }: VisibilityOptions = {},
+): () => void {
+  const key = `${threshold}|${rootMargin}`
+  let shared = observers.get(key)
+  if (!shared) {
+    const listeners = new Map<Element, VisibilityListener>()
+    const observer = new IntersectionObserver(
+      (entries) => {
+        for (const entry of entries) listeners.get(entry.target)?.(entry.isIntersecting)
+      },
+      { threshold, rootMargin },
+    )
+    shared = { observer, listeners }
+    observers.set(key, shared)
+  }
+
+  shared.listeners.set(element, listener)
+  shared.observer.observe(element)
+
+  return () => {
+    const current = observers.get(key)
+    if (!current || current.listeners.get(element) !== listener) return
+    current.listeners.delete(element)
+    current.observer.unobserve(element)
+    if (current.listeners.size === 0) {
+      current.observer.disconnect()
+      observers.delete(key)
+    }
+  }
+}
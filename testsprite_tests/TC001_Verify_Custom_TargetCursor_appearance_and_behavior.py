@@ -1,115 +0,0 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Move cursor across different UI elements to observe any cursor animation or changes.
-        frame = context.pages[-1]
-        # Hover over 'Get In Touch' button to observe cursor animation
-        elem = frame.locator('xpath=html/body/div/div[2]/section/div/div/div/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Hover over 'Download Resume' button to observe cursor animation
-        elem = frame.locator('xpath=html/body/div/div[2]/section[4]/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test TargetCursor responsiveness on different screen sizes and devices.
-        await page.mouse.wheel(0, 600)
-        
-
-        # -> Manually move cursor over various interactive elements such as 'View Details' buttons and links to observe any cursor changes or animations.
-        frame = context.pages[-1]
-        # Hover over 'View Details →' button on Portfolio Website card to observe cursor animation
-        elem = frame.locator('xpath=html/body/div/div[2]/section[4]/div[2]/div/div[2]/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Continue testing cursor responsiveness and animation smoothness on other 'View Details →' buttons and different screen sizes/devices.
-        frame = context.pages[-1]
-        # Hover over 'View Details →' button on Email Template Pro card to observe cursor animation
-        elem = frame.locator('xpath=html/body/div/div[2]/section[4]/div[2]/div/div[3]/div/div[6]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test TargetCursor responsiveness and consistent behavior on different screen sizes and devices.
-        await page.mouse.wheel(0, 400)
-        
-
-        # -> Complete the task by verifying TargetCursor responsiveness and consistent behavior on different screen sizes and devices.
-        await page.mouse.wheel(0, -600)
-        
-
-        # -> Test TargetCursor responsiveness and consistent behavior on different screen sizes using browser responsive mode.
-        await page.mouse.wheel(0, -800)
-        
-
-        # -> Manually test the website in responsive mode on desktop to verify TargetCursor behavior and animation consistency across different screen sizes.
-        await page.mouse.wheel(0, 400)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Get In Touch').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Download Resume').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=View Details →').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Portfolio Website').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Email Template Pro').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=TargetCursor').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,83 +0,0 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Hover over each card in the About Me Bento Grid to check magnetism and particle effects.
-        frame = context.pages[-1]
-        # Hover over the first card in the About Me Bento Grid (Full Stack Developer) to test magnetism and particle effects.
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Hover over the first card 'Full Stack Developer' in the About Me section to check magnetism and particle effects.
-        frame = context.pages[-1]
-        # Hover over the 'Full Stack Developer' card in the About Me section to test magnetism and particle effects.
-        elem = frame.locator('xpath=html/body/div/div[2]/section/div/div/div/div[3]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Full Stack Developer').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Passionate developer with expertise in modern web technologies and a love for creating beautiful, functional applications.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=JavaScript/TypeScript').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=React Ecosystem').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Backend Technologies').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Full-Stack').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Featured Projects').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
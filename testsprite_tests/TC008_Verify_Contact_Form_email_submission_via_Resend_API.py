@@ -1,143 +0,0 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Try to input email field using alternative approach or skip and submit form to check response.
-        frame = context.pages[-1]
-        # Click on email input field to focus it
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Try inputting email again after focusing the field
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('test.user@example.com')
-        
-
-        # -> Submit the contact form by clicking the Send Message button.
-        frame = context.pages[-1]
-        # Click the Send Message button to submit the contact form
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Fill the Message field with valid text and submit the form again.
-        frame = context.pages[-1]
-        # Input valid message in the Message field
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div[3]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test message for the contact form submission.')
-        
-
-        frame = context.pages[-1]
-        # Click the Send Message button to submit the contact form
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Fill the Subject field with valid text and submit the form again.
-        frame = context.pages[-1]
-        # Input valid subject in the Subject field
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Project inquiry, collaboration, etc.')
-        
-
-        frame = context.pages[-1]
-        # Click the Send Message button to submit the contact form
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate or trigger a successful form submission to verify the success feedback message is displayed.
-        frame = context.pages[-1]
-        # Reset Name field with valid input
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
-        
-
-        frame = context.pages[-1]
-        # Reset Email field with valid input
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('test.user@example.com')
-        
-
-        frame = context.pages[-1]
-        # Reset Subject field with valid input
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Project inquiry, collaboration, etc.')
-        
-
-        frame = context.pages[-1]
-        # Reset Message field with valid input
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/div[3]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test message for the contact form submission.')
-        
-
-        frame = context.pages[-1]
-        # Click Send Message button to submit the form again for success scenario
-        elem = frame.locator('xpath=html/body/div/div[2]/section[5]/div/div[2]/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Email delivery was successful!').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: The contact form submission did not display the expected success or failure feedback message as required by the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
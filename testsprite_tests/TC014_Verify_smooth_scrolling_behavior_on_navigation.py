@@ -1,200 +0,0 @@
-import asyncio
-from playwright import async_api
-from playwright.async_api import expect
-
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click the first internal navigation link in the Dock or other section links to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click first internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 51) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click second internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 52) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click third internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 53) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click fourth internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 46) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click sixth internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 54) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click seventh internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 49) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click eighth internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the next internal navigation link (index 55) to test smooth scrolling.
-        frame = context.pages[-1]
-        # Click ninth internal navigation link in the Dock or other section links to test smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[3]/div/div[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Perform rapid switching between navigation links multiple times to test smooth scrolling responsiveness and smoothness.
-        frame = context.pages[-1]
-        # Click first internal navigation link in the Dock or other section links to test smooth scrolling again for rapid switching test
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[18]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click second internal navigation link in the Dock or other section links to test smooth scrolling again for rapid switching test
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[19]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click third internal navigation link in the Dock or other section links to test smooth scrolling again for rapid switching test
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[20]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click fourth internal navigation link in the Dock or other section links to test smooth scrolling again for rapid switching test
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[21]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click fifth internal navigation link in the Dock or other section links to test smooth scrolling again for rapid switching test
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[22]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Complete testing of remaining internal navigation links for smooth scrolling.
-        frame = context.pages[-1]
-        # Click next internal navigation link to continue testing smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[24]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click next internal navigation link to continue testing smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[25]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click next internal navigation link to continue testing smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[26]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click next internal navigation link to continue testing smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[27]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click next internal navigation link to continue testing smooth scrolling
-        elem = frame.locator('xpath=html/body/div/div[4]/main/div[2]/div/div[2]/turbo-frame/div/div[2]/div/div/div/div/div/div/div/table/tbody/tr/td[28]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Navigation Menu').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Platform').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Solutions').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Resources').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Open Source').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Enterprise').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Pricing').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Sign in').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Sign up').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Xyerophyte').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Follow').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Overview').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Repositories').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Projects').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Packages').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Stars').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Harsh Abasaheb Chavan').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Just a computer enthusiast who loves everything about it.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dubai').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=https://harshchavan.vercel.app/').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
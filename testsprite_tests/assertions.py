@@ -0,0 +1,72 @@
+"""Bulk assertions that check many expectations in one browser evaluation.
+
+A chain of ``expect(frame.locator('text=...').first).to_be_visible()`` calls
+costs one CDP round trip per string and can block for the full timeout on
+each miss. ``expect_texts_visible()`` polls all strings inside the page and
+reports every missing one together once the shared deadline passes.
+"""
+
+import time
+
+# Mirrors Playwright's `text=` matching: case-insensitive substring on
+# whitespace-normalised text, checked on the innermost matching element, which
+# counts as visible when it has a non-empty box and is not visibility:hidden.
+_MISSING_TEXTS_JS = """
+(texts) => {
+  const norm = (s) => (s || "").replace(/\\s+/g, " ").trim().toLowerCase()
+  const body = document.body
+  if (!body) return texts
+  const pageText = norm(body.textContent)
+  const elements = Array.from(body.querySelectorAll("*")).filter(
+    (el) => el.tagName !== "SCRIPT" && el.tagName !== "STYLE",
+  )
+  const textOf = new Map()
+  const getText = (el) => {
+    let text = textOf.get(el)
+    if (text === undefined) {
+      text = norm(el.textContent)
+      textOf.set(el, text)
+    }
+    return text
+  }
+  const isVisible = (el) => {
+    const rect = el.getBoundingClientRect()
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden"
+  }
+  const isVisibleMatch = (key) => {
+    if (!pageText.includes(key)) return false
+    return elements.some((el) => {
+      if (!getText(el).includes(key)) return false
+      const innermost = !Array.from(el.children).some((child) => getText(child).includes(key))
+      return innermost && isVisible(el)
+    })
+  }
+  return texts.filter((text) => !isVisibleMatch(norm(text)))
+}
+"""
+
+
+async def expect_texts_visible(scope, texts, timeout=30000, poll_ms=100):
+    """Assert every string in ``texts`` is visible in ``scope`` (a page or frame).
+
+    All strings share one ``timeout``. Returns the elapsed seconds on success;
+    on failure raises AssertionError naming every string still missing.
+    """
+    texts = list(texts)
+    started = time.perf_counter()
+    try:
+        await scope.wait_for_function(
+            f"(texts) => ({_MISSING_TEXTS_JS})(texts).length === 0",
+            arg=texts,
+            timeout=timeout,
+            polling=poll_ms,
+        )
+    except Exception:
+        missing = await scope.evaluate(_MISSING_TEXTS_JS, texts)
+        elapsed = time.perf_counter() - started
+        if missing:
+            listed = "\n".join(f"  - {text}" for text in missing)
+            raise AssertionError(
+                f"{len(missing)} of {len(texts)} texts not visible after {elapsed:.2f}s:\n{listed}"
+            ) from None
+    return time.perf_counter() - started
@@ -0,0 +1,276 @@
+"""Bundle-size and time-to-interactive report for a production build.
+
+``pnpm build`` runs it as its ``postbuild`` step with ``--serve``, which
+starts ``next start`` on a spare port for the TTI half and stops it after.
+It can also be run by hand against a server that is already up
+(``--skip-tti`` reports sizes only):
+
+    pnpm build
+    python testsprite_tests/bundle_report.py
+    python testsprite_tests/bundle_report.py --skip-tti --max-growth-kb 5
+
+Without Playwright installed, TTI is skipped with a note rather than
+failing the build.
+
+Sizes come from ``.next``: the first-load JavaScript of ``/`` (the root main
+files plus the layout and page chunks from ``app-build-manifest.json``) and,
+separately, every other chunk, which is what the lazy islands load later. TTI
+is measured in Chromium as the end of the last long task before a quiet
+window, or first contentful paint / DOMContentLoaded if later, and is the
+median of ``--runs`` loads.
+
+Each report is saved as ``tmp/bundle_report.json`` and appended to
+``tmp/bundle_history.jsonl``. The exit status is 1 when first-load JS (gzip)
+or TTI grew past the limits since the previous build in the history.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+from config import BASE_URL
+
+ROOT = Path(__file__).resolve().parent.parent
+NEXT_DIR = ROOT / ".next"
+RESULTS_DIR = Path(__file__).resolve().parent / "tmp"
+HISTORY = RESULTS_DIR / "bundle_history.jsonl"
+
+# How long ``--serve`` gives ``next start`` to answer
+SERVE_TIMEOUT_S = 60
+
+# A page is interactive once this long has passed without a long task
+QUIET_WINDOW_MS = 5000
+MAX_WAIT_MS = 30000
+
+_LONG_TASKS_INIT = """
+window.__LONG_TASKS__ = []
+try {
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      window.__LONG_TASKS__.push({ start: entry.startTime, end: entry.startTime + entry.duration })
+    }
+  }).observe({ type: "longtask", buffered: true })
+} catch (error) {}
+"""
+
+_TIMINGS_JS = """
+() => {
+  const nav = performance.getEntriesByType("navigation")[0]
+  const fcp = performance.getEntriesByName("first-contentful-paint")[0]
+  const tasks = window.__LONG_TASKS__ || []
+  return {
+    now: performance.now(),
+    dcl: nav ? nav.domContentLoadedEventEnd : 0,
+    load: nav ? nav.loadEventEnd : 0,
+    fcp: fcp ? fcp.startTime : 0,
+    longTasks: tasks.length,
+    lastLongTaskEnd: tasks.length ? Math.max(...tasks.map((task) => task.end)) : 0,
+  }
+}
+"""
+
+
+def _size(path):
+    data = path.read_bytes()
+    return len(data), len(gzip.compress(data, compresslevel=9))
+
+
+def _kb(n):
+    return round(n / 1024, 1)
+
+
+def bundle_sizes(next_dir=NEXT_DIR):
+    """First-load and lazily loaded JavaScript of ``/``, raw and gzipped."""
+    build_manifest = json.loads((next_dir / "build-manifest.json").read_text(encoding="utf-8"))
+    app_manifest = json.loads((next_dir / "app-build-manifest.json").read_text(encoding="utf-8"))
+    pages = app_manifest.get("pages", {})
+
+    first_load = list(build_manifest.get("rootMainFiles", []))
+    for entry in ("/layout", "/page"):
+        first_load += pages.get(entry, [])
+    first_load = sorted({file for file in first_load if file.endswith(".js")})
+
+    raw = gz = 0
+    for file in first_load:
+        size, packed = _size(next_dir / file)
+        raw += size
+        gz += packed
+
+    lazy_raw = lazy_gz = lazy_count = 0
+    for path in sorted((next_dir / "static" / "chunks").rglob("*.js")):
+        relative = path.relative_to(next_dir).as_posix()
+        if relative in first_load or "/pages/" in relative:
+            continue
+        size, packed = _size(path)
+        lazy_raw += size
+        lazy_gz += packed
+        lazy_count += 1
+
+    return {
+        "first_load_files": len(first_load),
+        "first_load_kb": _kb(raw),
+        "first_load_gzip_kb": _kb(gz),
+        "other_chunks": lazy_count,
+        "other_chunks_kb": _kb(lazy_raw),
+        "other_chunks_gzip_kb": _kb(lazy_gz),
+    }
+
+
+async def _measure_once(browser, url):
+    context = await browser.new_context()
+    try:
+        await context.add_init_script(_LONG_TASKS_INIT)
+        page = await context.new_page()
+        await page.goto(url, wait_until="load", timeout=MAX_WAIT_MS)
+        while True:
+            timings = await page.evaluate(_TIMINGS_JS)
+            quiet_since = max(timings["lastLongTaskEnd"], timings["fcp"], timings["dcl"])
+            if timings["now"] - quiet_since >= QUIET_WINDOW_MS or timings["now"] >= MAX_WAIT_MS:
+                break
+            await page.wait_for_timeout(250)
+        timings["tti"] = quiet_since
+        return timings
+    finally:
+        await context.close()
+
+
+@contextmanager
+def serve_build(port):
+    """Run ``next start`` on ``port`` until the block exits; yields its base URL."""
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen([str(ROOT / "node_modules" / ".bin" / "next"), "start", "-p", str(port)],
+                              cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + SERVE_TIMEOUT_S
+        while True:
+            try:
+                with urllib.request.urlopen(base_url + "/", timeout=5):
+                    break
+            except OSError:
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"next start did not serve {base_url}") from None
+                time.sleep(0.25)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+async def measure_tti(url, runs):
+    from playwright import async_api
+
+    import harness
+
+    async with async_api.async_playwright() as pw:
+        browser = await harness.launch_browser(pw)
+        try:
+            samples = [await _measure_once(browser, url) for _ in range(runs)]
+        finally:
+            await browser.close()
+
+    def median(key):
+        return round(statistics.median(sample[key] for sample in samples))
+
+    return {
+        "runs": runs,
+        "fcp_ms": median("fcp"),
+        "dcl_ms": median("dcl"),
+        "load_ms": median("load"),
+        "tti_ms": median("tti"),
+        "long_tasks": median("longTasks"),
+    }
+
+
+def previous_report(build_id):
+    """The last history entry from a different build, if any."""
+    if not HISTORY.exists():
+        return None
+    previous = None
+    for line in HISTORY.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            entry = json.loads(line)
+            if entry.get("build_id") != build_id:
+                previous = entry
+    return previous
+
+
+def regressions(report, previous, max_growth_kb, max_tti_growth_ms):
+    if not previous:
+        return []
+    problems = []
+    growth = report["bundle"]["first_load_gzip_kb"] - previous["bundle"]["first_load_gzip_kb"]
+    if growth > max_growth_kb:
+        problems.append(f"first-load JS grew {growth:.1f} KB gzip (limit {max_growth_kb:g} KB)")
+    if report.get("timing") and previous.get("timing"):
+        slower = report["timing"]["tti_ms"] - previous["timing"]["tti_ms"]
+        if slower > max_tti_growth_ms:
+            problems.append(f"TTI grew {slower} ms (limit {max_tti_growth_ms:g} ms)")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--next-dir", type=Path, default=NEXT_DIR, help="build output (default: .next)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--serve", type=int, nargs="?", const=3100, metavar="PORT",
+                        help="start the build with next start on PORT (default: 3100) for the TTI runs")
+    parser.add_argument("--runs", type=int, default=3, help="page loads for the TTI median (default: 3)")
+    parser.add_argument("--skip-tti", action="store_true", help="report bundle sizes only")
+    parser.add_argument("--max-growth-kb", type=float, default=10, help="allowed first-load gzip growth (default: 10)")
+    parser.add_argument("--max-tti-growth-ms", type=float, default=500, help="allowed TTI growth (default: 500)")
+    args = parser.parse_args(argv)
+
+    if not (args.next_dir / "build-manifest.json").exists():
+        parser.error(f"no build found in {args.next_dir}; run `pnpm build` first")
+
+    skip_tti = args.skip_tti
+    if not skip_tti:
+        try:
+            import playwright  # noqa: F401
+        except ImportError:
+            print("Playwright is not installed; reporting bundle sizes only")
+            skip_tti = True
+
+    build_id_file = args.next_dir / "BUILD_ID"
+    report = {
+        "build_id": build_id_file.read_text(encoding="utf-8").strip() if build_id_file.exists() else None,
+        "measured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "bundle": bundle_sizes(args.next_dir),
+        "timing": None,
+    }
+    if not skip_tti and args.serve:
+        with serve_build(args.serve) as base_url:
+            report["timing"] = asyncio.run(measure_tti(base_url + "/", max(1, args.runs)))
+    elif not skip_tti:
+        report["timing"] = asyncio.run(measure_tti(args.base_url + "/", max(1, args.runs)))
+    problems = regressions(report, previous_report(report["build_id"]), args.max_growth_kb, args.max_tti_growth_ms)
+    report["regressions"] = problems
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    (RESULTS_DIR / "bundle_report.json").write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    with HISTORY.open("a", encoding="utf-8") as history:
+        history.write(json.dumps(report) + "\n")
+
+    bundle = report["bundle"]
+    print(f"build {report['build_id']}: first-load JS {bundle['first_load_kb']} KB "
+          f"({bundle['first_load_gzip_kb']} KB gzip, {bundle['first_load_files']} files), "
+          f"{bundle['other_chunks']} other chunks {bundle['other_chunks_gzip_kb']} KB gzip")
+    if report["timing"]:
+        timing = report["timing"]
+        print(f"FCP {timing['fcp_ms']} ms, DCL {timing['dcl_ms']} ms, TTI {timing['tti_ms']} ms "
+              f"(median of {timing['runs']}, {timing['long_tasks']} long tasks)")
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
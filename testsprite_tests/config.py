@@ -0,0 +1,9 @@
+"""Settings shared by the suite and the HTTP-only tools.
+
+Kept free of third-party imports so ``load_harness.py`` and the benches built
+on it run with just httpx installed, without Playwright.
+"""
+
+import os
+
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000")
@@ -0,0 +1,94 @@
+"""Latency benchmark for ``POST /api/contact`` against the email stand-in.
+
+Start the stand-in with a fixed per-message latency, start the dev server in
+one EMAIL_DELIVERY_MODE, run the bench, then repeat with another mode:
+
+    python testsprite_tests/email_stub.py --latency 0.2 &
+    EMAIL_TRANSPORT=http EMAIL_DELIVERY_MODE=sequential pnpm dev
+    python testsprite_tests/contact_bench.py -n 200 -c 10
+    EMAIL_TRANSPORT=http EMAIL_DELIVERY_MODE=concurrent pnpm dev
+    python testsprite_tests/contact_bench.py -n 200 -c 10
+
+Each run is saved as ``tmp/contact_bench_<mode>.json`` (the mode is read from
+the route's ``delivery`` field) and every saved mode is printed side by side.
+Requests carry distinct ``X-Forwarded-For`` addresses so the per-IP rate
+limit does not turn the bench into a 429 test. As with ``load_harness.py``,
+a server that would deliver real email is refused unless
+``--allow-real-email`` is given.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+
+import httpx
+
+import load_harness
+from config import BASE_URL
+
+RESULTS_DIR = load_harness.RESULTS_DIR
+
+
+def delivery_mode(response):
+    try:
+        return (response.json().get("delivery") or {}).get("mode")
+    except ValueError:
+        return None
+
+
+async def bench(total, concurrency, base_url, timeout, allow_real_email=False):
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+        await load_harness.check_email_transport(client, allow_real_email)
+        # One request up front so dev-mode compilation is not measured
+        await client.post("/api/contact", json={}, headers={"X-Forwarded-For": "10.255.255.255"})
+        samples, elapsed = await load_harness.run_load(
+            client, "contact", total, concurrency, sizes=load_harness.PAYLOAD_SIZES[:1],
+            inspect=delivery_mode, first=random.randrange(1, 2 ** 24 - total),
+        )
+
+    report = load_harness.summarize(samples, elapsed)
+    latency = report["latency_by_status_ms"].get("200") or {}
+    modes = {sample.tag for sample in samples if sample.tag}
+    return {
+        "mode": "/".join(sorted(modes)) or "unknown",
+        "requests": total,
+        "concurrency": concurrency,
+        "ok": report["status_counts"].get("200", 0),
+        "errors": total - report["status_counts"].get("200", 0),
+        "elapsed_s": report["elapsed_s"],
+        "p50_ms": latency.get("p50"),
+        "p95_ms": latency.get("p95"),
+        "mean_ms": latency.get("mean"),
+    }
+
+
+def print_comparison():
+    rows = [json.loads(path.read_text(encoding="utf-8")) for path in sorted(RESULTS_DIR.glob("contact_bench_*.json"))]
+    print(f"\n{'mode':<12} {'ok':>6} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9}")
+    for row in rows:
+        print(f"{row['mode']:<12} {row['ok']:>6} {row['p50_ms'] or '-':>9} {row['p95_ms'] or '-':>9} {row['mean_ms'] or '-':>9}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--requests", type=int, default=100, help="requests to send (default: 100)")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="requests in flight (default: 10)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=float, default=15, help="per-request timeout in seconds (default: 15)")
+    load_harness.add_email_arguments(parser)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(bench(args.requests, max(1, args.concurrency), args.base_url, args.timeout,
+                               args.allow_real_email))
+    RESULTS_DIR.mkdir(exist_ok=True)
+    (RESULTS_DIR / f"contact_bench_{result['mode']}.json").write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+
+    print(f"{result['ok']}/{result['requests']} OK in {result['elapsed_s']:.1f}s ({result['mode']} delivery)")
+    print_comparison()
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
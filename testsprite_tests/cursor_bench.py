@@ -0,0 +1,122 @@
+"""Input-to-paint latency of the TargetCursor over the hero buttons and project cards.
+
+Drives synthetic mouse paths with ``page.mouse``: from a random point to each
+target, a wiggle across it, and off again, so every path covers following the
+pointer, snapping the corners onto a target, parallax while over it and the
+release. The page runs with ``?perf=1``; the cursor records, for every frame
+that handled a move, the time from the first ``mousemove`` to the paint of
+that frame (``inputLatencyMs["target-cursor"]``) and how long its frame work
+took (``workMs["target-cursor"]``):
+
+    python testsprite_tests/cursor_bench.py
+    python testsprite_tests/cursor_bench.py --paths 10 --steps 40
+
+Results are written to ``tmp/cursor_bench.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+
+from playwright import async_api
+
+import harness
+import load_harness
+import perf_collector
+import readiness
+import selector_map
+
+TARGETS = ("hero.get_in_touch", "hero.download_resume", "project.card[0]", "project.card[1]", "project.card[2]")
+
+RESULTS_DIR = load_harness.RESULTS_DIR
+
+
+async def drive_path(page, box, steps, rng):
+    """Approach ``box`` from a random point, wiggle across it, then leave."""
+    viewport = page.viewport_size
+    await page.mouse.move(rng.uniform(0, viewport["width"]), rng.uniform(0, viewport["height"]))
+    center_x = box["x"] + box["width"] / 2
+    center_y = box["y"] + box["height"] / 2
+    await page.mouse.move(center_x, center_y, steps=steps)
+    for _ in range(steps):
+        await page.mouse.move(
+            box["x"] + rng.uniform(0.1, 0.9) * box["width"],
+            box["y"] + rng.uniform(0.1, 0.9) * box["height"],
+        )
+        await page.wait_for_timeout(16)
+    await page.mouse.move(center_x, box["y"] - 80, steps=steps // 2)
+
+
+async def bench(paths, steps, seed, headless):
+    rng = random.Random(seed)
+    results = []
+    async with async_api.async_playwright() as pw:
+        browser = await harness.launch_browser(pw, headless=headless)
+        try:
+            context = await browser.new_context(viewport={"width": 1280, "height": 720})
+            page = await context.new_page()
+            await harness.load_home(page, harness.BASE_URL + "/" + perf_collector.PERF_QUERY)
+            await perf_collector.enable(page)
+
+            for name in TARGETS:
+                locator = await selector_map.require(page, name, timeout=5000)
+                await locator.scroll_into_view_if_needed(timeout=5000)
+                await readiness.settle(page)
+                box = await locator.bounding_box()
+                if not box:
+                    print(f"skipping {name}: not visible")
+                    continue
+
+                await perf_collector.reset(page)
+                for _ in range(paths):
+                    await drive_path(page, box, steps, rng)
+                await readiness.settle(page)
+                snapshot = await perf_collector.collect(page)
+
+                latency = (snapshot.get("inputLatencyMs") or {}).get("target-cursor") or {}
+                work = (snapshot.get("workMs") or {}).get("target-cursor") or {}
+                results.append({
+                    "target": name,
+                    "frames": latency.get("count", 0),
+                    "latency_ms": {key: latency.get(key) for key in ("p50", "p95", "max")},
+                    "work_mean_ms": round(work["total"] / work["calls"], 3) if work.get("calls") else None,
+                    "work_max_ms": round(work["max"], 3) if work.get("calls") else None,
+                    "fps": snapshot["fps"],
+                    "long_tasks": snapshot["longTasks"]["count"],
+                })
+            await context.close()
+        finally:
+            await browser.close()
+    return results
+
+
+def print_table(rows):
+    print(f"\n{'target':<22} {'frames':>6} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7} {'work ms':>8} {'fps':>6}")
+    for row in rows:
+        latency = row["latency_ms"]
+        print(f"{row['target']:<22} {row['frames']:>6} {latency['p50'] or '-':>7} {latency['p95'] or '-':>7} "
+              f"{latency['max'] or '-':>7} {row['work_mean_ms'] or '-':>8} {row['fps']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--paths", type=int, default=5, help="mouse paths per target (default: 5)")
+    parser.add_argument("--steps", type=int, default=30, help="mouse events per path segment (default: 30)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the paths (default: 1)")
+    parser.add_argument("--headed", action="store_true", help="show the browser")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(bench(args.paths, max(2, args.steps), args.seed, headless=not args.headed))
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    out = RESULTS_DIR / "cursor_bench.json"
+    out.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    print_table(rows)
+    print(f"Report written to {out}")
+    return 0 if rows else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Per-frame and per-click cost of the DotGrid background at common resolutions.
+
+Opens the home page with ``?perf=1`` at 1080p, 1440p and 4K and, for each,
+records how long the grid's frame callback (``workMs["dot-grid"]``) and its
+click handler (``workMs["dot-grid:click"]``) take while the pointer sweeps the
+viewport and while shockwaves are fired across it:
+
+    python testsprite_tests/dot_grid_bench.py
+    python testsprite_tests/dot_grid_bench.py --clicks 40 --sizes 1920x1080
+
+Each resolution is run once per backend: ``main`` draws on the main thread,
+``worker`` on an OffscreenCanvas in a Web Worker (``?dotgrid=`` picks one; the
+worker reports its timings as ``dot-grid:worker`` and
+``dot-grid:worker-click``). The ``fps`` column is the main thread's frame rate
+while shockwaves play, which is what the worker is meant to protect.
+
+Clicks are dispatched on ``window`` rather than through ``page.mouse`` so they
+never land on a link. Results are written to ``tmp/dot_grid_bench.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from playwright import async_api
+
+import harness
+import load_harness
+import perf_collector
+
+RESOLUTIONS = ("1920x1080", "2560x1440", "3840x2160")
+
+# workMs labels for (frame, click) cost under each backend
+BACKENDS = {
+    "main": ("dot-grid", "dot-grid:click"),
+    "worker": ("dot-grid:worker", "dot-grid:worker-click"),
+}
+
+RESULTS_DIR = load_harness.RESULTS_DIR
+
+SWEEP_STEPS = 120
+
+
+def _work(snapshot, label):
+    entry = (snapshot.get("workMs") or {}).get(label)
+    if not entry or not entry["calls"]:
+        return {"calls": 0, "mean_ms": None, "max_ms": None}
+    return {
+        "calls": entry["calls"],
+        "mean_ms": round(entry["total"] / entry["calls"], 3),
+        "max_ms": round(entry["max"], 3),
+    }
+
+
+async def _phase(page, run):
+    await perf_collector.reset(page)
+    await run()
+    # Let in-flight shockwaves settle so their frames are counted
+    await page.wait_for_timeout(1500)
+    return await perf_collector.collect(page)
+
+
+async def bench_resolution(browser, width, height, clicks, backend):
+    context = await browser.new_context(viewport={"width": width, "height": height})
+    try:
+        page = await context.new_page()
+        await harness.load_home(page, harness.BASE_URL + "/" + perf_collector.PERF_QUERY + "&dotgrid=" + backend)
+        await perf_collector.enable(page)
+        await page.wait_for_timeout(1000)
+
+        idle = await _phase(page, lambda: page.wait_for_timeout(1000))
+
+        async def sweep():
+            for step in range(SWEEP_STEPS):
+                x = width * step / SWEEP_STEPS
+                await page.mouse.move(x, height * (0.25 + 0.5 * step / SWEEP_STEPS))
+                await page.wait_for_timeout(16)
+
+        moving = await _phase(page, sweep)
+
+        async def fire():
+            for n in range(clicks):
+                x = width * ((n * 0.37) % 1)
+                y = height * ((n * 0.61) % 1)
+                await page.evaluate(
+                    "([x, y]) => window.dispatchEvent(new MouseEvent('click', {clientX: x, clientY: y}))",
+                    [x, y],
+                )
+                await page.wait_for_timeout(50)
+
+        clicking = await _phase(page, fire)
+    finally:
+        await context.close()
+
+    frame_label, click_label = BACKENDS[backend]
+    return {
+        "resolution": f"{width}x{height}",
+        "backend": backend,
+        "idle_frames": _work(idle, frame_label)["calls"],
+        "sweep_frame": _work(moving, frame_label),
+        "sweep_fps": moving["fps"],
+        "click": _work(clicking, click_label),
+        "shockwave_frame": _work(clicking, frame_label),
+        "shockwave_fps": clicking["fps"],
+    }
+
+
+async def bench(resolutions, clicks, backends, headless):
+    async with async_api.async_playwright() as pw:
+        browser = await harness.launch_browser(pw, headless=headless)
+        try:
+            return [await bench_resolution(browser, width, height, clicks, backend)
+                    for width, height in resolutions for backend in backends]
+        finally:
+            await browser.close()
+
+
+def print_table(rows):
+    print(f"\n{'resolution':<11} {'backend':<7} {'idle':>5} {'sweep ms':>9} {'click ms':>9} {'wave ms':>9} {'wave max':>9} {'fps':>6}")
+    for row in rows:
+        print(f"{row['resolution']:<11} {row['backend']:<7} {row['idle_frames']:>5} {row['sweep_frame']['mean_ms'] or '-':>9} "
+              f"{row['click']['mean_ms'] or '-':>9} {row['shockwave_frame']['mean_ms'] or '-':>9} "
+              f"{row['shockwave_frame']['max_ms'] or '-':>9} {row['shockwave_fps']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(RESOLUTIONS),
+                        help="comma-separated WIDTHxHEIGHT viewports (default: %(default)s)")
+    parser.add_argument("--clicks", type=int, default=20, help="shockwaves per resolution (default: 20)")
+    parser.add_argument("--backends", default=",".join(BACKENDS),
+                        help="comma-separated backends to compare (default: %(default)s)")
+    parser.add_argument("--headed", action="store_true", help="show the browser")
+    args = parser.parse_args(argv)
+
+    resolutions = [tuple(int(part) for part in size.lower().split("x")) for size in args.sizes.split(",")]
+    backends = [backend for backend in args.backends.split(",") if backend]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        parser.error(f"unknown backend(s): {', '.join(sorted(unknown))}")
+    rows = asyncio.run(bench(resolutions, args.clicks, backends, headless=not args.headed))
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    out = RESULTS_DIR / "dot_grid_bench.json"
+    out.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    print_table(rows)
+    print("\nidle = frames drawn with the pointer still (should be 0); times are per call")
+    print(f"Report written to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Server CPU per ``POST /api/contact``, across message sizes up to 5000 chars.
+
+The contact route renders the owner notification and the auto-reply from the
+templates in ``lib/email-templates.ts`` and hands both to the email
+transport. This bench sends submissions through that whole path against the
+email stand-in. For each payload size it reads the server's CPU time
+(utime + stime from ``/proc/<pid>/stat``) before and after the phase and
+reports CPU milliseconds per request:
+
+    EMAIL_TRANSPORT=http EMAIL_TRANSPORT_URL=http://127.0.0.1:8025/emails pnpm build && pnpm start
+    python testsprite_tests/email_render_bench.py --email-stub 8025 \\
+        --pid $(pgrep -f "next-server" | head -1) -n 10000
+
+Run it against ``pnpm start`` rather than ``pnpm dev``; dev-mode recompiles and
+logging would dominate the numbers. Before the load, one submission full of
+markup checks that the delivered HTML escapes it and the text keeps it as
+written (only possible with ``--email-stub``, which runs the stand-in in this
+process). Like ``load_harness.py``, it stops before sending anything unless
+the server uses the memory or http transport, or ``--allow-real-email`` is
+given. Results are saved as ``tmp/email_render_bench.json``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+import email_stub
+import load_harness
+from config import BASE_URL
+
+RESULTS_PATH = load_harness.RESULTS_DIR / "email_render_bench.json"
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+MARKUP_PROBE = "<script>alert('x')</script> & \"quoted\" <b>bold</b>"
+
+
+def cpu_seconds(pid):
+    """User + system CPU time of ``pid`` so far, read from /proc."""
+    stat = Path(f"/proc/{pid}/stat").read_text()
+    # Fields after the parenthesised command name; utime and stime are 14 and 15
+    fields = stat[stat.rindex(")") + 2:].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+async def check_escaping(client, stub, ip):
+    """One markup-laden submission; the HTML must escape it, the text must not."""
+    stub.clear()
+    payload = dict(load_harness.contact_payload(0), message=f"Escape probe: {MARKUP_PROBE}")
+    response = await client.post("/api/contact", json=payload, headers={"X-Forwarded-For": ip})
+    if response.status_code != 200:
+        raise AssertionError(f"Escape probe answered {response.status_code}: {response.text[:200]}")
+
+    for message in stub.wait_for(2):
+        if MARKUP_PROBE in message["html"] or "<script>" in message["html"]:
+            raise AssertionError(f"Unescaped markup in the HTML of {message['subject']!r}")
+        if "&lt;script&gt;alert(&#39;x&#39;)&lt;/script&gt;" not in message["html"]:
+            raise AssertionError(f"Escaped message missing from the HTML of {message['subject']!r}")
+        if MARKUP_PROBE not in message["text"]:
+            raise AssertionError(f"Message altered in the text of {message['subject']!r}")
+    stub.clear()
+
+
+async def bench(args, stub):
+    per_size = max(1, args.requests // len(load_harness.PAYLOAD_SIZES))
+    first = random.randrange(1, 2 ** 24 - per_size * (len(load_harness.PAYLOAD_SIZES) + 1))
+    phases = []
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        await load_harness.check_email_transport(client, args.allow_real_email)
+        # One request up front so first-hit compilation is not measured
+        await client.post("/api/contact", json={}, headers={"X-Forwarded-For": "10.255.255.255"})
+        if stub:
+            await check_escaping(client, stub, load_harness.synthetic_ip(first))
+            print("Escaping: markup escaped in HTML, kept as written in text")
+        first += 1
+
+        for size in load_harness.PAYLOAD_SIZES:
+            cpu_before = cpu_seconds(args.pid) if args.pid else None
+            samples, elapsed = await load_harness.run_load(
+                client, "contact", per_size, args.concurrency, sizes=(size,), first=first,
+            )
+            cpu = cpu_seconds(args.pid) - cpu_before if args.pid else None
+            first += per_size
+
+            report = load_harness.summarize(samples, elapsed)
+            ok = report["status_counts"].get("200", 0)
+            latency = report["latency_by_status_ms"].get("200") or {}
+            phases.append({
+                "message_chars": size,
+                "requests": per_size,
+                "ok": ok,
+                "elapsed_s": report["elapsed_s"],
+                "p50_ms": latency.get("p50"),
+                "p95_ms": latency.get("p95"),
+                "cpu_s": round(cpu, 3) if cpu is not None else None,
+                "cpu_ms_per_request": round(cpu * 1000 / per_size, 3) if cpu is not None else None,
+                "emails_delivered": len(stub.sent()) if stub else None,
+            })
+            print(f"{size:>5} chars: {ok}/{per_size} OK in {report['elapsed_s']:.1f}s", end="")
+            print(f", {phases[-1]['cpu_ms_per_request']} CPU ms/request" if cpu is not None else "")
+            if stub:
+                stub.clear()
+
+    return {"requests": per_size * len(phases), "concurrency": args.concurrency, "pid": args.pid,
+            "measured_at": time.time(), "phases": phases}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-n", "--requests", type=int, default=10000,
+                        help="submissions, split evenly across payload sizes (default: 10000)")
+    parser.add_argument("-c", "--concurrency", type=int, default=20, help="requests in flight (default: 20)")
+    parser.add_argument("--pid", type=int, help="server process to read CPU time from")
+    parser.add_argument("--email-stub", type=int, metavar="PORT",
+                        help="run the email stand-in in this process on PORT")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=float, default=15)
+    load_harness.add_email_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stub = email_stub.EmailStub(port=args.email_stub).start() if args.email_stub else None
+    try:
+        result = asyncio.run(bench(args, stub))
+    finally:
+        if stub:
+            stub.stop()
+
+    RESULTS_PATH.parent.mkdir(exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    print(f"Saved {RESULTS_PATH}")
+    if not args.pid:
+        print("No --pid given; CPU not measured")
+
+    failed = [phase for phase in result["phases"] if phase["ok"] != phase["requests"]]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Local stand-in for the Resend API.
+
+Start the dev server with ``EMAIL_TRANSPORT=http`` and the contact routes POST
+each message as JSON to ``EMAIL_TRANSPORT_URL`` instead of calling Resend.
+This module answers those posts, records every message along with how long it
+was held, and offers assertion helpers for the suite:
+
+    EMAIL_TRANSPORT=http EMAIL_TRANSPORT_URL=http://127.0.0.1:8025/emails pnpm dev
+    python testsprite_tests/runner.py --email-stub 8025
+
+Run on its own (``python testsprite_tests/email_stub.py --latency 0.2``) to
+keep a stub up while clicking through the site by hand.
+
+``GET /emails`` lists what has been received and ``DELETE /emails`` clears it.
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8025
+
+_current = None
+
+
+def current():
+    """Return the stub started in this process, or None."""
+    return _current
+
+
+class EmailStub:
+    """Threaded HTTP server that records posted messages.
+
+    ``latency`` is the number of seconds each message is held before the stub
+    answers, mimicking an upstream round trip. ``fail_every`` makes every n-th
+    message answer 502 so partial-failure paths can be exercised.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, latency=0.0, fail_every=0):
+        self.latency = latency
+        self.fail_every = fail_every
+        self.messages = []
+        self._lock = threading.Condition()
+        self._counter = itertools.count(1)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/emails"
+
+    def start(self):
+        global _current
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        _current = self
+        return self
+
+    def stop(self):
+        global _current
+        self._server.shutdown()
+        self._server.server_close()
+        if _current is self:
+            _current = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def clear(self):
+        with self._lock:
+            self.messages.clear()
+
+    def _record(self, payload):
+        number = next(self._counter)
+        started = time.perf_counter()
+        if self.latency:
+            time.sleep(self.latency)
+        failed = bool(self.fail_every) and number % self.fail_every == 0
+        message = dict(payload, id=f"stub-{number}", failed=failed,
+                       latency_s=round(time.perf_counter() - started, 4), received_at=time.time())
+        with self._lock:
+            self.messages.append(message)
+            self._lock.notify_all()
+        return message
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    return self._reply(400, {"error": "invalid JSON"})
+                message = stub._record(payload)
+                if message["failed"]:
+                    return self._reply(502, {"error": "simulated upstream failure"})
+                self._reply(200, {"id": message["id"]})
+
+            def do_GET(self):
+                with stub._lock:
+                    self._reply(200, list(stub.messages))
+
+            def do_DELETE(self):
+                stub.clear()
+                self._reply(200, {"cleared": True})
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    # -- assertions -----------------------------------------------------------
+
+    def sent(self, to=None, subject_contains=None):
+        """Return delivered messages, optionally filtered by recipient and subject."""
+        with self._lock:
+            messages = [m for m in self.messages if not m["failed"]]
+        if to is not None:
+            messages = [m for m in messages if m.get("to") == to]
+        if subject_contains is not None:
+            messages = [m for m in messages if subject_contains in (m.get("subject") or "")]
+        return messages
+
+    def wait_for(self, count, timeout=5.0, **filters):
+        """Block until at least ``count`` matching messages arrived; return them."""
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while True:
+                # sent() takes the lock again; Condition wraps an RLock
+                matching = self.sent(**filters)
+                remaining = deadline - time.monotonic()
+                if len(matching) >= count or remaining <= 0:
+                    break
+                self._lock.wait(remaining)
+        if len(matching) < count:
+            raise AssertionError(
+                f"Expected {count} email(s) matching {filters or 'any'}, got {len(matching)} after {timeout:g}s"
+            )
+        return matching
+
+    def assert_sent(self, to=None, subject_contains=None, count=1):
+        """Assert exactly ``count`` matching messages were delivered; return them."""
+        matching = self.sent(to=to, subject_contains=subject_contains)
+        if len(matching) != count:
+            raise AssertionError(
+                f"Expected {count} email(s) to={to!r} subject~{subject_contains!r}, got {len(matching)}"
+            )
+        return matching
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to hold each message (default: 0)")
+    parser.add_argument("--fail-every", type=int, default=0, help="answer 502 to every n-th message")
+    args = parser.parse_args(argv)
+
+    stub = EmailStub(args.host, args.port, latency=args.latency, fail_every=args.fail_every).start()
+    print(f"Email stub listening on {stub.url} (Ctrl+C to stop)", flush=True)
+    try:
+        seen = 0
+        while True:
+            time.sleep(0.5)
+            for message in stub.messages[seen:]:
+                status = "FAILED" if message["failed"] else "sent"
+                print(f"{status:<6} {message['to']}: {message['subject']} ({message['latency_s']:.3f}s)", flush=True)
+            seen = len(stub.messages)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
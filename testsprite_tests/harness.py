@@ -0,0 +1,192 @@
+"""Shared browser plumbing for the test plan's cases.
+
+Every generated TC script used to start Playwright, launch a private Chromium
+and load the home page before its first step. That setup now lives here so a
+case can either open its own browser (``plan.run_case(case)``) or be handed a
+running browser, or a WarmSession of preloaded pages, by ``runner.py``.
+"""
+
+import asyncio
+import contextvars
+import time
+from contextlib import asynccontextmanager
+
+from playwright import async_api
+
+import selector_map
+from config import BASE_URL
+
+# --single-process is deliberately absent: it forces every context's renderer
+# into one process, which serialises the contexts the runner opens in parallel.
+LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+DEFAULT_TIMEOUT_MS = 5000
+
+# Routes fetched once per run so Next.js dev mode compiles them before any test.
+WARM_ROUTES = ("/", "/robots.txt", "/sitemap.xml")
+
+# Set to a dict by the runner for each test; open_page() records setup timings in it.
+setup_timing = contextvars.ContextVar("setup_timing", default=None)
+
+
+async def launch_browser(pw, headless=True):
+    """Launch the Chromium instance the suite runs against."""
+    return await pw.chromium.launch(headless=headless, args=LAUNCH_ARGS)
+
+
+async def load_home(page, url=BASE_URL):
+    """Navigate to ``url`` and wait for the page and its frames to be parsed."""
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(url, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
+        try:
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
+        except async_api.Error:
+            pass
+
+    # Wait for the server-rendered tree so selector_map.require() can fail
+    # fast on anything that is missing (lazy islands get longer; see there).
+    try:
+        await page.locator(selector_map.css("page")).wait_for(state="attached", timeout=10000)
+    except async_api.Error:
+        pass
+
+
+async def new_loaded_page(browser, storage_state=None):
+    """Open a fresh context on ``browser`` and load the home page in it.
+
+    Returns ``(context, page, seconds)`` where seconds is the time the load took.
+    """
+    started = time.perf_counter()
+    # Create a new browser context (like an incognito window)
+    context = await browser.new_context(storage_state=storage_state)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    page = await context.new_page()
+    await load_home(page)
+    return context, page, time.perf_counter() - started
+
+
+class WarmSession:
+    """Pre-warmed server routes plus a queue of already-loaded pages.
+
+    ``start()`` requests each of WARM_ROUTES once so the dev server has compiled
+    them, loads the home page to capture a reusable ``storage_state``, then keeps
+    up to ``prefetch`` pages loading in the background. A test handed the
+    session gets a page whose load has already happened.
+    """
+
+    def __init__(self, browser, total, prefetch=2):
+        self.browser = browser
+        self.storage_state = None
+        self.warmup_s = None
+        self._remaining = total
+        self._prefetch = prefetch
+        self._ready = asyncio.Queue()
+        self._loading = set()
+
+    async def start(self):
+        started = time.perf_counter()
+        context = await self.browser.new_context()
+        try:
+            await asyncio.gather(*(context.request.get(BASE_URL + route) for route in WARM_ROUTES))
+            page = await context.new_page()
+            await load_home(page)
+            self.storage_state = await context.storage_state()
+        finally:
+            await context.close()
+        self.warmup_s = time.perf_counter() - started
+
+        for _ in range(self._prefetch):
+            self._schedule_load()
+        return self
+
+    def _schedule_load(self):
+        if self._remaining <= 0:
+            return
+        self._remaining -= 1
+        task = asyncio.create_task(self._load())
+        self._loading.add(task)
+        task.add_done_callback(self._loading.discard)
+
+    async def _load(self):
+        try:
+            item = await new_loaded_page(self.browser, self.storage_state)
+        except Exception as exc:
+            item = exc
+        await self._ready.put(item)
+
+    async def acquire(self):
+        """Return ``(context, page, load_seconds)`` for the next preloaded page."""
+        if self._ready.empty() and not self._loading:
+            return await new_loaded_page(self.browser, self.storage_state)
+        item = await self._ready.get()
+        self._schedule_load()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def close(self):
+        for task in list(self._loading):
+            task.cancel()
+        await asyncio.gather(*self._loading, return_exceptions=True)
+        while not self._ready.empty():
+            item = self._ready.get_nowait()
+            if not isinstance(item, Exception):
+                await item[0].close()
+
+
+@asynccontextmanager
+async def open_page(browser=None):
+    """Yield ``(context, page)`` with the home page loaded in a fresh context.
+
+    ``browser`` may be None, in which case a private Playwright session and
+    browser are started and torn down with the context; a running Browser,
+    which is left alive for the caller; or a WarmSession, which hands over a
+    page that was loaded ahead of time.
+
+    If the caller has set ``setup_timing`` to a dict, the time spent here
+    before the test could start and the time the page load itself took are
+    recorded in it.
+    """
+    pw = None
+    context = None
+    owns_browser = browser is None
+    started = time.perf_counter()
+
+    try:
+        if owns_browser:
+            pw = await async_api.async_playwright().start()
+            browser = await launch_browser(pw)
+
+        if isinstance(browser, WarmSession):
+            mode = "warm"
+            context, page, load_s = await browser.acquire()
+        else:
+            mode = "cold"
+            context, page, load_s = await new_loaded_page(browser)
+
+        timing = setup_timing.get()
+        if timing is not None:
+            timing.update(mode=mode, setup_s=round(time.perf_counter() - started, 3), page_load_s=round(load_s, 3))
+
+        yield context, page
+
+    finally:
+        if context:
+            await context.close()
+        if owns_browser and browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
@@ -0,0 +1,222 @@
+"""Concurrent load generator for the API routes.
+
+Drives ``/api/contact`` or ``/api/test-email`` at a fixed concurrency and
+reports throughput, a latency histogram and the share of 429 (rate limited)
+and 503 (no email transport) answers as JSON:
+
+    python testsprite_tests/load_harness.py --route contact -n 500 -c 25
+    python testsprite_tests/load_harness.py --route contact --same-ip -n 200
+    python testsprite_tests/load_harness.py --route test-email -n 100 -c 5
+
+Contact messages cycle through ``--sizes`` characters, up to the 5000
+character limit the route enforces. Latency is also broken down by status and
+by message size: a flat 429 latency well below the 200 latency means the rate
+limiter is cheap, and latency that climbs with message size points at email
+rendering. By default every request comes from its own ``X-Forwarded-For``
+address so the rate limiter stays out of the way; ``--same-ip`` sends them all
+from one client to exercise it instead.
+
+Every accepted request sends email. Before any load, ``GET /api/contact``
+must report the memory or http (stand-in) transport, or none at all; a
+server that would deliver through Resend is refused unless
+``--allow-real-email`` is given.
+
+``contact_bench.py`` and ``rate_limit_stress.py`` are built on this module.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from collections import Counter, namedtuple
+from pathlib import Path
+
+import httpx
+
+from config import BASE_URL
+from stats import percentile
+
+RESULTS_DIR = Path(__file__).resolve().parent / "tmp"
+
+ROUTES = {"contact": "/api/contact", "test-email": "/api/test-email"}
+
+# Message lengths cycled through for contact submissions; 5000 is the route's limit
+PAYLOAD_SIZES = (50, 500, 2000, 5000)
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+Sample = namedtuple("Sample", "status latency_s payload_chars tag")
+
+# Transports that never deliver real email; None means no transport (503s)
+SAFE_TRANSPORTS = (None, "memory", "http")
+
+_FILLER = "Load test message for the contact route. "
+
+
+def synthetic_ip(n):
+    """A distinct private IPv4 address for request ``n``."""
+    return f"10.{n // 65536 % 256}.{n // 256 % 256}.{n % 256}"
+
+
+def contact_payload(n, message_chars=PAYLOAD_SIZES[0]):
+    message = (_FILLER * (message_chars // len(_FILLER) + 1))[:message_chars]
+    return {
+        "name": "Load Test User",
+        "email": f"load.{n}@example.com",
+        "subject": f"Load test message {n}",
+        "message": message,
+    }
+
+
+async def check_email_transport(client, allow_real_email=False):
+    """Stop unless the server's email transport is safe to load; returns its name.
+
+    Anything unrecognised, including a server that does not answer
+    ``GET /api/contact``, counts as real email.
+    """
+    try:
+        response = await client.get(ROUTES["contact"])
+        response.raise_for_status()
+        transport = response.json().get("transport")
+    except (httpx.HTTPError, ValueError, AttributeError):
+        transport = "unknown"
+    if transport not in SAFE_TRANSPORTS and not allow_real_email:
+        raise SystemExit(
+            f"The server's email transport is {transport!r}, so this load would send real email. "
+            "Start it with EMAIL_TRANSPORT=memory or EMAIL_TRANSPORT=http, or pass --allow-real-email."
+        )
+    return transport
+
+
+def add_email_arguments(parser):
+    parser.add_argument("--allow-real-email", action="store_true",
+                        help="run even when the server delivers real email (uses the Resend quota)")
+
+
+async def run_load(client, route="contact", requests=100, concurrency=10, sizes=PAYLOAD_SIZES,
+                   same_ip=False, inspect=None, first=0):
+    """Send ``requests`` POSTs to ``route`` with ``concurrency`` in flight.
+
+    ``inspect(response)`` may return a string that is kept as the sample's
+    tag. ``first`` offsets request numbers (and so client addresses) when
+    several loads share a server. Returns ``(samples, elapsed_seconds)``.
+    """
+    path = ROUTES[route]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(n):
+        chars = sizes[n % len(sizes)] if route == "contact" else 0
+        body = contact_payload(n, chars) if route == "contact" else {}
+        headers = {"X-Forwarded-For": synthetic_ip(first if same_ip else n)}
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await client.post(path, json=body, headers=headers)
+            except httpx.HTTPError:
+                return Sample(0, time.perf_counter() - started, chars, None)
+            latency = time.perf_counter() - started
+        return Sample(response.status_code, latency, chars, inspect(response) if inspect else None)
+
+    started = time.perf_counter()
+    samples = await asyncio.gather(*(one(n) for n in range(first, first + requests)))
+    return samples, time.perf_counter() - started
+
+
+def _latency_stats(latencies):
+    ms = [latency * 1000 for latency in latencies]
+    if not ms:
+        return None
+    return {
+        "p50": round(percentile(ms, 50), 1),
+        "p95": round(percentile(ms, 95), 1),
+        "p99": round(percentile(ms, 99), 1),
+        "mean": round(statistics.fmean(ms), 1),
+        "max": round(max(ms), 1),
+    }
+
+
+def summarize(samples, elapsed):
+    """Reduce samples to the JSON report: RPS, histogram, status rates, breakdowns."""
+    total = len(samples)
+    statuses = Counter(sample.status for sample in samples)
+
+    histogram = Counter()
+    for sample in samples:
+        ms = sample.latency_s * 1000
+        bucket = next((f"<={edge}" for edge in HISTOGRAM_MS if ms <= edge), f">{HISTOGRAM_MS[-1]}")
+        histogram[bucket] += 1
+
+    by_status = {}
+    for status in sorted(statuses):
+        by_status[str(status)] = _latency_stats([s.latency_s for s in samples if s.status == status])
+
+    by_size = {}
+    for chars in sorted({sample.payload_chars for sample in samples}):
+        ok = [s.latency_s for s in samples if s.payload_chars == chars and s.status == 200]
+        by_size[str(chars)] = _latency_stats(ok)
+
+    return {
+        "requests": total,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(total / elapsed, 1) if elapsed else None,
+        "status_counts": {str(status): count for status, count in sorted(statuses.items())},
+        "rate_429": round(statuses[429] / total, 4) if total else 0,
+        "rate_503": round(statuses[503] / total, 4) if total else 0,
+        "errors": statuses[0],
+        "latency_ms": _latency_stats([sample.latency_s for sample in samples]),
+        "histogram_ms": {bucket: histogram[bucket] for bucket in
+                         [f"<={edge}" for edge in HISTOGRAM_MS] + [f">{HISTOGRAM_MS[-1]}"] if histogram[bucket]},
+        "latency_by_status_ms": by_status,
+        "latency_by_message_chars_ms": by_size,
+    }
+
+
+async def main_async(args):
+    sizes = tuple(int(size) for size in args.sizes.split(","))
+    # Start at a random address so back-to-back runs don't hit each other's limits
+    first = random.randrange(1, 2 ** 24 - args.requests)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        transport = await check_email_transport(client, args.allow_real_email)
+        # One request up front so dev-mode compilation is not measured
+        await client.post(ROUTES[args.route], json={}, headers={"X-Forwarded-For": "10.255.255.255"})
+        samples, elapsed = await run_load(client, args.route, args.requests, args.concurrency, sizes,
+                                          same_ip=args.same_ip, first=first)
+    report = summarize(samples, elapsed)
+    report.update(route=ROUTES[args.route], concurrency=args.concurrency, same_ip=args.same_ip,
+                  email_transport=transport)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--route", choices=sorted(ROUTES), default="contact")
+    parser.add_argument("-n", "--requests", type=int, default=200, help="requests to send (default: 200)")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="requests in flight (default: 10)")
+    parser.add_argument("--sizes", default=",".join(map(str, PAYLOAD_SIZES)),
+                        help="comma-separated message lengths to cycle through (default: %(default)s)")
+    parser.add_argument("--same-ip", action="store_true", help="send every request from one client address")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=float, default=15, help="per-request timeout in seconds (default: 15)")
+    add_email_arguments(parser)
+    parser.add_argument("--out", type=Path, help="report path (default: tmp/load_<route>.json)")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+    out = args.out or RESULTS_DIR / f"load_{args.route}.json"
+    out.parent.mkdir(exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    latency = report["latency_ms"] or {}
+    print(f"{report['requests']} requests in {report['elapsed_s']:.1f}s ({report['rps']} req/s), "
+          f"p50 {latency.get('p50')}ms p95 {latency.get('p95')}ms, "
+          f"429 {report['rate_429']:.1%}, 503 {report['rate_503']:.1%}")
+    print(f"Report written to {out}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Frame-rate and long-task budgets for the animation tests.
+
+The site records frame durations, long tasks and GSAP tween counts when it is
+opened with ``?perf=1`` (``lib/perf-monitor.ts``) and exposes them as
+``window.__PERF__``. ``measure()`` resets those counters, lets the test run
+an interaction, then pulls a snapshot and fails the step if it is over
+budget:
+
+    await perf_collector.enable(page)
+    async with perf_collector.measure(page, "scroll through sections"):
+        await page.mouse.wheel(0, 600)
+
+Budgets default to 30 FPS, 5 long tasks and a 250ms longest task, and can be
+loosened for slow machines with ``TESTSPRITE_MIN_FPS``,
+``TESTSPRITE_MAX_LONG_TASKS`` and ``TESTSPRITE_MAX_LONG_TASK_MS``.
+
+``check_frame_time()`` adds a p95 frame-time budget and, for one component's
+work label, a per-frame work budget (``TESTSPRITE_MAX_FRAME_MS``, default
+50ms, and ``TESTSPRITE_MAX_WORK_MS``, default 8ms).
+"""
+
+import contextvars
+import os
+from contextlib import asynccontextmanager
+
+import harness
+import selector_map
+
+MIN_FPS = float(os.environ.get("TESTSPRITE_MIN_FPS", "30"))
+MAX_LONG_TASKS = int(os.environ.get("TESTSPRITE_MAX_LONG_TASKS", "5"))
+MAX_LONG_TASK_MS = float(os.environ.get("TESTSPRITE_MAX_LONG_TASK_MS", "250"))
+MAX_FRAME_MS = float(os.environ.get("TESTSPRITE_MAX_FRAME_MS", "50"))
+MAX_WORK_MS = float(os.environ.get("TESTSPRITE_MAX_WORK_MS", "8"))
+
+# FPS over a shorter window than this says more about timer jitter than the page
+MIN_SAMPLE_MS = 500
+
+PERF_QUERY = "?perf=1"
+
+# Set to a list by the runner for each test; measure() appends one entry per block.
+collected = contextvars.ContextVar("perf_collected", default=None)
+
+
+async def enable(page):
+    """Make sure the monitor is running, reloading with ``?perf=1`` if needed."""
+    if "perf=1" in page.url:
+        await page.wait_for_function("() => !!window.__PERF__", timeout=10000)
+        return
+    if await page.evaluate("() => !!window.__PERF__"):
+        return
+    await page.goto(harness.BASE_URL + "/" + PERF_QUERY, wait_until="domcontentloaded", timeout=10000)
+    await page.locator(selector_map.css("page")).wait_for(state="attached", timeout=10000)
+    await page.wait_for_function("() => !!window.__PERF__", timeout=5000)
+
+
+async def reset(page):
+    await page.evaluate("() => window.__PERF__.reset()")
+
+
+async def collect(page):
+    """Return the current snapshot: fps, frameMs, slowFrames, longTasks, tweens, workMs, domNodes."""
+    return await page.evaluate("() => window.__PERF__.snapshot()")
+
+
+def check(snapshot, label, min_fps=None, max_long_tasks=None, max_long_task_ms=None):
+    """Raise AssertionError listing every budget ``snapshot`` is over."""
+    min_fps = MIN_FPS if min_fps is None else min_fps
+    max_long_tasks = MAX_LONG_TASKS if max_long_tasks is None else max_long_tasks
+    max_long_task_ms = MAX_LONG_TASK_MS if max_long_task_ms is None else max_long_task_ms
+
+    problems = []
+    if snapshot["elapsedMs"] >= MIN_SAMPLE_MS and snapshot["fps"] < min_fps:
+        problems.append(f"{snapshot['fps']} FPS < {min_fps:g} (p95 frame {snapshot['frameMs']['p95']}ms)")
+    long_tasks = snapshot["longTasks"]
+    if long_tasks["count"] > max_long_tasks:
+        problems.append(f"{long_tasks['count']} long tasks > {max_long_tasks}")
+    if long_tasks["maxMs"] > max_long_task_ms:
+        problems.append(f"longest task {long_tasks['maxMs']:.0f}ms > {max_long_task_ms:g}ms")
+    if problems:
+        raise AssertionError(f"Performance budget exceeded during {label!r}: " + "; ".join(problems))
+
+
+def check_frame_time(snapshot, label, work_label=None, max_frame_ms=None, max_work_ms=None):
+    """Raise AssertionError if p95 frame time, or the slowest ``work_label`` frame, is over budget."""
+    max_frame_ms = MAX_FRAME_MS if max_frame_ms is None else max_frame_ms
+    max_work_ms = MAX_WORK_MS if max_work_ms is None else max_work_ms
+
+    problems = []
+    if snapshot["elapsedMs"] >= MIN_SAMPLE_MS and snapshot["frameMs"]["p95"] > max_frame_ms:
+        problems.append(f"p95 frame {snapshot['frameMs']['p95']}ms > {max_frame_ms:g}ms")
+    if work_label:
+        work = snapshot["workMs"].get(work_label)
+        if not work or not work["calls"]:
+            problems.append(f"no {work_label} work was recorded")
+        elif work["max"] > max_work_ms:
+            problems.append(f"slowest {work_label} frame {work['max']:.1f}ms > {max_work_ms:g}ms")
+    if problems:
+        raise AssertionError(f"Frame-time budget exceeded during {label!r}: " + "; ".join(problems))
+
+
+@asynccontextmanager
+async def measure(page, label, **budget):
+    """Reset counters, run the block, then check the snapshot against the budgets.
+
+    Yields a dict that holds the snapshot once the block has finished.
+    """
+    result = {}
+    await reset(page)
+    yield result
+    result.update(await collect(page))
+
+    history = collected.get()
+    if history is not None:
+        history.append({
+            "label": label,
+            "fps": result["fps"],
+            "frame_ms": result["frameMs"],
+            "long_tasks": result["longTasks"],
+            "tweens": result["tweens"],
+            "work_ms": result["workMs"],
+            "dom_nodes": result["domNodes"],
+        })
+    check(result, label, **budget)
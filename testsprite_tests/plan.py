@@ -0,0 +1,138 @@
+"""Load ``testsprite_frontend_test_plan.json`` and run its test cases.
+
+The plan lists each case's steps in prose. A step may also carry a ``run``
+list naming the step implementations in ``steps.py`` that carry it out, so a
+case is plain data executed inside one shared interpreter:
+
+    {"type": "action", "description": "Submit the form.",
+     "run": [{"click": "contact.submit", "wait_for": "/api/contact"}]}
+
+Steps without ``run`` are descriptive only and are counted as such in the
+results. A case may also set ``"perf": true`` to run with the performance
+monitor, and ``"resources"``: cases naming the same resource (the contact
+form's rate limit, say) never run at the same time.
+
+The parsed plan is validated and cached per file modification time, so an
+unknown step name fails before any browser starts and repeated loads cost
+nothing.
+
+If the caller sets ``step_timing`` to a dict, ``run_case`` records each
+executed step's wall time and outcome in it, plus the time spent navigating
+and asserting; a step cut short by the runner's timeout is "interrupted".
+"""
+
+import contextvars
+import json
+import time
+from collections import namedtuple
+from pathlib import Path
+
+import harness
+import perf_collector
+import readiness
+import steps
+
+PLAN_PATH = Path(__file__).resolve().parent / "testsprite_frontend_test_plan.json"
+
+# How long a case's page stays open at the end when fixed sleeps are on
+FINAL_PAUSE_MS = 5000
+
+Case = namedtuple("Case", "id title priority perf resources steps")
+Step = namedtuple("Step", "type description ops")
+
+# Set to a dict by the runner for each case; run_case() fills in step timings.
+step_timing = contextvars.ContextVar("step_timing", default=None)
+
+_cache = {}
+
+
+def _compile_case(raw):
+    problems = []
+    compiled = []
+    for number, raw_step in enumerate(raw.get("steps", []), 1):
+        if raw_step.get("type") not in ("action", "assertion"):
+            problems.append(f"step {number}: unknown type {raw_step.get('type')!r}")
+        ops = None
+        if "run" in raw_step:
+            try:
+                ops = steps.compile_ops(raw_step["run"])
+            except ValueError as exc:
+                problems.append(f"step {number}: {exc}")
+        compiled.append(Step(raw_step.get("type"), raw_step.get("description", ""), ops))
+    case = Case(raw.get("id"), raw.get("title", ""), raw.get("priority"), bool(raw.get("perf")),
+                tuple(raw.get("resources", ())), tuple(compiled))
+    return case, [f"{case.id}: {problem}" for problem in problems]
+
+
+def load_plan(path=PLAN_PATH):
+    """Return the plan's cases in file order, parsing the file only when it changed."""
+    path = Path(path).resolve()
+    mtime = path.stat().st_mtime_ns
+    cached = _cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    cases, problems = [], []
+    for raw in json.loads(path.read_text(encoding="utf-8")):
+        case, case_problems = _compile_case(raw)
+        cases.append(case)
+        problems.extend(case_problems)
+    ids = [case.id for case in cases]
+    problems.extend(f"{case_id}: duplicate id" for case_id in sorted({i for i in ids if ids.count(i) > 1}))
+    if problems:
+        raise ValueError(f"Invalid test plan {path.name}:\n  " + "\n  ".join(problems))
+
+    cases = tuple(cases)
+    _cache[path] = (mtime, cases)
+    return cases
+
+
+def select(cases, patterns=None):
+    """Cases whose id or title contains any of ``patterns`` (all when None)."""
+    if not patterns:
+        return list(cases)
+    return [case for case in cases if any(p in case.id or p in case.title for p in patterns)]
+
+
+def step_counts(case):
+    return {"executable": sum(1 for s in case.steps if s.ops is not None), "total": len(case.steps)}
+
+
+async def run_case(case, browser=None):
+    """Open the home page and run every executable step of ``case`` in order.
+
+    ``browser`` is handed to ``harness.open_page``: None for a private
+    browser, a running Browser, or a WarmSession.
+    """
+    timing = step_timing.get()
+    async with harness.open_page(browser) as (context, page):
+        if case.perf:
+            await perf_collector.enable(page)
+        ctx = steps.StepContext(context, page, perf=case.perf)
+        try:
+            for number, plan_step in enumerate(case.steps, 1):
+                if plan_step.ops is None:
+                    continue
+                started = time.perf_counter()
+                status = "interrupted"
+                try:
+                    await steps.run_ops(ctx, plan_step.ops)
+                    status = "passed"
+                except Exception as exc:
+                    status = "failed"
+                    exc.add_note(f"{case.id} step {number} ({plan_step.type}): {plan_step.description}")
+                    raise
+                finally:
+                    if timing is not None:
+                        timing.setdefault("steps", []).append({
+                            "step": number,
+                            "type": plan_step.type,
+                            "description": plan_step.description,
+                            "duration_s": round(time.perf_counter() - started, 3),
+                            "status": status,
+                        })
+        finally:
+            if timing is not None:
+                timing["navigation_s"] = round(ctx.time_by_kind["navigation"], 3)
+                timing["assertion_s"] = round(ctx.time_by_kind["assertion"], 3)
+        await readiness.pause(page, FINAL_PAUSE_MS)
@@ -0,0 +1,56 @@
+"""The project catalog the Projects section renders, for assertions.
+
+``data/projects.json`` is what ``lib/projects.ts`` validates and renders at
+build time, so tests that check project cards read it here instead of
+repeating titles and descriptions:
+
+    for project in project_catalog.view("All"):
+        ...
+
+``view()`` follows the same rules as ``PROJECT_VIEWS`` in ``lib/projects.ts``:
+``"All"`` is the first ``featuredLimit`` featured projects, and a category is
+every project in it, in catalog order.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+CATALOG = Path(__file__).resolve().parent.parent / "data" / "projects.json"
+
+ALL = "All"
+
+
+@lru_cache(maxsize=1)
+def load():
+    return json.loads(CATALOG.read_text(encoding="utf-8"))
+
+
+def projects():
+    return load()["projects"]
+
+
+def categories():
+    """Filter button labels, in order, as ``project.filter[n]`` shows them."""
+    return [ALL] + load()["categories"]
+
+
+def featured():
+    return [project for project in projects() if project["featured"]][: load()["featuredLimit"]]
+
+
+def view(category):
+    """Projects shown when the ``category`` filter is selected."""
+    if category == ALL:
+        return featured()
+    return [project for project in projects() if project["category"] == category]
+
+
+def index(project):
+    """Catalog position of ``project``, the ``n`` in ``project.card[n]``."""
+    return next(i for i, entry in enumerate(projects()) if entry["id"] == project["id"])
+
+
+def card_texts(project):
+    """Strings every card shows for ``project``."""
+    return [project["title"], project["description"], project["category"]]
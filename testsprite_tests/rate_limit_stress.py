@@ -0,0 +1,99 @@
+"""Flood ``/api/contact`` from thousands of synthetic IPs and watch server memory.
+
+Each request carries a new first-hop ``X-Forwarded-For`` address and an empty
+body, so it is counted by the rate limiter and then rejected with 400 before
+any email is sent. Resident memory of the server process is sampled from
+``/proc/<pid>/status`` as the flood runs; once the limiter's key cap is
+reached it should stop growing.
+
+    python testsprite_tests/rate_limit_stress.py --pid $(pgrep -f "next-server" | head -1) --ips 50000
+
+The script also checks the limiter itself: a fourth request from one client
+within the window is refused with 429 and a Retry-After header, and proxies
+appended to X-Forwarded-For do not give a client a fresh allowance.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+import load_harness
+from config import BASE_URL
+
+
+def rss_mb(pid):
+    """Resident set size of ``pid`` in MiB, read from /proc."""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    raise RuntimeError(f"No VmRSS for pid {pid}")
+
+
+async def check_limit(client):
+    """Four requests from one client (via different proxies); the fourth must be refused."""
+    # A fresh documentation-range address per run, so reruns inside the window start clean
+    client_ip = f"2001:db8::{random.getrandbits(32):x}"
+    statuses = []
+    for proxy in ("", ", 172.16.0.1", ", 172.16.0.2", ", 172.16.0.3"):
+        response = await client.post("/api/contact", json={}, headers={"X-Forwarded-For": f"{client_ip}{proxy}"})
+        statuses.append(response.status_code)
+    assert statuses[:3] == [400, 400, 400], f"Expected three 400s before the limit, got {statuses}"
+    assert statuses[3] == 429, f"Expected 429 on the fourth request, got {statuses[3]}"
+    assert response.headers.get("retry-after"), "429 response is missing Retry-After"
+
+
+async def flood(client, ips, concurrency, pid, samples):
+    statuses = Counter()
+    rss = []
+    step = max(1, ips // samples)
+    for start in range(0, ips, step):
+        batch, _ = await load_harness.run_load(client, "contact", min(step, ips - start), concurrency,
+                                               sizes=(0,), first=start)
+        statuses.update(sample.status for sample in batch)
+        if pid:
+            rss.append(round(rss_mb(pid), 1))
+    return statuses, rss
+
+
+async def run(args):
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+        await check_limit(client)
+        print("Limiter: fourth request from one client refused with 429")
+        return await flood(client, args.ips, max(1, args.concurrency), args.pid, args.samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ips", type=int, default=20000, help="distinct client addresses to send (default: 20000)")
+    parser.add_argument("-c", "--concurrency", type=int, default=50, help="requests in flight (default: 50)")
+    parser.add_argument("--pid", type=int, help="server process to sample memory from")
+    parser.add_argument("--samples", type=int, default=20, help="memory samples over the run (default: 20)")
+    parser.add_argument("--max-growth-mb", type=float, default=25,
+                        help="allowed RSS growth over the second half of the flood (default: 25)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--timeout", type=float, default=15)
+    args = parser.parse_args(argv)
+
+    statuses, rss = asyncio.run(run(args))
+    print("Responses: " + ", ".join(f"{code}={count}" for code, count in sorted(statuses.items())))
+    if not rss:
+        print("No --pid given; memory not checked")
+        return 0
+
+    print("RSS MiB: " + " ".join(str(value) for value in rss))
+    half = rss[len(rss) // 2:]
+    growth = max(half) - half[0]
+    print(f"Growth over second half: {growth:.1f} MiB (limit {args.max_growth_mb:g})")
+    if growth > args.max_growth_mb:
+        print("FAILED: server memory keeps growing with new client addresses", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Event-driven waits used in place of fixed sleeps.
+
+The generated scripts paused ``wait_for_timeout(3000)`` before every action
+and ``asyncio.sleep(5)`` at the end. These helpers wait for the condition the
+sleep was standing in for instead:
+
+* ``ready(locator)`` - the element is visible and the page's GSAP, ScrollReveal
+  and CSS animations have stopped moving things around.
+* ``settle(page)`` - just the animation part, e.g. after a scroll or reload.
+* ``network_idle(page, "/api/contact")`` - every matching request started in
+  the block has been answered.
+
+Fixed sleeps are opt-in: ``pause()`` only sleeps when
+``TESTSPRITE_FIXED_SLEEPS=1`` is set, which is handy when recording videos.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+FIXED_SLEEPS = os.environ.get("TESTSPRITE_FIXED_SLEEPS") == "1"
+
+# Elements that animate forever (the spinning cursor, hover particles, the
+# bento spotlight) and would otherwise keep the page from ever settling.
+SETTLE_IGNORE = ".target-cursor-wrapper, .particle, .global-spotlight"
+
+# Resolves once no inline style/class mutation and no finite CSS/WAAPI
+# animation has been seen for `quietMs`, or after `maxMs` regardless.
+_SETTLE_JS = """
+([quietMs, maxMs, ignore]) => new Promise((resolve) => {
+  let quietTimer = null
+  let observer = null
+  let done = false
+  const finish = (settled) => {
+    if (done) return
+    done = true
+    clearTimeout(quietTimer)
+    clearTimeout(maxTimer)
+    if (observer) observer.disconnect()
+    resolve(settled)
+  }
+  const maxTimer = setTimeout(() => finish(false), maxMs)
+  const restartQuiet = () => {
+    if (done) return
+    clearTimeout(quietTimer)
+    quietTimer = setTimeout(waitForAnimations, quietMs)
+  }
+  const waitForAnimations = () => {
+    const running = document.getAnimations().filter((animation) => {
+      const timing = animation.effect && animation.effect.getComputedTiming()
+      return animation.playState === "running" && timing && timing.iterations !== Infinity
+    })
+    if (running.length === 0) return finish(true)
+    Promise.all(running.map((animation) => animation.finished.catch(() => null))).then(restartQuiet)
+  }
+  observer = new MutationObserver((records) => {
+    const relevant = records.some((record) => {
+      const target = record.target
+      return !(target instanceof Element && target.closest(ignore))
+    })
+    if (relevant) restartQuiet()
+  })
+  observer.observe(document.documentElement, {
+    attributes: true,
+    attributeFilter: ["style", "class"],
+    subtree: true,
+  })
+  restartQuiet()
+})
+"""
+
+
+async def pause(page, ms):
+    """Sleep for ``ms`` only when fixed sleeps were explicitly requested."""
+    if FIXED_SLEEPS:
+        await page.wait_for_timeout(ms)
+
+
+async def settle(page, quiet_ms=100, timeout=5000):
+    """Wait until animations on the page have stopped; returns False on timeout."""
+    return await page.evaluate(_SETTLE_JS, [quiet_ms, timeout, SETTLE_IGNORE])
+
+
+async def ready(locator, timeout=5000):
+    """Wait until ``locator`` is visible and the page has settled around it."""
+    await pause(locator.page, 3000)
+    await locator.wait_for(state="visible", timeout=timeout)
+    await settle(locator.page, timeout=timeout)
+
+
+@asynccontextmanager
+async def network_idle(page, url_part, timeout=10000, grace_ms=250):
+    """Wait on exit until requests to ``url_part`` issued inside the block finish.
+
+    Submits that fail client-side validation never reach the network, so when
+    nothing has been seen yet the block waits at most ``grace_ms`` for a
+    request to show up before returning.
+    """
+    pending = []
+
+    def on_request(request):
+        if url_part in request.url:
+            pending.append(request)
+
+    page.on("request", on_request)
+    try:
+        yield pending
+        if not pending:
+            try:
+                await page.wait_for_event("request", lambda r: url_part in r.url, timeout=grace_ms)
+            except PlaywrightTimeoutError:
+                pass
+        for request in list(pending):
+            await asyncio.wait_for(request.response(), timeout=timeout / 1000)
+    finally:
+        page.remove_listener("request", on_request)
@@ -0,0 +1,173 @@
+"""Run the test plan's cases concurrently against one shared browser.
+
+Cases come from ``testsprite_frontend_test_plan.json`` and are executed by
+``plan.run_case``. The runner launches a single Chromium, then runs up to
+``--workers`` cases at once, each in its own BrowserContext, so the suite
+takes roughly as long as its slowest case instead of the sum of all of them.
+Cases that name the same resource in the plan wait for each other.
+
+By default the runner also warms up first (see ``harness.WarmSession``): the
+server routes are fetched once and the next tests' pages are loaded in the
+background, so a test starts on a page that is already there. ``--cold``
+turns that off. Either way each result records the setup time the test
+waited and the page load time behind it, and the wall time of every plan step.
+Each run is also appended to ``tmp/timing_history.jsonl``; see
+``timing_history.py`` for the regression report.
+
+``--email-stub PORT`` starts ``email_stub.EmailStub`` for the run; point the
+dev server at it with ``EMAIL_TRANSPORT=http`` so contact-form tests run
+without Resend.
+
+    python testsprite_tests/runner.py --workers 4
+    python testsprite_tests/runner.py -k TC007 -k TC008
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import traceback
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+from playwright import async_api
+
+import email_stub
+import harness
+import perf_collector
+import plan
+import timing_history
+
+SUITE_DIR = Path(__file__).resolve().parent
+RESULTS_PATH = SUITE_DIR / "tmp" / "local_results.json"
+
+
+async def run_one(case, browser, semaphore, locks, timeout):
+    async with AsyncExitStack() as stack:
+        # Resources first, in a fixed order, so waiting cases do not hold a worker
+        for name in sorted(case.resources):
+            await stack.enter_async_context(locks[name])
+        await stack.enter_async_context(semaphore)
+
+        started = time.perf_counter()
+        result = {"id": case.id, "title": case.title, "status": "PASSED", "error": None,
+                  "steps": plan.step_counts(case)}
+        timing = {}
+        harness.setup_timing.set(timing)
+        step_times = {}
+        plan.step_timing.set(step_times)
+        perf = []
+        perf_collector.collected.set(perf)
+        try:
+            await asyncio.wait_for(plan.run_case(case, browser), timeout=timeout)
+        except asyncio.TimeoutError:
+            result["status"] = "FAILED"
+            result["error"] = f"Test execution timed out after {timeout:g} seconds"
+        except Exception as exc:
+            result["status"] = "FAILED"
+            result["error"] = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+        result["duration_s"] = round(time.perf_counter() - started, 3)
+        result["setup"] = timing or None
+        result["timing"] = step_times or None
+        result["perf"] = perf or None
+        print(f"{result['status']:<6} {result['id']} ({result['duration_s']:.1f}s)", flush=True)
+        return result
+
+
+async def run_suite(cases, workers, timeout, headless=True, warm=True, suite_timing=None):
+    """Run ``cases``; browser launch and warm-up times go into ``suite_timing`` if given."""
+    suite_timing = {} if suite_timing is None else suite_timing
+    semaphore = asyncio.Semaphore(max(1, workers))
+    locks = {name: asyncio.Lock() for case in cases for name in case.resources}
+    async with async_api.async_playwright() as pw:
+        started = time.perf_counter()
+        browser = await harness.launch_browser(pw, headless=headless)
+        suite_timing["browser_launch_s"] = round(time.perf_counter() - started, 3)
+        session = None
+        try:
+            if warm:
+                session = harness.WarmSession(browser, total=len(cases), prefetch=max(1, workers))
+                await session.start()
+                suite_timing["warmup_s"] = round(session.warmup_s, 3)
+                print(f"Warm-up took {session.warmup_s:.1f}s", flush=True)
+            target = session or browser
+            return await asyncio.gather(*(run_one(case, target, semaphore, locks, timeout) for case in cases))
+        finally:
+            if session:
+                await session.close()
+            await browser.close()
+
+
+def setup_summary(results):
+    """Summarise how long tests waited for their page versus how long loads took."""
+    timings = [r["setup"] for r in results if r.get("setup")]
+    if not timings:
+        return "no setup timings recorded"
+    mode = "/".join(sorted({t["mode"] for t in timings}))
+    setup = sum(t["setup_s"] for t in timings) / len(timings)
+    load = sum(t["page_load_s"] for t in timings) / len(timings)
+    return f"{mode} setup: avg {setup:.2f}s waited per test, avg page load {load:.2f}s"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-w", "--workers", type=int, default=4, help="tests to run at once (default: 4)")
+    parser.add_argument("-k", dest="patterns", action="append", help="only run cases whose id or title contains this")
+    parser.add_argument("--timeout", type=float, default=300, help="per-test timeout in seconds (default: 300)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--email-stub", type=int, metavar="PORT",
+                        help="serve a local email stand-in on PORT for EMAIL_TRANSPORT=http")
+    parser.add_argument("--email-latency", type=float, default=0.0,
+                        help="seconds the email stand-in holds each message (default: 0)")
+    parser.add_argument("--cold", action="store_true", help="skip the warm-up and load each test's page on demand")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = plan.select(plan.load_plan(), args.patterns)
+    if not cases:
+        print("No test cases matched.", file=sys.stderr)
+        return 2
+
+    stub = None
+    if args.email_stub:
+        stub = email_stub.EmailStub(port=args.email_stub, latency=args.email_latency).start()
+        print(f"Email stub listening on {stub.url}", flush=True)
+
+    started = time.perf_counter()
+    suite_timing = {}
+    try:
+        results = asyncio.run(run_suite(
+            cases, args.workers, args.timeout, headless=not args.headed, warm=not args.cold,
+            suite_timing=suite_timing,
+        ))
+    finally:
+        if stub:
+            stub.stop()
+    elapsed = time.perf_counter() - started
+
+    failed = [r for r in results if r["status"] != "PASSED"]
+    for result in failed:
+        print(f"\n{result['id']}: {result['error']}")
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed in {elapsed:.1f}s "
+          f"(sum of test time {sum(r['duration_s'] for r in results):.1f}s, {args.workers} workers)")
+    print(setup_summary(results))
+    if stub:
+        print(f"{len(stub.sent())} email(s) delivered to the stub")
+
+    RESULTS_PATH.parent.mkdir(exist_ok=True)
+    RESULTS_PATH.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    timing_history.append_run(results, {
+        "workers": args.workers,
+        "mode": "cold" if args.cold else "warm",
+        "patterns": args.patterns,
+        "wall_s": round(elapsed, 3),
+        **suite_timing,
+    })
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Logical element names for the suite, mapped to ``data-testid`` attributes.
+
+Scripts ask for ``"contact.email"`` or ``"project.card[0].live_demo"`` instead
+of absolute XPath chains. Indexed names are normalised to a ``[n]`` template
+and looked up in a dict, so resolving a name costs one regex substitution and
+one hash lookup, and the resulting ``[data-testid=...]`` selector is a single
+attribute match in the browser.
+
+The attributes are emitted by ``app/page.tsx``, ``components/contact-form.tsx``,
+``components/dock.tsx``, ``components/magic-bento.tsx``,
+``components/project-card.tsx`` and ``components/project-filter.tsx``; keep
+the two sides in sync when renaming.
+
+Sections the page loads lazily (``components/islands.tsx``) are only a
+``[data-island=...]`` placeholder until they are scrolled near or the browser
+is idle; ``require()`` scrolls to a pending placeholder and gives the island
+time to load before giving up.
+"""
+
+import re
+
+TESTIDS = {
+    "page": "portfolio",
+    "hero.get_in_touch": "hero-get-in-touch",
+    "hero.download_resume": "hero-download-resume",
+    "contact.form": "contact-form",
+    "contact.name": "contact-name",
+    "contact.email": "contact-email",
+    "contact.subject": "contact-subject",
+    "contact.message": "contact-message",
+    "contact.submit": "contact-submit",
+    "contact.status": "contact-status",
+    "about.card[n]": "about-card-{0}",
+    "skills.card[n]": "skills-card-{0}",
+    "dock": "dock",
+    "dock.item[n]": "dock-item-{0}",
+    "project.filter[n]": "project-filter-{0}",
+    "project.card[n]": "project-card-{0}",
+    "project.card[n].details": "project-card-{0}-details",
+    "project.card[n].live_demo": "project-card-{0}-live-demo",
+    "project.card[n].source": "project-card-{0}-source",
+    "project.modal": "project-modal",
+    "project.modal.close": "project-modal-close",
+}
+
+# How long require() gives an element to attach before failing. Kept short on
+# purpose: a renamed or removed element should fail the step straight away
+# rather than after a full action timeout.
+FAIL_FAST_MS = 500
+
+# Name prefix -> (data-island value, whether scrolling to it is what loads it)
+ISLANDS = {
+    "about.": ("magic-bento", True),
+    "skills.": ("magic-bento", True),
+    "contact.": ("contact-form", True),
+    "dock": ("dock", False),
+}
+
+# How long a triggered island gets to fetch its code and render
+ISLAND_LOAD_MS = 10000
+
+_INDEX = re.compile(r"\[(\d+)\]")
+
+
+def testid(name):
+    """Return the ``data-testid`` value for a logical name like ``dock.item[2]``."""
+    indices = _INDEX.findall(name)
+    template = _INDEX.sub("[n]", name)
+    try:
+        return TESTIDS[template].format(*indices)
+    except KeyError:
+        raise KeyError(f"Unknown selector name {name!r}") from None
+
+
+def css(name):
+    """Return a CSS attribute selector for a logical name."""
+    return f'[data-testid="{testid(name)}"]'
+
+
+def locate(scope, name):
+    """Return a locator for ``name`` within a page, frame or locator."""
+    return scope.locator(css(name)).first
+
+
+def island(name):
+    """Return ``(island, load_on_scroll)`` for a name inside a lazy island, else None."""
+    return next((value for prefix, value in ISLANDS.items() if name.startswith(prefix)), None)
+
+
+async def require(scope, name, timeout=FAIL_FAST_MS):
+    """Like ``locate()``, but raise immediately if the element is not in the DOM.
+
+    Names inside a lazy island that has not loaded yet get ``ISLAND_LOAD_MS``.
+    """
+    locator = locate(scope, name)
+    if await locator.count() == 0:
+        lazy = island(name)
+        if lazy:
+            placeholder = scope.locator(f'[data-island="{lazy[0]}"]').first
+            if await placeholder.count():
+                if lazy[1]:
+                    # Scrolling there is what a visitor would do, and what loads it
+                    await placeholder.evaluate("el => el.scrollIntoView({block: 'center'})")
+                timeout = max(timeout, ISLAND_LOAD_MS)
+        try:
+            await locator.wait_for(state="attached", timeout=timeout)
+        except Exception:
+            raise AssertionError(f"Element {name!r} ({css(name)}) is not on the page") from None
+    return locator
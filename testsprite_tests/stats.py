@@ -0,0 +1,13 @@
+"""Summary statistics shared by the load tools and the timing report.
+
+No third-party imports, so any script can use it whatever is installed.
+"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (which need not be sorted); None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
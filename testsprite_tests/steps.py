@@ -0,0 +1,270 @@
+"""Step implementations the test plan's ``run`` entries map to.
+
+Each entry in a plan step's ``run`` list is a JSON object with exactly one
+key naming a step registered here, whose value is the step's argument. Any
+other keys are passed as keyword options:
+
+    {"click": "contact.submit", "wait_for": "/api/contact"}
+    {"measure": "dock hover", "run": [{"wheel": 600}, {"settle": true}]}
+
+Targets are ``selector_map`` names; a string containing ``=`` (``text=...``,
+``xpath=...``) is used as a raw Playwright locator instead. Every step also
+accepts ``repeat``, the number of times to run it in a row.
+
+Steps registered with a ``kind`` ("navigation" or "assertion") add their
+time to ``StepContext.time_by_kind``, which the runner records per test.
+"""
+
+import asyncio
+import time
+from collections import Counter
+
+from playwright.async_api import expect
+
+import assertions
+import email_stub
+import harness
+import perf_collector
+import project_catalog
+import readiness
+import selector_map
+
+STEPS = {}
+KINDS = {}
+
+# The particle pool caps live particles at 48 page-wide, plus one ripple per card
+PARTICLE_POOL_SIZE = 48
+
+
+def step(name, kind=None):
+    """Register the decorated coroutine as the implementation of ``name``."""
+    def register(fn):
+        STEPS[name] = fn
+        if kind:
+            KINDS[name] = kind
+        return fn
+    return register
+
+
+class StepContext:
+    """The browser state a test case's steps run against."""
+
+    def __init__(self, context, page, perf=False):
+        self.context = context
+        self.page = page
+        self.perf = perf
+        self.time_by_kind = Counter()
+
+    @property
+    def frame(self):
+        # The newest page, in case a step opened a tab
+        return self.context.pages[-1]
+
+
+def compile_op(entry):
+    """Turn one ``run`` entry into ``(name, fn, arg, options)``; raise ValueError if malformed."""
+    if not isinstance(entry, dict):
+        raise ValueError(f"expected an object, got {entry!r}")
+    names = [key for key in entry if key in STEPS]
+    if len(names) != 1:
+        raise ValueError(f"expected exactly one of the known steps in {sorted(entry)}")
+    name = names[0]
+    options = {key: value for key, value in entry.items() if key != name}
+    if "run" in options:
+        options["run"] = compile_ops(options["run"])
+    return name, STEPS[name], entry[name], options
+
+
+def compile_ops(entries):
+    if not isinstance(entries, list):
+        raise ValueError(f"run must be a list, got {entries!r}")
+    return tuple(compile_op(entry) for entry in entries)
+
+
+async def run_ops(ctx, ops):
+    for name, fn, arg, options in ops:
+        options = dict(options)
+        kind = KINDS.get(name)
+        for _ in range(options.pop("repeat", 1)):
+            started = time.perf_counter()
+            try:
+                await fn(ctx, arg, **options)
+            finally:
+                if kind:
+                    ctx.time_by_kind[kind] += time.perf_counter() - started
+
+
+async def _element(ctx, target):
+    if "=" in target:
+        return ctx.frame.locator(target).nth(0)
+    return await selector_map.require(ctx.frame, target)
+
+
+# -- actions ------------------------------------------------------------------
+
+@step("click")
+async def click(ctx, target, wait_for=None):
+    """Click ``target``; with ``wait_for``, also wait for requests to that URL to finish."""
+    elem = await _element(ctx, target)
+    if wait_for:
+        async with readiness.network_idle(ctx.page, wait_for):
+            await readiness.ready(elem)
+            await elem.click(timeout=5000)
+    else:
+        await readiness.ready(elem)
+        await elem.click(timeout=5000)
+
+
+@step("fill")
+async def fill(ctx, target, value=""):
+    elem = await _element(ctx, target)
+    await readiness.ready(elem)
+    await elem.fill(value)
+
+
+@step("wheel")
+async def wheel(ctx, delta_y):
+    await ctx.page.mouse.wheel(0, delta_y)
+
+
+@step("settle")
+async def settle(ctx, _):
+    await readiness.settle(ctx.page)
+
+
+@step("goto", kind="navigation")
+async def goto(ctx, path):
+    """Load ``path`` on the site; cases with perf on keep the monitor running."""
+    query = perf_collector.PERF_QUERY if ctx.perf and path == "/" else ""
+    await ctx.page.goto(harness.BASE_URL + path + query, timeout=10000)
+    if ctx.perf and query:
+        await perf_collector.enable(ctx.page)
+    await readiness.settle(ctx.page)
+
+
+@step("measure")
+async def measure(ctx, label, run=()):
+    """Run the nested ``run`` steps inside ``perf_collector.measure(label)``."""
+    async with perf_collector.measure(ctx.page, label):
+        await run_ops(ctx, run)
+
+
+@step("pointer_sweep")
+async def pointer_sweep(ctx, rows, steps=30):
+    """Move the pointer across the viewport once per row (a fraction of its height)."""
+    viewport = ctx.page.viewport_size or {"width": 1280, "height": 720}
+    for y in rows:
+        await ctx.page.mouse.move(0, viewport["height"] * y)
+        await ctx.page.mouse.move(viewport["width"], viewport["height"] * y, steps=steps)
+
+
+@step("dock_sweep")
+async def dock_sweep(ctx, sweeps, steps=40):
+    """Sweep the pointer back and forth across the dock and check its frame time.
+
+    Magnification is one pass per frame over cached item centres, so frames
+    stay short.
+    """
+    page = ctx.page
+    dock = await selector_map.require(page, "dock")
+    await readiness.settle(page)
+    box = await dock.bounding_box()
+    left, right = box["x"] + 4, box["x"] + box["width"] - 4
+    middle = box["y"] + box["height"] / 2
+    async with perf_collector.measure(page, "dock hover") as hover:
+        for _ in range(sweeps):
+            await page.mouse.move(left, middle)
+            await page.mouse.move(right, middle, steps=steps)
+            await page.mouse.move(left, middle, steps=steps)
+        await readiness.settle(page)
+    perf_collector.check_frame_time(hover, "dock hover", work_label="dock")
+
+
+@step("bento_sweep")
+async def bento_sweep(ctx, sweeps, grid="about", cards=6, pause_ms=150):
+    """Hover every card of one bento ``grid`` ``sweeps`` times; the DOM must stop growing.
+
+    Particles come from a shared pool, so however long the hover lasts the
+    page gains at most the pool's worth of nodes plus one ripple per card.
+    """
+    page = ctx.page
+    card = await selector_map.require(page, f"{grid}.card[0]")
+    await card.scroll_into_view_if_needed(timeout=5000)
+    await readiness.settle(page)
+    baseline = (await perf_collector.collect(page))["domNodes"]
+    async with perf_collector.measure(page, "sustained bento hover") as sustained:
+        for _ in range(sweeps):
+            for index in range(cards):
+                await selector_map.locate(page, f"{grid}.card[{index}]").hover(timeout=5000)
+                await readiness.pause(page, pause_ms)
+        await readiness.settle(page)
+    growth = sustained["domNodes"] - baseline
+    limit = PARTICLE_POOL_SIZE + cards
+    assert growth <= limit, f"DOM grew by {growth} nodes during bento hover (limit {limit})"
+
+
+# -- assertions ---------------------------------------------------------------
+
+@step("expect_download", kind="assertion")
+async def expect_download(ctx, target, filename=None):
+    """Clicking ``target`` downloads a PDF, named ``filename`` when given."""
+    elem = await _element(ctx, target)
+    await readiness.ready(elem)
+    async with ctx.page.expect_download(timeout=5000) as info:
+        await elem.click(timeout=5000)
+    download = await info.value
+    if filename:
+        assert download.suggested_filename == filename, (
+            f"{target} downloaded {download.suggested_filename!r}, expected {filename!r}"
+        )
+    with open(await download.path(), "rb") as file:
+        assert file.read(5) == b"%PDF-", f"{target} downloaded {download.suggested_filename!r}, which is not a PDF"
+
+
+@step("expect_texts", kind="assertion")
+async def expect_texts(ctx, texts, projects=None, filters=False):
+    """All ``texts`` are visible; ``projects`` adds every card text of that filter
+    view and ``filters`` every filter button label, both from the catalog."""
+    if projects is not None:
+        texts = [*texts, *(text for project in project_catalog.view(projects)
+                           for text in project_catalog.card_texts(project))]
+    if filters:
+        texts = [*texts, *project_catalog.categories()]
+    await assertions.expect_texts_visible(ctx.frame, texts)
+
+
+@step("expect", kind="assertion")
+async def expect_element(ctx, target, text=None, attribute=None, message=None, timeout=1000):
+    """``target`` is visible (or has ``attribute`` values and contains ``text``)."""
+    locator = ctx.frame.locator(target).first if "=" in target else selector_map.locate(ctx.frame, target)
+    try:
+        if attribute:
+            for name, value in attribute.items():
+                await expect(locator).to_have_attribute(name, value, timeout=timeout)
+        else:
+            await expect(locator).to_be_visible(timeout=timeout)
+        if text:
+            await expect(locator).to_contain_text(text)
+    except AssertionError:
+        if message is None:
+            raise
+        raise AssertionError(message)
+
+
+@step("expect_featured_card", kind="assertion")
+async def expect_featured_card(ctx, position):
+    """``project.card[n]`` shows the n-th featured project and links to its source."""
+    project = project_catalog.featured()[position]
+    await assertions.expect_texts_visible(ctx.page, project_catalog.card_texts(project))
+    name = f"project.card[{position}].source"
+    href = await selector_map.locate(ctx.page, name).get_attribute("href")
+    assert href == project["githubUrl"], f"{name} links to {href!r}, catalog says {project['githubUrl']!r}"
+
+
+@step("expect_emails", kind="assertion")
+async def expect_emails(ctx, filters):
+    """When the runner started the email stand-in, each filter matched a delivered email."""
+    stub = email_stub.current()
+    if stub:
+        for match in filters:
+            await asyncio.to_thread(stub.wait_for, 1, **match)
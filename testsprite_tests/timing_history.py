@@ -0,0 +1,149 @@
+"""Timing history of suite runs, and a report of what got slower.
+
+Every ``runner.py`` run appends one line to ``tmp/timing_history.jsonl``:
+browser launch and warm-up time, total wall time, and for each test case its
+wall time, setup, navigation and assertion time, and the wall time and
+outcome of every executed plan step. Lines are only ever appended.
+
+The report compares each test, and each of its steps, over the most recent
+runs against the runs before them:
+
+    python testsprite_tests/timing_history.py                  # last 3 runs vs the 10 before
+    python testsprite_tests/timing_history.py --recent 1 --last 20 --tolerance 0.5
+
+A test or step is flagged when its p50 or p95 over the recent runs exceeds
+the baseline's by more than ``--tolerance`` (a fraction) and ``--min-delta``
+seconds. Only passing samples are compared, so one timeout does not read as
+a regression; the slowest steps of the latest run, including ones cut short,
+are listed to show where the time went. The report is saved as
+``tmp/timing_report.json`` and the exit status is 1 when anything regressed.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from stats import percentile
+
+RESULTS_DIR = Path(__file__).resolve().parent / "tmp"
+HISTORY = RESULTS_DIR / "timing_history.jsonl"
+REPORT_PATH = RESULTS_DIR / "timing_report.json"
+
+
+def append_run(results, suite):
+    """Append one run to the history: ``suite`` timings plus each runner result."""
+    tests = []
+    for result in results:
+        setup = result.get("setup") or {}
+        timing = result.get("timing") or {}
+        tests.append({
+            "id": result["id"],
+            "status": result["status"],
+            "wall_s": result["duration_s"],
+            "setup_s": setup.get("setup_s"),
+            "page_load_s": setup.get("page_load_s"),
+            # The test's own page load plus every goto step
+            "navigation_s": round((setup.get("page_load_s") or 0) + timing.get("navigation_s", 0), 3),
+            "assertion_s": timing.get("assertion_s"),
+            "steps": [
+                {key: entry[key] for key in ("step", "type", "duration_s", "status")}
+                for entry in timing.get("steps", [])
+            ],
+        })
+    run = {"run_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **suite, "tests": tests}
+    RESULTS_DIR.mkdir(exist_ok=True)
+    with HISTORY.open("a", encoding="utf-8") as history:
+        history.write(json.dumps(run) + "\n")
+    return run
+
+
+def load_history(path=HISTORY):
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+def series(runs):
+    """Passing durations per key, oldest first: ``"TC001"`` and ``"TC001 step 4"``."""
+    samples = {}
+    for run in runs:
+        for test in run["tests"]:
+            if test["status"] == "PASSED":
+                samples.setdefault(test["id"], []).append(test["wall_s"])
+            for entry in test["steps"]:
+                if entry["status"] == "passed":
+                    samples.setdefault(f"{test['id']} step {entry['step']}", []).append(entry["duration_s"])
+    return samples
+
+
+def regressions(runs, recent, last, tolerance, min_delta):
+    """Keys whose recent p50 or p95 exceeds the baseline's by both limits."""
+    recent_samples = series(runs[-recent:])
+    baseline_samples = series(runs[-(recent + last):-recent])
+    found = []
+    for key, values in recent_samples.items():
+        baseline = baseline_samples.get(key)
+        if not baseline:
+            continue
+        for pct in (50, 95):
+            now, before = percentile(values, pct), percentile(baseline, pct)
+            if now - before > min_delta and now > before * (1 + tolerance):
+                found.append({"key": key, "metric": f"p{pct}", "recent_s": now, "baseline_s": before,
+                              "recent_runs": len(values), "baseline_runs": len(baseline)})
+    return sorted(found, key=lambda item: item["recent_s"] - item["baseline_s"], reverse=True)
+
+
+def slowest_steps(run, top):
+    steps = [dict(entry, id=test["id"]) for test in run["tests"] for entry in test["steps"]]
+    return sorted(steps, key=lambda entry: entry["duration_s"], reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--recent", type=int, default=3, help="runs to judge (default: 3)")
+    parser.add_argument("--last", type=int, default=10, help="earlier runs to compare against (default: 10)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown as a fraction of the baseline (default: 0.25)")
+    parser.add_argument("--min-delta", type=float, default=0.5,
+                        help="ignore slowdowns smaller than this many seconds (default: 0.5)")
+    parser.add_argument("--top", type=int, default=5, help="slowest steps of the latest run to list (default: 5)")
+    parser.add_argument("--history", type=Path, default=HISTORY)
+    args = parser.parse_args(argv)
+
+    runs = load_history(args.history)
+    if not runs:
+        print(f"No runs recorded in {args.history}; run testsprite_tests/runner.py first")
+        return 0
+
+    recent = max(1, args.recent)
+    latest = runs[-1]
+    report = {
+        "runs": len(runs),
+        "recent": recent,
+        "last": args.last,
+        "latest": {key: latest.get(key) for key in ("run_at", "browser_launch_s", "warmup_s", "wall_s")},
+        "slowest_steps": slowest_steps(latest, args.top),
+        "regressions": regressions(runs, recent, max(1, args.last), args.tolerance, args.min_delta)
+        if len(runs) > recent else [],
+    }
+    RESULTS_DIR.mkdir(exist_ok=True)
+    REPORT_PATH.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    warmup = f"{latest['warmup_s']}s" if latest.get("warmup_s") is not None else "none"
+    print(f"Latest run {latest['run_at']}: {latest.get('wall_s')}s wall, "
+          f"browser launch {latest.get('browser_launch_s')}s, warm-up {warmup}")
+    print("Slowest steps:")
+    for entry in report["slowest_steps"]:
+        print(f"  {entry['id']} step {entry['step']:<3} {entry['duration_s']:>8.2f}s  {entry['status']}")
+    if len(runs) <= recent:
+        print(f"Only {len(runs)} run(s) recorded; need more than {recent} to compare")
+    for item in report["regressions"]:
+        print(f"REGRESSION: {item['key']} {item['metric']} {item['baseline_s']:.2f}s -> {item['recent_s']:.2f}s "
+              f"({item['recent_runs']} recent vs {item['baseline_runs']} earlier runs)")
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())